@@ -0,0 +1,31 @@
+"""
+Benchmarks of graph initialization and import.
+
+"""
+
+import difpy as dp
+import numpy as np
+
+from .common import SIZES
+
+
+class GraphInit:
+
+    params = SIZES
+    param_names = ['nodes']
+    timeout = 600
+
+    def setup(self, n):
+        np.random.seed(0)
+
+    def time_graph_init(self, n):
+        dp.graph_init(n = n, show_attr = False, draw_graph = False)
+
+    def peakmem_graph_init(self, n):
+        dp.graph_init(n = n, show_attr = False, draw_graph = False)
+
+
+class Import:
+
+    def timeraw_import_difpy(self):
+        return "import difpy"
@@ -0,0 +1,68 @@
+"""
+Benchmarks of seeding optimization and nodes' scoring.
+
+"""
+
+import difpy as dp
+
+from .common import SIZES, graph, reset, skip_above
+
+
+class OptimizeRS:
+
+    params = SIZES
+    param_names = ['nodes']
+    number = 1
+    timeout = 600
+
+    def setup(self, n):
+        skip_above(n, 10**4)
+        self.G = graph(n)
+        reset(self.G)
+
+    def time_optimize_rs(self, n):
+        dp.optimize_rs(self.G, number_of_nodes = 2, number_of_iter = 5,
+                       sequence_len = 2)
+
+    def peakmem_optimize_rs(self, n):
+        dp.optimize_rs(self.G, number_of_nodes = 2, number_of_iter = 5,
+                       sequence_len = 2)
+
+
+class OptimizeCentrality:
+
+    params = SIZES
+    param_names = ['nodes']
+    timeout = 600
+
+    def setup(self, n):
+        # closeness centrality computes shortest paths from every node
+        skip_above(n, 10**4)
+        self.G = graph(n)
+
+    def time_optimize_centrality(self, n):
+        dp.optimize_centrality(self.G, number_of_nodes = 5)
+
+    def peakmem_optimize_centrality(self, n):
+        dp.optimize_centrality(self.G, number_of_nodes = 5)
+
+
+class NodesScore:
+
+    params = (SIZES, ['simulation', 'batched', 'sketch'])
+    param_names = ['nodes', 'method']
+    number = 1
+    timeout = 600
+
+    def setup(self, n, method):
+        # simulation methods run sequence_len simulations for each node
+        skip_above(n, {'simulation': 10**3, 'batched': 10**4,
+                       'sketch': 10**6}[method])
+        self.G = graph(n)
+        reset(self.G)
+
+    def time_nodes_score_simulation(self, n, method):
+        dp.nodes_score_simulation(self.G, sequence_len = 1, method = method)
+
+    def peakmem_nodes_score_simulation(self, n, method):
+        dp.nodes_score_simulation(self.G, sequence_len = 1, method = method)
@@ -0,0 +1,93 @@
+"""
+Benchmarks of simulation functions and engines.
+
+"""
+
+import difpy as dp
+import numpy as np
+
+from .common import SIZES, graph, reset, skip_above
+
+
+class SimulationStep:
+
+    params = (SIZES, ['weights', 'WERE'], [False, True])
+    param_names = ['nodes', 'kernel', 'oblivion']
+    number = 1
+    timeout = 600
+
+    def setup(self, n, kernel, oblivion):
+        # oblivion in simulation_step grows faster than linearly
+        skip_above(n, 10**4 if oblivion == True else 10**6)
+        self.G = graph(n)
+        reset(self.G)
+
+    def time_simulation_step(self, n, kernel, oblivion):
+        dp.simulation_step(self.G, kernel = kernel, oblivion = oblivion)
+
+    def peakmem_simulation_step(self, n, kernel, oblivion):
+        dp.simulation_step(self.G, kernel = kernel, oblivion = oblivion)
+
+
+class Simulation:
+
+    params = SIZES
+    param_names = ['nodes']
+    number = 1
+    timeout = 600
+
+    def setup(self, n):
+        skip_above(n, 10**5)
+        self.G = graph(n)
+        reset(self.G)
+
+    def time_simulation(self, n):
+        dp.simulation(self.G, n = 5)
+
+    def peakmem_simulation(self, n):
+        dp.simulation(self.G, n = 5)
+
+
+class SimulationSequence:
+
+    params = SIZES
+    param_names = ['nodes']
+    number = 1
+    timeout = 600
+
+    def setup(self, n):
+        skip_above(n, 10**4)
+        self.G = graph(n)
+        reset(self.G)
+
+    def time_simulation_sequence(self, n):
+        dp.simulation_sequence(self.G, n = 5, sequence_len = 10)
+
+    def peakmem_simulation_sequence(self, n):
+        dp.simulation_sequence(self.G, n = 5, sequence_len = 10)
+
+
+class Engines:
+
+    """ Compiled engines, as baseline for simulation_sequence. """
+
+    params = (SIZES, ['batch', 'event'])
+    param_names = ['nodes', 'engine']
+    timeout = 600
+
+    def setup(self, n, engine):
+        self.CG = dp.compile_graph(graph(n))
+        self.S = np.tile(self.CG['aware'], (10, 1))
+        np.random.seed(0)
+
+    def run(self, engine):
+        if engine == 'batch':
+            dp.simulation_batch(self.CG, self.S, n = 5)
+        else:
+            dp.event_simulation(self.CG, n = 5, S = self.S)
+
+    def time_engine(self, n, engine):
+        self.run(engine)
+
+    def peakmem_engine(self, n, engine):
+        self.run(engine)
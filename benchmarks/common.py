@@ -0,0 +1,75 @@
+"""
+Created on Mon Oct 19 03:30:12 2026
+
+
+    Module with shared objects of difpy benchmarks.
+
+    Graphs are created with graph_init function once per benchmark
+    process and reused between repeats. Functions changing states of
+    nodes are timed with number = 1 after states are restored in setup.
+    Benchmarks of functions too slow for a size raise NotImplementedError
+    in setup, which asv reports as skipped.
+
+
+    Objects
+    ----------
+    SIZES : list
+        Numbers of nodes of benchmark graphs.
+
+
+    graph : function
+        A function returns benchmark graph of given size.
+
+
+    reset : function
+        A function restores initial attributes of nodes.
+
+
+    skip_above : function
+        A function skips benchmark for sizes over limit.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+
+_graphs = {}
+
+
+def graph(n, seed = 0):
+
+    """ Return graph from graph_init function with n nodes and its
+    initial nodes' attributes. Graph is created once per process.
+
+    """
+
+    if n not in _graphs:
+        np.random.seed(seed)
+        G, pos = dp.graph_init(n = n, show_attr = False, draw_graph = False)
+        columns = {k: np.array([d[k] for v, d in G.nodes(data = True)],
+                               dtype = object if k == 'state' else float)
+                   for k in ('state', 'engagement')}
+        _graphs[n] = (G, columns)
+
+    return _graphs[n][0]
+
+
+def reset(G):
+
+    """ Restore states and engagement of nodes changed by simulations. """
+
+    dp.initialize._set_node_columns(G, _graphs[G.number_of_nodes()][1])
+    np.random.seed(0)
+
+
+def skip_above(n, limit):
+
+    """ Skip benchmark when graph has more nodes than limit. """
+
+    if n > limit:
+        raise NotImplementedError("Benchmark is too slow for "
+                                  + str(n) + " nodes.")
@@ -12,4 +12,23 @@ name = "difpy"
 from difpy.initialize import *
 from difpy.simulate import *
 from difpy.optimize import *
-from difpy.feature_importance import * 
\ No newline at end of file
+from difpy.feature_importance import * 
+from difpy.progress import *
+from difpy.compiled import *
+from difpy.engine import *
+from difpy.sketch import *
+from difpy.parallel import *
+from difpy.cache import *
+from difpy.incremental import *
+from difpy.generators import *
+from difpy.animate import *
+from difpy.storage import *
+from difpy.ingest import *
+from difpy.trajectory import *
+from difpy.dynamic import *
+from difpy.temporal import *
+from difpy.contagion import *
+from difpy.models import *
+from difpy.events import *
+from difpy.instrument import *
+from difpy.streaming import *
@@ -0,0 +1,302 @@
+"""
+Created on Sun Oct 18 21:24:06 2026
+
+
+    Module enables export of information diffusion animations in Difpy
+    package.
+
+    Animation is rendered from recorded trajectory of nodes' states.
+    Figure with edges and nodes is created once, and in each frame only
+    colors of nodes (or of grid cells with fraction of aware nodes for
+    large graphs) are changed, so cost of a frame does not depend on
+    number of edges. Frames are rendered in a pool of processes (each
+    process renders a range of frames on its own figure) and written
+    in order to GIF file (with Pillow) or MP4 file (with ffmpeg).
+
+
+    Objects
+    ----------
+    trajectory_states : function
+        A function converts recorded trajectory to bool ndarray
+        of aware nodes in each step.
+
+
+    animate_diffusion : function
+        A function exports animation of information diffusion.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+
+#=============================================================================#
+# Function for trajectory states #
+#================================#
+
+def trajectory_states(trajectory):
+
+    """ Convert recorded trajectory to bool ndarray of aware nodes.
+
+
+    Parameters
+    ----------
+
+    trajectory : list, TrajectoryStore or ndarray
+        Graph_list returned by simulation function (list of steps with
+        lists of (node, attributes) pairs), trajectory store, or ndarray
+        in shape (<number of steps>, <number of nodes>) with True for
+        aware nodes.
+
+
+    Returns
+    -------
+    states : ndarray
+        Bool ndarray in shape (<number of steps>, <number of nodes>).
+
+    """
+
+    if isinstance(trajectory, np.ndarray):
+        return np.asarray(trajectory, dtype = bool)
+
+    if isinstance(trajectory, dp.TrajectoryStore):
+        return trajectory.states()
+
+    return np.array([[d['state'] == 'aware' for i, d in step]
+                     for step in trajectory], dtype = bool)
+
+
+
+#=============================================================================#
+# Function executed in worker processes #
+#=======================================#
+
+def _render_frames(xy, segments, states, colors, size, density, dpi, 
+                   figsize):
+
+    """ Render frames for (step, aware nodes) pairs in states, return 
+    ndarray in shape (<number of frames>, <height>, <width>, 3).
+
+    Figure is drawn on Agg canvas without pyplot, so backend of the
+    calling process is not changed. Static part of the figure is drawn
+    once, in each frame only nodes and title are drawn on it (blitting).
+
+    """
+
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import ListedColormap
+
+    N = len(xy)
+    fig = Figure(figsize = figsize, dpi = dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.add_collection(LineCollection(segments, colors = 'k',
+                                     linewidths = 1.0 if N <= 1000 else 0.1,
+                                     alpha = 1.0 if N <= 1000 else 0.2,
+                                     zorder = 1))
+    ax.set_xticks([])
+    ax.set_yticks([])
+    title = ax.set_title("")
+
+    if density == True:
+        # Cell of regular grid for each node, as in draw_graph function
+        bins = 200
+        extent = [xy[:, 0].min(), xy[:, 0].max(), 
+                  xy[:, 1].min(), xy[:, 1].max()]
+        column = np.clip(((xy[:, 0] - extent[0]) / (extent[1] - extent[0]
+                          + 1e-12) * bins).astype(np.int64), 0, bins - 1)
+        row = np.clip(((xy[:, 1] - extent[2]) / (extent[3] - extent[2]
+                       + 1e-12) * bins).astype(np.int64), 0, bins - 1)
+        cell = row * bins + column
+        counts = np.bincount(cell, minlength = bins * bins)
+        image = ax.imshow(np.zeros((bins, bins)), origin = 'lower',
+                          extent = extent, aspect = 'auto', 
+                          interpolation = 'nearest', vmin = 0, vmax = 1,
+                          cmap = ListedColormap(np.linspace(colors[0], 
+                                                            colors[1], 
+                                                            256)),
+                          zorder = 2, animated = True)
+        nodes = image
+    else:
+        nodes = ax.scatter(xy[:, 0], xy[:, 1], s = size, alpha = 0.7,
+                           zorder = 2, animated = True)
+    title.set_animated(True)
+
+    # Edges and axes are drawn once and restored in each frame
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+
+    frames = []
+    for step, aware in states:
+        # Only colors of nodes and title are updated
+        if density == True:
+            fraction = np.full(bins * bins, np.nan)
+            np.divide(np.bincount(cell, weights = aware, 
+                                  minlength = bins * bins), counts, 
+                      out = fraction, where = counts > 0)
+            nodes.set_data(fraction.reshape(bins, bins))
+        else:
+            nodes.set_facecolor(colors[aware.astype(np.int64)])
+        title.set_text("Step " + str(step))
+        fig.canvas.restore_region(background)
+        ax.draw_artist(nodes)
+        fig.draw_artist(title)
+        frames.append(np.asarray(fig.canvas.buffer_rgba())[:, :, :3].copy())
+
+    return np.stack(frames)
+
+
+
+#=============================================================================#
+# animate_diffusion function #
+#============================#
+
+def animate_diffusion(G, # graph
+                      trajectory, # recorded states of nodes
+                      path, # output file
+                      pos = None, # position of nodes
+                      fps = 5, # frames per second
+                      aware_color = '#f63f89',
+                      not_aware_color = '#58f258',
+                      max_nodes = 20000, # nodes drawn one by one
+                      max_edges = 20000, # edges drawn
+                      dpi = 100,
+                      figsize = (6.4, 4.8),
+                      n_jobs = 1): # number of processes
+
+    """ Export animation of information diffusion to GIF or MP4 file.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph or compiled graph.
+
+    trajectory : list or ndarray
+        Recorded states of nodes, as accepted by trajectory_states
+        function. Each step is one frame.
+
+    path : string
+        Path of output file, with .gif or .mp4 extension. MP4 files
+        need ffmpeg program.
+
+    pos : dictionary with 2 element ndarrays as values, optional
+        Positions of nodes, as in draw_graph function.
+
+    fps : integer, optional
+        Number of frames per second.
+
+    aware_color : string
+        Specify the color of nodes aware of certain information.
+
+    not_aware_color : string
+        Specify the color of nodes unaware of certain information.
+
+    max_nodes : integer, optional
+        Maximal number of nodes drawn one by one. Fraction of aware 
+        nodes on regular grid is drawn for larger graphs.
+
+    max_edges : integer, optional
+        Maximal number of drawn edges, other edges are skipped.
+
+    dpi : integer, optional
+        Resolution of frames in dots per inch.
+
+    figsize : tuple, optional
+        Size of frames in inches.
+
+    n_jobs : integer, optional
+        Number of processes rendering frames.
+
+
+    Returns
+    -------
+    path : string
+        Path of written file.
+
+    """
+
+    from matplotlib.colors import to_rgba
+
+    fmt = path.rsplit('.', 1)[-1].lower()
+    if fmt not in ('gif', 'mp4'):
+        raise ValueError("Format '" + fmt + "' is not supported, "
+                         "use 'gif' or 'mp4'.")
+    if fmt == 'mp4' and shutil.which('ffmpeg') is None:
+        raise RuntimeError("ffmpeg program is needed to write MP4 files.")
+
+    states = trajectory_states(trajectory)
+    nodes, xy, aware, src, dst = dp.initialize._drawing_arrays(G, pos)
+    N = len(xy)
+
+    if len(src) > max_edges:
+        chosen = np.random.default_rng(0).choice(len(src), max_edges,
+                                                 replace = False)
+        src, dst = src[chosen], dst[chosen]
+    segments = np.stack([xy[src], xy[dst]], axis = 1)
+
+    colors = np.array([to_rgba(not_aware_color), to_rgba(aware_color)])
+    size = 300 if N <= 1000 else max(1, 300000 / N)
+
+    #======================================#
+    # Render ranges of frames in processes #
+    #======================================#
+
+    # Ranges of at most 50 frames, so frames are written as they come
+    n_jobs = max(1, min(n_jobs or 1, len(states)))
+    n_chunks = max(n_jobs, int(np.ceil(len(states) / 50)))
+    bounds = np.linspace(0, len(states), n_chunks + 1).astype(np.int64)
+    chunks = [(xy, segments,
+               list(zip(range(first, last), states[first:last])),
+               colors, size, N > max_nodes, dpi, figsize)
+              for first, last in zip(bounds[:-1], bounds[1:])
+              if last > first]
+
+    writer = None
+    images = []
+    executor = ProcessPoolExecutor(max_workers = n_jobs) if n_jobs > 1 \
+               else None
+    try:
+        if executor is not None:
+            results = executor.map(_render_frames, *zip(*chunks))
+        else:
+            results = (_render_frames(*chunk) for chunk in chunks)
+
+        # Frames are written in order as ranges are finished
+        for frames in results:
+            if fmt == 'gif':
+                from PIL import Image
+                images.extend(Image.fromarray(frame).quantize()
+                              for frame in frames)
+                continue
+
+            if writer is None:
+                height, width = frames.shape[1:3]
+                writer = subprocess.Popen(
+                    ['ffmpeg', '-y', '-loglevel', 'error', 
+                     '-f', 'rawvideo', '-pix_fmt', 'rgb24', 
+                     '-s', str(width) + 'x' + str(height),
+                     '-r', str(fps), '-i', '-', '-pix_fmt', 'yuv420p',
+                     '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', path],
+                    stdin = subprocess.PIPE)
+            writer.stdin.write(frames.tobytes())
+
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if writer is not None:
+            writer.stdin.close()
+            writer.wait()
+
+    if fmt == 'gif':
+        images[0].save(path, save_all = True, append_images = images[1:],
+                       duration = int(1000 / fps), loop = 0)
+
+    return path
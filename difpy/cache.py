@@ -0,0 +1,225 @@
+"""
+Created on Sun Oct 18 13:05:31 2026
+
+
+    Module enables on-disk caching of nodes' scores in Difpy package.
+
+    Nodes' scores depend only on the graph and simulation parameters,
+    so they may be reused between modelling runs with different
+    features or models. Scores are stored in a cache directory under
+    a key computed from graph fingerprint (hash of structure, weights
+    and nodes' attributes) and simulation parameters. Each entry
+    consists of .npy file with scores and .json file with summary.
+
+
+    Objects
+    ----------
+    graph_fingerprint : function
+        A function computes hash of graph structure and attributes.
+
+
+    scores_cache_key : function
+        A function computes cache key for graph and parameters.
+
+
+    load_scores : function
+        A function loads nodes' scores from cache directory.
+
+
+    save_scores : function
+        A function saves nodes' scores in cache directory.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+import hashlib
+import json
+import os
+import time
+
+
+#=============================================================================#
+# Function for graph fingerprint #
+#================================#
+
+def graph_fingerprint(G, include_state = False):
+
+    """ Compute hash of graph structure and attributes.
+
+    Graphs with the same nodes, edges, weights and numeric nodes'
+    attributes get the same fingerprint.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph.
+
+    include_state : bool, optional
+        Include nodes' states in fingerprint. States are not needed
+        for nodes' scores, because all states are reset for each node.
+
+
+    Returns
+    -------
+    fingerprint : string
+        Hexadecimal sha256 digest.
+
+    """
+
+    CG = dp.compile_graph(G)
+    digest = hashlib.sha256()
+
+    # Nodes' names as text, other arrays as raw bytes
+    digest.update(json.dumps(np.asarray(CG['nodes']).tolist(),
+                             default = str).encode())
+    digest.update(str(bool(CG['directed'])).encode())
+
+    for key in ['indptr', 'indices', 'weight']:
+        array = np.ascontiguousarray(CG[key])
+        digest.update(key.encode())
+        digest.update(array.dtype.str.encode())
+        digest.update(array.tobytes())
+
+    for key in sorted(CG['node_attrs'].keys()):
+        array = np.ascontiguousarray(CG['node_attrs'][key])
+        digest.update(key.encode())
+        digest.update(array.dtype.str.encode())
+        digest.update(array.tobytes())
+
+    if include_state == True:
+        digest.update(np.ascontiguousarray(CG['aware']).tobytes())
+
+    return digest.hexdigest()
+
+
+
+#=============================================================================#
+# Function for cache key #
+#========================#
+
+def scores_cache_key(G, params):
+
+    """ Compute cache key for graph and simulation parameters.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph.
+
+    params : dictionary
+        Simulation parameters with JSON serializable values.
+
+
+    Returns
+    -------
+    key : string
+        Hexadecimal sha256 digest.
+
+    """
+
+    digest = hashlib.sha256()
+    digest.update(graph_fingerprint(G).encode())
+    digest.update(json.dumps(params, sort_keys = True).encode())
+
+    return digest.hexdigest()
+
+
+
+#=============================================================================#
+# Function for loading scores #
+#=============================#
+
+def load_scores(cache_dir, key):
+
+    """ Load nodes' scores from cache directory.
+
+
+    Parameters
+    ----------
+
+    cache_dir : string
+        Path of cache directory.
+
+    key : string
+        Cache key computed with scores_cache_key function.
+
+
+    Returns
+    -------
+    list_solution : list or None
+        List with nodes' scores, or None if there is no entry for key.
+
+    """
+
+    path = os.path.join(cache_dir, key + '.npy')
+    if not os.path.exists(path):
+        return None
+
+    return np.load(path).tolist()
+
+
+
+#=============================================================================#
+# Function for saving scores #
+#============================#
+
+def save_scores(cache_dir, key, list_solution, params = None,
+                elapsed = None):
+
+    """ Save nodes' scores and summary in cache directory.
+
+
+    Parameters
+    ----------
+
+    cache_dir : string
+        Path of cache directory. It is created if it does not exist.
+
+    key : string
+        Cache key computed with scores_cache_key function.
+
+    list_solution : list
+        List with nodes' scores.
+
+    params : dictionary, optional
+        Simulation parameters saved in summary.
+
+    elapsed : float, optional
+        Time of scores computation saved in summary.
+
+
+    Returns
+    -------
+    summary : dictionary
+        A dictionary with summary of saved scores.
+
+    """
+
+    os.makedirs(cache_dir, exist_ok = True)
+    scores = np.asarray(list_solution, dtype = np.float64)
+
+    summary = {'key': key,
+               'params': params,
+               'nodes': len(scores),
+               'mean score': float(scores.mean()) if len(scores) else None,
+               'min score': float(scores.min()) if len(scores) else None,
+               'max score': float(scores.max()) if len(scores) else None,
+               'elapsed': elapsed,
+               'created': time.strftime('%Y-%m-%d %H:%M:%S')}
+
+    # Write to temporary files first, so readers never see partial files
+    path = os.path.join(cache_dir, key)
+    with open(path + '.npy.tmp', 'wb') as f:
+        np.save(f, scores)
+    with open(path + '.json.tmp', 'w') as f:
+        json.dump(summary, f, indent = 2)
+    os.replace(path + '.json.tmp', path + '.json')
+    os.replace(path + '.npy.tmp', path + '.npy')
+
+    return summary
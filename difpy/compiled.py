@@ -0,0 +1,321 @@
+"""
+Created on Sun Oct 18 10:03:17 2026
+
+
+    Module enables conversion of NetworkX graphs to compiled graphs
+    used by fast, vectorized functions in Difpy package.
+
+    Compiled graph is a dictionary with graph structure stored in CSR
+    (compressed sparse row) arrays and nodes attributes stored as
+    columns:
+
+        * nodes - ndarray with nodes' names in the order of G.nodes()
+        * indptr - ndarray with offsets of neighbours of each node
+        * indices - ndarray with neighbours' numbers, sorted in each row
+        * weight - ndarray with weight of each (node, neighbour) pair
+        * aware - bool ndarray, True for nodes in 'aware' state
+        * node_attrs - dictionary of ndarrays with numeric nodes
+          attributes (receptiveness, extraversion, engagement, custom)
+        * directed - bool, True if CSR rows store successors of a node
+          in a directed graph
+
+    Undirected edges are stored twice, once in the row of each endpoint.
+
+
+    Objects
+    ----------
+    compile_graph : function
+        A function converts NetworkX graph to compiled graph.
+
+
+    to_networkx : function
+        A function converts compiled graph to NetworkX graph.
+
+
+"""
+
+import networkx as nx
+import numpy as np
+
+
+#=============================================================================#
+# Function for merging duplicated edges #
+#=======================================#
+
+def _merge_edges(key, weight, aggregate = 'last'):
+
+    """ Sort edges by key (row * N + column) and merge duplicated edges.
+
+    Returns sorted unique keys and merged weights. Aggregate levels are
+    the same as in _csr_from_edges function.
+
+    """
+
+    order = np.argsort(key, kind = 'stable')
+    key, weight = key[order], weight[order]
+
+    first = np.ones(len(key), dtype = bool)
+    first[1:] = key[1:] != key[:-1]
+    starts = np.flatnonzero(first)
+
+    if aggregate == 'sum':
+        weight = np.add.reduceat(weight, starts) if len(key) else weight
+    elif aggregate == 'max':
+        weight = np.maximum.reduceat(weight, starts) if len(key) else weight
+    elif aggregate == 'mean':
+        if len(key):
+            weight = np.add.reduceat(weight, starts) \
+                     / np.diff(np.append(starts, len(key)))
+    else:
+        # Last occurrence of duplicated edge wins
+        if len(key):
+            weight = weight[np.append(starts[1:], len(key)) - 1]
+
+    return key[starts], weight
+
+
+
+#=============================================================================#
+# Function for nodes' names array #
+#=================================#
+
+def _node_array(nodes):
+
+    """ Return 1-D ndarray with nodes' names.
+
+    Names of one number or string type are stored in typed ndarray,
+    other names (e.g. tuples or mixed types) in object ndarray, so they
+    are not converted to rows or strings.
+
+    """
+
+    nodes = list(nodes)
+    types = set(type(v) for v in nodes)
+    if len(types) == 1 and issubclass(types.pop(), (int, float, str,
+                                                    np.generic)):
+        return np.asarray(nodes)
+
+    array = np.empty(len(nodes), dtype = object)
+    for i, v in enumerate(nodes):
+        array[i] = v
+
+    return array
+
+
+
+#=============================================================================#
+# Function for building CSR arrays #
+#==================================#
+
+def _csr_from_edges(N, src, dst, weight, symmetric = True,
+                    aggregate = 'last'):
+
+    """ Build CSR arrays from edge list arrays.
+
+    Self loops are dropped and duplicated edges are merged.
+
+    Parameters
+    ----------
+
+    N : integer
+        Number of nodes.
+
+    src, dst : ndarray
+        Integer ndarrays with numbers of edges' endpoints.
+
+    weight : ndarray
+        Ndarray with edges' weights.
+
+    symmetric : bool, optional
+        Store each edge in rows of both endpoints (undirected graph).
+
+    aggregate : string, optional
+        Levels: "last", "sum", "max", "mean"
+        Method of merging weights of duplicated edges.
+
+
+    Returns
+    -------
+    indptr, indices, weight : ndarray
+        CSR arrays.
+
+    """
+
+    src = np.asarray(src, dtype = np.int64)
+    dst = np.asarray(dst, dtype = np.int64)
+    weight = np.asarray(weight, dtype = np.float64)
+
+    # Drop self loops
+    keep = src != dst
+    src, dst, weight = src[keep], dst[keep], weight[keep]
+
+    if symmetric == True:
+        src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+        weight = np.concatenate([weight, weight])
+
+    key, weight = _merge_edges(src * N + dst, weight, aggregate)
+
+    rows = key // N
+    indices = key % N
+    indptr = np.zeros(N + 1, dtype = np.int64)
+    np.cumsum(np.bincount(rows, minlength = N), out = indptr[1:])
+
+    return indptr, indices, weight
+
+
+
+#=============================================================================#
+# Function for reversing CSR arrays #
+#===================================#
+
+def _reverse_csr(indptr, indices, weight):
+
+    """ Return CSR arrays of the graph with reversed edges.
+
+    For directed graphs rows of reversed arrays store predecessors
+    of nodes. For undirected graphs arrays are returned unchanged.
+
+    """
+
+    N = len(indptr) - 1
+    rows = np.repeat(np.arange(N), np.diff(indptr))
+    order = np.lexsort((rows, indices))
+    rev_indptr = np.zeros(N + 1, dtype = np.int64)
+    np.cumsum(np.bincount(indices, minlength = N), out = rev_indptr[1:])
+
+    return rev_indptr, rows[order], weight[order]
+
+
+
+#=============================================================================#
+# Function for graph compilation #
+#================================#
+
+def compile_graph(G):
+
+    """ Convert NetworkX graph to compiled graph.
+
+    Compiled graph stores structure of the graph in CSR arrays and nodes'
+    attributes in columns, so fast functions in difpy may use
+    vectorized computations.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object. If G is already compiled graph,
+        it is returned unchanged.
+
+
+    Returns
+    -------
+    CG : dictionary
+        A compiled graph.
+
+    """
+
+    # Graph already compiled
+    if isinstance(G, dict):
+        return G
+
+    nodes = list(G.nodes())
+    N = len(nodes)
+    index = {v: i for i, v in enumerate(nodes)}
+
+    #===========#
+    # Structure #
+    #===========#
+
+    edges = list(G.edges(data = 'weight', default = 1.0))
+    src = np.fromiter((index[u] for u, v, w in edges), dtype = np.int64,
+                      count = len(edges))
+    dst = np.fromiter((index[v] for u, v, w in edges), dtype = np.int64,
+                      count = len(edges))
+    weight = np.fromiter((w for u, v, w in edges), dtype = np.float64,
+                         count = len(edges))
+
+    indptr, indices, weight = _csr_from_edges(
+        N, src, dst, weight, symmetric = not G.is_directed())
+
+    #==================#
+    # Nodes attributes #
+    #==================#
+
+    aware = np.fromiter((d.get('state') == 'aware'
+                         for v, d in G.nodes(data = True)),
+                        dtype = bool, count = N)
+
+    # Collect numeric attributes present in all nodes
+    node_attrs = {}
+    if N > 0:
+        keys = [k for k in G.nodes[nodes[0]].keys() if k != 'state']
+        for key in keys:
+            try:
+                column = np.array([d[key] for v, d in G.nodes(data = True)],
+                                  dtype = np.float64)
+            except (KeyError, TypeError, ValueError):
+                continue
+            node_attrs[key] = column
+
+    CG = {'nodes': _node_array(nodes),
+          'indptr': indptr,
+          'indices': indices,
+          'weight': weight,
+          'aware': aware,
+          'node_attrs': node_attrs,
+          'directed': G.is_directed()}
+
+    return CG
+
+
+
+#=============================================================================#
+# Function for conversion to NetworkX graph #
+#===========================================#
+
+def to_networkx(CG):
+
+    """ Convert compiled graph to NetworkX graph.
+
+
+    Parameters
+    ----------
+
+    CG : dictionary
+        A compiled graph.
+
+
+    Returns
+    -------
+    G : graph
+        A networkx graph object with weights, state and numeric nodes'
+        attributes.
+
+    """
+
+    G = nx.DiGraph() if CG['directed'] == True else nx.Graph()
+
+    nodes = CG['nodes'].tolist()
+    N = len(nodes)
+
+    # Add nodes with attributes
+    columns = {k: np.asarray(v).tolist() for k, v in CG['node_attrs'].items()}
+    state = np.where(CG['aware'], 'aware', 'unaware').tolist()
+    G.add_nodes_from(
+        (nodes[i], dict({k: c[i] for k, c in columns.items()},
+                        state = state[i]))
+        for i in range(N))
+
+    # Add edges with weights, undirected edges only once
+    indptr = np.asarray(CG['indptr'])
+    indices = np.asarray(CG['indices'])
+    rows = np.repeat(np.arange(N), np.diff(indptr))
+    keep = slice(None) if CG['directed'] == True else rows < indices
+    weight = np.asarray(CG['weight'])[keep].tolist()
+    G.add_weighted_edges_from(
+        (nodes[u], nodes[v], w)
+        for u, v, w in zip(rows[keep].tolist(), indices[keep].tolist(),
+                           weight))
+
+    return G
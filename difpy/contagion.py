@@ -0,0 +1,150 @@
+"""
+Created on Mon Oct 19 01:48:10 2026
+
+
+    Module enables simulations of many pieces of information (contagions)
+    spreading on the same graph in Difpy package.
+
+    States are kept as (nodes x contagions) boolean matrix, where True
+    means that node is aware of the contagion. All contagions (and all
+    simulations) are advanced by one vectorized step on compiled graph,
+    so probabilities of edges and the loop over steps are shared.
+    Contagions may be independent or exclusive - in exclusive mode node
+    adopts at most one contagion, and when several contagions reach
+    unaware node in the same step one of them is chosen at random.
+
+
+    Objects
+    ----------
+    multi_contagion_simulation : function
+        A function performs simulation of many contagions at once.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+
+
+#=============================================================================#
+# Function for multi-contagion simulation #
+#=========================================#
+
+def multi_contagion_simulation(G,
+                               S,
+                               n = 5, # number of simulation steps
+
+                               kernel = 'weights', # kernel type
+                               WERE_multiplier = 10,
+                               virality = None, # multipliers of contagions
+                               exclusive = False): # at most one contagion
+                                                   # per node
+
+    """ Perform simulation of many contagions at once.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph.
+
+    S : ndarray
+        Bool ndarray in shape (<number of nodes>, <number of contagions>)
+        with initial states of nodes, or in shape (<number of
+        simulations>, <number of nodes>, <number of contagions>) for
+        many simulations.
+
+    n : integer
+        number of simulation steps.
+
+    kernel : string
+        Levels: "weights", "WERE"
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    virality : ndarray, optional
+        Multiplier of edges' probabilities for each contagion.
+        If None, all contagions spread with kernel probabilities.
+
+    exclusive : bool, optional
+        If True, node aware of any contagion does not adopt other ones.
+
+
+    Returns
+    -------
+    S : ndarray
+        Bool ndarray with states of nodes after simulation, in shape
+        of initial states.
+
+    avg_aware_inc_per_step : ndarray
+        Average increment of aware agents per one step for each contagion
+        (and each simulation).
+
+    """
+
+    CG = dp.compile_graph(G)
+    # Rows of compiled graph are senders of information
+    indptr, indices = CG['indptr'], CG['indices']
+
+    S = np.array(S, dtype = bool, copy = True)
+    single = S.ndim == 2
+    if single == True:
+        S = S[None]
+    B, N, K = S.shape
+
+    # States as (simulations x contagions x nodes)
+    X = np.ascontiguousarray(S.transpose(0, 2, 1))
+    aware_first = X.sum(axis = 2)
+
+    virality = np.ones(K) if virality is None \
+               else np.asarray(virality, dtype = np.float64)
+    prob = dp.engine._edge_probabilities(CG, kernel, WERE_multiplier,
+                                         receivers = 'indices')
+    # log of probability of failure for each contagion and edge
+    log_fail = np.log1p(-np.clip(prob[None, :] * virality[:, None],
+                                 0, 1 - 1e-12))
+
+    for step in range(n):
+
+        #========#
+        # Kernel #
+        #========#
+
+        # Only edges of aware senders are gathered, so cost of a step
+        # depends on number of their edges, not on contagions x edges
+        row, sender = np.nonzero(X.reshape(B * K, N))
+        degree = indptr[sender + 1] - indptr[sender]
+        offset = np.repeat(indptr[sender] - (np.cumsum(degree) - degree),
+                           degree)
+        edge = offset + np.arange(len(offset))
+        row = np.repeat(row, degree)
+
+        log_fail_sum = np.bincount(row * N + indices[edge],
+                                   weights = log_fail[row % K, edge],
+                                   minlength = B * K * N)
+        prob_of_internalization = 1 - np.exp(log_fail_sum.reshape(B, K, N))
+
+        #============================#
+        # Attempt to internalization #
+        #============================#
+
+        new = np.random.random((B, K, N)) < prob_of_internalization
+
+        if exclusive == True:
+            # Only unaware nodes adopt, one random contagion of successful
+            new &= ~X.any(axis = 1)[:, None, :]
+            keys = np.where(new, np.random.random((B, K, N)), -1.0)
+            chosen = keys.argmax(axis = 1)
+            new = (np.arange(K)[None, :, None] == chosen[:, None, :]) \
+                  & new.any(axis = 1)[:, None, :]
+
+        X |= new
+
+    avg_aware_inc_per_step = (X.sum(axis = 2) - aware_first) / n
+    S = X.transpose(0, 2, 1)
+
+    if single == True:
+        return S[0], avg_aware_inc_per_step[0]
+    return S, avg_aware_inc_per_step
@@ -0,0 +1,445 @@
+"""
+Created on Mon Oct 19 00:12:48 2026
+
+
+    Module enables updates of compiled graphs in Difpy package without
+    rebuilding them.
+
+    Dynamic graph keeps compiled graph (CSR arrays) and a log of edges'
+    insertions, deletions and weight updates (delta buffers). Edges are
+    read with deltas applied, and when log grows over a part of graph
+    size it is merged into CSR arrays in one vectorized pass
+    (compaction).
+
+    Results computed for the graph (artifacts) may be registered in
+    dynamic graph and are invalidated only where changes affect them:
+
+        * node artifacts (e.g. nodes' scores, centrality rankings)
+          become stale for nodes within given number of hops from
+          changed edges and nodes,
+        * edge artifacts (e.g. live-edge samples) become stale for
+          inserted and updated edges, values of other edges are kept
+          through compaction.
+
+
+    Objects
+    ----------
+    DynamicGraph : class
+        A class keeps compiled graph with batched updates.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+
+
+#=============================================================================#
+# DynamicGraph class #
+#====================#
+
+class DynamicGraph:
+
+    """ Compiled graph with batched edge updates.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph. Arrays are copied.
+
+    compact_ratio : float, optional
+        Log of changes is merged into CSR arrays when it has more
+        entries than compact_ratio * number of stored edges.
+
+    """
+
+    def __init__(self, G, compact_ratio = 0.1):
+
+        CG = dp.compile_graph(G)
+        self.compact_ratio = compact_ratio
+        self.directed = CG['directed']
+        self.nodes = np.array(CG['nodes'])
+        self.indptr = np.array(CG['indptr'], dtype = np.int64)
+        self.indices = np.array(CG['indices'], dtype = np.int64)
+        self.weight = np.array(CG['weight'], dtype = np.float64)
+        self.aware = np.array(CG['aware'], dtype = bool)
+        self.node_attrs = {k: np.array(v)
+                           for k, v in CG['node_attrs'].items()}
+
+        # Log of changes: (src, dst, weight, op) arrays, op is True
+        # for insertion or update and False for deletion
+        self._log = []
+        self._pending = 0
+        # Changes not seen yet by each node artifact
+        self._changes = []
+        self._node_artifacts = {}
+        self._edge_artifacts = {}
+        self._index = None
+
+
+    def __len__(self):
+
+        return len(self.nodes)
+
+
+    #=========================#
+    # Nodes' names to numbers #
+    #=========================#
+
+    def _positions(self, names):
+
+        """ Return ndarray with numbers of nodes with given names. """
+
+        names = dp.compiled._node_array(names)
+
+        # Names which are not sortable (e.g. tuples, mixed types) are
+        # found in dictionary
+        if self.nodes.dtype == object or names.dtype == object:
+            if not isinstance(self._index, dict):
+                self._index = {v: i for i, v in enumerate(self.nodes.tolist())}
+            try:
+                return np.array([self._index[v] for v in names.tolist()],
+                                dtype = np.int64)
+            except KeyError:
+                raise ValueError("Some of nodes are not in the graph.")
+
+        if self._index is None:
+            self._index = np.argsort(self.nodes, kind = 'stable')
+        position = np.searchsorted(self.nodes, names, sorter = self._index)
+        position = np.minimum(position, len(self.nodes) - 1)
+        numbers = self._index[position]
+        if len(names) > 0 and (len(self.nodes) == 0
+                               or np.any(self.nodes[numbers] != names)):
+            raise ValueError("Some of nodes are not in the graph.")
+
+        return numbers
+
+
+    #=========#
+    # Changes #
+    #=========#
+
+    def add_nodes(self, nodes, attrs = None):
+
+        """ Add nodes without edges.
+
+
+        Parameters
+        ----------
+
+        nodes : list
+            Names of new nodes.
+
+        attrs : dictionary, optional
+            Ndarrays with values of nodes' attributes for new nodes.
+            Other attributes of new nodes are NaN.
+
+        """
+
+        nodes = dp.compiled._node_array(nodes)
+        k = len(nodes)
+        attrs = attrs or {}
+
+        self.nodes = np.concatenate([self.nodes, nodes])
+        self.indptr = np.concatenate([self.indptr,
+                                      np.full(k, self.indptr[-1])])
+        self.aware = np.concatenate([self.aware, np.zeros(k, dtype = bool)])
+        for name in set(self.node_attrs) | set(attrs):
+            old = self.node_attrs.get(name, np.full(len(self.aware) - k,
+                                                    np.nan))
+            new = np.asarray(attrs[name]) if name in attrs \
+                  else np.full(k, np.nan)
+            self.node_attrs[name] = np.concatenate([old, new])
+        self._index = None
+
+        # New nodes have no valid artifacts
+        for artifact in self._node_artifacts.values():
+            artifact['values'] = np.concatenate(
+                [artifact['values'], np.zeros(k, artifact['values'].dtype)])
+            artifact['stale'] = np.concatenate([artifact['stale'],
+                                                np.ones(k, dtype = bool)])
+        self._changes.append((np.arange(len(self) - k, len(self)),
+                              np.zeros((0, 2), dtype = np.int64)))
+
+
+    def add_edges(self, src, dst, weight = 1.0):
+
+        """ Insert edges or update weights of existing edges.
+
+
+        Parameters
+        ----------
+
+        src, dst : list
+            Names of edges' endpoints.
+
+        weight : float or ndarray, optional
+            Weights of edges.
+
+        """
+
+        src, dst = self._positions(src), self._positions(dst)
+        weight = np.broadcast_to(np.asarray(weight, dtype = np.float64),
+                                 src.shape)
+        self._append(src, dst, weight, True)
+
+
+    def update_weights(self, src, dst, weight):
+
+        """ Update weights of existing edges.
+
+        Edges which do not exist raise ValueError.
+
+        """
+
+        if np.any(np.isnan(self.edge_weights(src, dst))):
+            raise ValueError("Some of edges are not in the graph.")
+        self.add_edges(src, dst, weight)
+
+
+    def remove_edges(self, src, dst):
+
+        """ Remove edges, missing edges are skipped.
+
+
+        Parameters
+        ----------
+
+        src, dst : list
+            Names of edges' endpoints.
+
+        """
+
+        src, dst = self._positions(src), self._positions(dst)
+        self._append(src, dst, np.zeros(len(src)), False)
+        self._changes[-1] = (self._changes[-1][0],
+                             np.stack([src, dst], axis = 1))
+
+
+    def _append(self, src, dst, weight, op):
+
+        """ Append changes to log, compact if log is long. """
+
+        keep = src != dst
+        src, dst, weight = src[keep], dst[keep], weight[keep]
+        if self.directed == False:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+            weight = np.concatenate([weight, weight])
+
+        self._log.append((src, dst, weight, np.full(len(src), op)))
+        self._pending += len(src)
+        self._changes.append((np.union1d(src, dst),
+                              np.zeros((0, 2), dtype = np.int64)))
+
+        if self._pending > self.compact_ratio * max(len(self.indices), 1):
+            self.compact()
+
+
+    #=====================#
+    # Reading with deltas #
+    #=====================#
+
+    def _last_changes(self):
+
+        """ Return sorted keys (src * N + dst) of logged edges with
+        weight and op of the last change of each edge.
+
+        """
+
+        N = len(self)
+        src, dst, weight, op = [np.concatenate(a) for a in zip(*self._log)]
+        key, last = dp.compiled._merge_edges(
+            src * N + dst, np.arange(len(src), dtype = np.float64), 'last')
+        last = last.astype(np.int64)
+
+        return key, weight[last], op[last]
+
+
+    def edge_weights(self, src, dst):
+
+        """ Return ndarray with weights of edges, NaN for missing edges.
+        Logged changes are applied without compaction.
+
+        """
+
+        src, dst = self._positions(src), self._positions(dst)
+        result = np.full(len(src), np.nan)
+        N = len(self)
+
+        # Stored edges are sorted by (row, column), so they are found
+        # with binary search
+        key = np.repeat(np.arange(N), np.diff(self.indptr)) * N \
+              + self.indices
+        query = src * N + dst
+        if len(key) > 0:
+            found = np.minimum(np.searchsorted(key, query), len(key) - 1)
+            hit = key[found] == query
+            result[hit] = self.weight[found[hit]]
+
+        # Logged changes override stored edges
+        if self._log:
+            key, weight, op = self._last_changes()
+            found = np.minimum(np.searchsorted(key, query), len(key) - 1)
+            hit = key[found] == query
+            result[hit] = np.where(op[found[hit]], weight[found[hit]],
+                                   np.nan)
+
+        return result
+
+
+    #============#
+    # Compaction #
+    #============#
+
+    def compact(self):
+
+        """ Merge log of changes into CSR arrays. """
+
+        N = len(self)
+        rows = np.repeat(np.arange(len(self.indptr) - 1),
+                         np.diff(self.indptr))
+        E = len(self.indices)
+
+        if self._log:
+            src, dst, weight, op = [np.concatenate(a)
+                                    for a in zip(*self._log)]
+        else:
+            src = dst = np.zeros(0, dtype = np.int64)
+            weight, op = np.zeros(0), np.zeros(0, dtype = bool)
+
+        # Last change of each edge wins, stored edges go first
+        key = np.concatenate([rows * N + self.indices, src * N + dst])
+        source = np.arange(len(key), dtype = np.float64)
+        key, last = dp.compiled._merge_edges(key, source, 'last')
+        last = last.astype(np.int64)
+        keep = np.concatenate([np.ones(E, dtype = bool), op])[last]
+        key, last = key[keep], last[keep]
+
+        self.weight = np.concatenate([self.weight, weight])[last]
+        self.indices = key % N
+        self.indptr = np.zeros(N + 1, dtype = np.int64)
+        np.cumsum(np.bincount(key // N, minlength = N),
+                  out = self.indptr[1:])
+
+        # Edge artifacts are kept for stored, unchanged edges
+        unchanged = last < E
+        for artifact in self._edge_artifacts.values():
+            values = np.zeros(len(key), dtype = artifact['values'].dtype)
+            values[unchanged] = artifact['values'][last[unchanged]]
+            stale = np.ones(len(key), dtype = bool)
+            stale[unchanged] = artifact['stale'][last[unchanged]]
+            artifact['values'], artifact['stale'] = values, stale
+
+        self._log = []
+        self._pending = 0
+
+
+    def compiled(self):
+
+        """ Return compiled graph with all changes applied. Arrays are
+        shared with dynamic graph, so they should not be modified.
+
+        """
+
+        if self._log:
+            self.compact()
+
+        return {'nodes': self.nodes,
+                'indptr': self.indptr,
+                'indices': self.indices,
+                'weight': self.weight,
+                'aware': self.aware,
+                'node_attrs': self.node_attrs,
+                'directed': self.directed}
+
+
+    #===========#
+    # Artifacts #
+    #===========#
+
+    def set_node_artifact(self, name, values, hops = 0):
+
+        """ Register values computed for each node.
+
+
+        Parameters
+        ----------
+
+        name : string
+            Name of the artifact.
+
+        values : ndarray
+            Ndarray with value for each node.
+
+        hops : integer, optional
+            Range of changes influence. Value of a node becomes stale when
+            a change is within hops from it (along edges), e.g. number of
+            simulation steps for nodes' scores.
+
+        """
+
+        self._node_artifacts[name] = {
+            'values': np.array(values),
+            'stale': np.zeros(len(self), dtype = bool),
+            'hops': hops,
+            'seen': len(self._changes)}
+
+
+    def node_artifact(self, name):
+
+        """ Return values of node artifact and bool ndarray with True for
+        stale values, which have to be computed again.
+
+        """
+
+        artifact = self._node_artifacts[name]
+        changes = self._changes[artifact['seen']:]
+        if changes:
+            sources = np.concatenate([c[0] for c in changes])
+            removed = np.concatenate([c[1] for c in changes])
+            affected = dp.incremental._affected_positions(
+                self.compiled(), sources, removed, artifact['hops'])
+            artifact['stale'][affected] = True
+            artifact['seen'] = len(self._changes)
+
+        return artifact['values'], artifact['stale']
+
+
+    def refresh_node_artifact(self, name, nodes, values):
+
+        """ Set new values of node artifact for nodes' numbers (e.g.
+        numbers of stale values) and mark them valid.
+
+        """
+
+        current, stale = self.node_artifact(name)
+        current[nodes] = values
+        stale[nodes] = False
+
+
+    def set_edge_artifact(self, name, values):
+
+        """ Register values computed for each stored edge, in order of
+        compiled graph edges (CSR positions).
+
+        """
+
+        self.compiled()
+        self._edge_artifacts[name] = {
+            'values': np.array(values),
+            'stale': np.zeros(len(self.indices), dtype = bool)}
+
+
+    def edge_artifact(self, name):
+
+        """ Return values of edge artifact in order of compiled graph
+        edges and bool ndarray with True for inserted or updated edges.
+
+        """
+
+        self.compiled()
+        artifact = self._edge_artifacts[name]
+
+        return artifact['values'], artifact['stale']
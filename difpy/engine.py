@@ -0,0 +1,398 @@
+"""
+Created on Sun Oct 18 10:41:52 2026
+
+
+    Module enables fast, vectorized simulations in Difpy package
+    on compiled graphs.
+
+    Many simulations are run at once as a (simulations x nodes) boolean
+    state matrix, where True means 'aware' state. Each step is
+    synchronous - nodes which become aware in a step start to pass
+    information in the next step. Probabilities of the weights and WERE
+    kernels, oblivion and engagement enforcement are computed as in
+    simulation_step function, but it is a different diffusion model:
+    simulation_step updates nodes in place in nodes order, so there
+    information may pass many hops in one step. Results of both models
+    (e.g. nodes' scores) differ and should not be mixed.
+
+
+    Objects
+    ----------
+    simulation_batch : function
+        A function performs many simulations at once for a matrix
+        of initial states.
+
+
+    nodes_score_batched : function
+        A function computes score of information spreading capability
+        for each node with batched single-seed simulations.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+import time
+
+
+#=============================================================================#
+# Function for edges' probabilities #
+#===================================#
+
+def _edge_probabilities(CG, kernel = 'weights', WERE_multiplier = 10,
+                        with_engagement = True, receivers = 'rows'):
+
+    """ Compute probability of information propagation for each edge.
+
+    By default CSR rows of CG are treated as receivers of information
+    and indices as senders, so for undirected graphs probabilities are
+    computed for edges pointing to the row node.
+
+    Parameters
+    ----------
+
+    CG : dictionary
+        A compiled graph, with rows storing predecessors of nodes.
+
+    kernel : string
+        Levels: "weights", "WERE"
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    with_engagement : bool, optional
+        Include engagement of receivers in WERE kernel. If False,
+        engagement has to be multiplied later.
+
+    receivers : string, optional
+        Levels: "rows", "indices"
+        Which side of CSR entries receives information.
+
+
+    Returns
+    -------
+    prob : ndarray
+        Ndarray with probability for each CSR entry.
+
+    """
+
+    weight = np.asarray(CG['weight'], dtype = np.float64)
+
+    if kernel == 'weights':
+        return weight
+
+    if kernel == 'WERE':
+        attrs = CG['node_attrs']
+        rows = np.repeat(np.arange(len(CG['indptr']) - 1),
+                         np.diff(CG['indptr']))
+        if receivers == 'rows':
+            receiver, sender = rows, CG['indices']
+        else:
+            receiver, sender = CG['indices'], rows
+        prob = weight \
+        * attrs['receptiveness'][receiver] \
+        * attrs['extraversion'][sender] \
+        * WERE_multiplier
+        if with_engagement == True:
+            prob = prob * attrs['engagement'][receiver]
+        return prob
+
+    raise ValueError("Kernel '" + str(kernel) + "' is not supported "
+                     "by the batched engine, use 'weights' or 'WERE'.")
+
+
+
+#=============================================================================#
+# Function for summing values over neighbours #
+#=============================================#
+
+def _neighbour_sum(values, indptr):
+
+    """ Sum (simulations x CSR entries) matrix over rows of CSR arrays.
+
+    Returns (simulations x nodes) matrix. Nodes without neighbours
+    get zeros.
+
+    """
+
+    N = len(indptr) - 1
+    out = np.zeros((values.shape[0], N), dtype = values.dtype)
+    degree = np.diff(indptr)
+    nonempty = degree > 0
+    if values.shape[1] > 0:
+        out[:, nonempty] = np.add.reduceat(values, indptr[:-1][nonempty],
+                                           axis = 1)
+    return out
+
+
+
+#=============================================================================#
+# Function for batched simulation #
+#=================================#
+
+def simulation_batch(G,
+                     S,
+                     n = 5, # number of simulation steps
+
+                     kernel = 'weights', # kernel type
+                     WERE_multiplier = 10,
+                     oblivion = False, # information oblivion feature
+                     engagement_enforcement = 1.00):
+
+    """ Perform many simulations of information diffusion at once.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph.
+
+    S : ndarray
+        Bool ndarray in shape (<number of simulations>, <number of nodes>)
+        with initial states of nodes, True means 'aware'.
+
+    n : integer
+        number of simulation steps.
+
+    kernel : string
+        Levels: "weights", "WERE"
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    oblivion : bool, optional
+        Option which enable agents information oblivion.
+
+    engagement_enforcement : float
+        Reinforcement of agent engagement by multiplier.
+        If engagement_enforcement == 1, no reinforcement occurs.
+
+
+    Returns
+    -------
+    S : ndarray
+        Bool ndarray with states of nodes after simulations.
+
+    avg_aware_inc_per_step : ndarray
+        Average increment of aware agents per one step for each
+        simulation.
+
+    """
+
+    CG = dp.compile_graph(G)
+    indptr, indices, weight = CG['indptr'], CG['indices'], CG['weight']
+    if CG['directed'] == True:
+        indptr, indices, weight = dp.compiled._reverse_csr(indptr, indices,
+                                                           weight)
+    CG_in = dict(CG, indptr = indptr, indices = indices, weight = weight)
+
+    S = np.array(S, dtype = bool, copy = True)
+    B, N = S.shape
+    rows = np.repeat(np.arange(N), np.diff(indptr))
+    degree = np.diff(indptr)
+
+    # Engagement changes per simulation only for WERE kernel
+    dynamic_engagement = (kernel == 'WERE') \
+                         and (engagement_enforcement != 1 or oblivion)
+    if dynamic_engagement == True:
+        prob = _edge_probabilities(CG_in, kernel, WERE_multiplier,
+                                   with_engagement = False)
+        engagement = np.tile(CG['node_attrs']['engagement'], (B, 1))
+    else:
+        prob = _edge_probabilities(CG_in, kernel, WERE_multiplier)
+        # log of probability of failure, capped for finite values
+        log_fail = np.log1p(-np.clip(prob, 0, 1 - 1e-12))
+
+    aware_first = S.sum(axis = 1)
+
+    for step in range(n):
+
+        #=================#
+        # Oblivion option #
+        #=================#
+
+        if oblivion == True:
+            aware_nbrs = _neighbour_sum(S[:, indices].astype(np.float64),
+                                        indptr)
+            unaware_nbrs = degree - aware_nbrs
+            oblivion_factor = (unaware_nbrs + 0.0001) \
+                              / ((aware_nbrs + 0.0001) + (unaware_nbrs + 0.0001))
+            oblivion_prob = oblivion_factor * np.random.random((B, N))
+            forget = S & (np.random.random((B, N)) < oblivion_prob)
+            S[forget] = False
+            if dynamic_engagement == True:
+                engagement[forget] = np.round(np.minimum(
+                    1, engagement[forget] * engagement_enforcement), 6)
+
+        #========#
+        # Kernel #
+        #========#
+
+        senders = S[:, indices]
+        if dynamic_engagement == True:
+            p = np.clip(prob[None, :] * engagement[:, rows], 0, 1 - 1e-12)
+            log_fail_step = np.where(senders, np.log1p(-p), 0.0)
+        else:
+            log_fail_step = np.where(senders, log_fail[None, :], 0.0)
+
+        prob_of_internalization = 1 - np.exp(_neighbour_sum(log_fail_step,
+                                                            indptr))
+
+        #===================#
+        # Engagement rising #
+        #===================#
+
+        if dynamic_engagement == True:
+            aware_nbrs = _neighbour_sum(senders.astype(np.float64), indptr)
+            engagement = np.where(
+                S, np.round(engagement * engagement_enforcement ** aware_nbrs,
+                            6), engagement)
+
+        #============================#
+        # Attempt to internalization #
+        #============================#
+
+        S = S | (np.random.random((B, N)) < prob_of_internalization)
+
+    avg_aware_inc_per_step = (S.sum(axis = 1) - aware_first) / n
+
+    return S, avg_aware_inc_per_step
+
+
+
+#=============================================================================#
+# nodes_score_batched function #
+#==============================#
+
+def nodes_score_batched(G,
+                        n = 5, # number of simulation steps in simulation
+                        sequence_len = 10, # number of simulations per node
+
+                        kernel = 'weights', # kernel type
+                        WERE_multiplier = 10,
+                        oblivion = False, # information oblivion feature
+                        engagement_enforcement = 1.00,
+
+                        nodes = None, # numbers of nodes to score
+                        batch_size = None, # number of simulations at once
+                        time_budget = None, # maximal time of computation
+                        simulation_budget = None, # maximal simulations
+                        callback = None # function receiving progress info
+                        ):
+
+    """ Compute nodes information propagation capability with batched
+    single-seed simulations.
+
+    Simulations of many nodes are performed at once as a state matrix
+    with synchronous steps of simulation_batch function. It is
+    a different diffusion model than in nodes_score_simulation function
+    with simulation method, so scores are lower and ranking of nodes
+    may differ.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph.
+
+    n : integer
+        A number of simulation steps for a given graph.
+
+    sequence_len : integer
+        A number of simulations to perform for each node.
+
+    kernel : string
+        Levels: "weights", "WERE"
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    oblivion : bool, optional
+        Option which enable agents information oblivion.
+
+    engagement_enforcement : float
+        Enforcement of agent engagement by multiplier.
+        If engagement_enforcement == 1, no enforcement occurs.
+
+    nodes : list of integers, optional
+        Numbers of nodes (positions in G.nodes()) to score. If None,
+        all nodes are scored.
+
+    batch_size : integer, optional
+        Number of simulations performed at once. If None, it is chosen
+        to keep (simulations x edges) matrices below 2**22 elements.
+
+    time_budget : float, optional
+        Maximal wall-clock time of computation in seconds.
+
+    simulation_budget : integer, optional
+        Maximal number of performed simulations.
+
+    callback : function, optional
+        Function called after each batch with dictionary of progress
+        information (see difpy.progress module).
+
+
+    Returns
+    -------
+    list_solution : list
+        List with nodes information propagation capabilities. Each value
+        is an average increment of aware nodes per one simulation step
+        for each node. If budget is exhausted, list contains scores
+        only for nodes computed before, in nodes order.
+
+    """
+
+    # Start time measuring
+    start = time.time()
+
+    CG = dp.compile_graph(G)
+    N = len(CG['indptr']) - 1
+    if nodes is None:
+        nodes = np.arange(N)
+    nodes = np.asarray(nodes, dtype = np.int64)
+
+    # Number of nodes simulated at once
+    if batch_size is None:
+        batch_size = max(1, 2**22 // max(len(CG['indices']), N, 1))
+    nodes_per_batch = max(1, batch_size // sequence_len)
+
+    evaluations = 0
+    list_solution = []
+
+    for first in range(0, len(nodes), nodes_per_batch):
+
+        # Stop if budget is exhausted
+        if dp.budget_exhausted(start, evaluations,
+                               time_budget, simulation_budget,
+                               cost = sequence_len):
+            break
+
+        # Last batch is cut to simulations left in budget
+        batch_nodes = nodes_per_batch
+        if simulation_budget is not None:
+            batch_nodes = min(batch_nodes, (simulation_budget - evaluations)
+                                           // sequence_len)
+        seeds = nodes[first:first + batch_nodes]
+
+        # Each seed repeated sequence_len times
+        rows = np.repeat(seeds, sequence_len)
+        S = np.zeros((len(rows), N), dtype = bool)
+        S[np.arange(len(rows)), rows] = True
+
+        S, avg_inc = simulation_batch(CG, S, n, kernel, WERE_multiplier,
+                                      oblivion, engagement_enforcement)
+        evaluations += len(rows)
+
+        # Average over simulations of each seed
+        list_solution.extend(
+            avg_inc.reshape(len(seeds), sequence_len).mean(axis = 1).tolist())
+
+        # Pass progress information to callback
+        if callback is not None:
+            callback(dp.progress_info(len(list_solution), max(list_solution),
+                                      evaluations, start))
+
+    return list_solution
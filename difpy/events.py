@@ -0,0 +1,155 @@
+"""
+Created on Mon Oct 19 02:58:04 2026
+
+
+    Module enables event-driven simulations in Difpy package.
+
+    Instead of drawing a random number for each edge in each step,
+    when a node becomes aware, time to the first successful transmission
+    is drawn once for each of its edges - geometric delay for discrete
+    steps or exponential delay for continuous time (with rate chosen so
+    that probability of transmission during one time unit equals
+    probability of the edge). Arrivals are processed from priority queue
+    in order of time, and only the first arrival to a node makes it
+    aware, so work done in Python scales with number of successful
+    transmissions within horizon of n steps.
+
+    Without oblivion, discrete mode gives the same distribution of
+    results as simulation_batch function (states after step k are nodes
+    with awareness time <= k).
+
+
+    Objects
+    ----------
+    event_simulation : function
+        A function performs event-driven simulations.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+import heapq
+
+
+#=============================================================================#
+# Function for event-driven simulation #
+#======================================#
+
+def event_simulation(G,
+                     n = 5, # horizon in simulation steps
+                     S = None, # initial states of nodes
+
+                     kernel = 'weights', # kernel type
+                     WERE_multiplier = 10,
+                     time = 'discrete', # type of delays
+                     simulations = 1): # number of simulations if S is None
+
+    """ Perform event-driven simulations of information diffusion.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph.
+
+    n : integer
+        Horizon of simulation in steps (time units).
+
+    S : ndarray, optional
+        Bool ndarray in shape (<number of simulations>, <number of nodes>)
+        with initial states of nodes. If None, simulations start from
+        states of G.
+
+    kernel : string
+        Levels: "weights", "WERE"
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    time : string, optional
+        Levels: "discrete", "continuous"
+
+        * discrete - geometric delays, integer times of steps
+        * continuous - exponential delays (continuous-time process)
+
+    simulations : integer, optional
+        Number of simulations, used when S is None.
+
+
+    Returns
+    -------
+    S : ndarray
+        Bool ndarray with states of nodes after n steps.
+
+    avg_aware_inc_per_step : ndarray
+        Average increment of aware agents per one step for each
+        simulation, as in simulation function.
+
+    times : ndarray
+        Ndarray with time when each node became aware in each
+        simulation, inf for nodes not aware within horizon.
+
+    """
+
+    if time not in ('discrete', 'continuous'):
+        raise ValueError("Time '" + str(time) + "' is not supported, "
+                         "use 'discrete' or 'continuous'.")
+
+    CG = dp.compile_graph(G)
+    # Rows of compiled graph are senders of information
+    indptr, indices = CG['indptr'], CG['indices']
+    prob = dp.engine._edge_probabilities(CG, kernel, WERE_multiplier,
+                                         receivers = 'indices')
+    # Delays are drawn by inverse transform from log of failure
+    # probability, edges with zero probability get infinite delays
+    with np.errstate(divide = 'ignore'):
+        log_fail = np.log1p(-np.clip(prob, 0, 1 - 1e-12))
+        inv_log_fail = np.where(log_fail < 0, 1 / log_fail, -np.inf)
+
+    if S is None:
+        S = np.tile(CG['aware'], (simulations, 1))
+    S = np.asarray(S, dtype = bool)
+    times = np.full(S.shape, np.inf)
+
+    for b in range(S.shape[0]):
+
+        t_aware = times[b]
+        seeds = np.flatnonzero(S[b])
+        t_aware[seeds] = 0
+        queue = [(0.0, u) for u in seeds]
+
+        #===================#
+        # Events processing #
+        #===================#
+
+        while queue:
+
+            t, u = heapq.heappop(queue)
+            if t > t_aware[u]:
+                continue # node was reached earlier
+
+            first, last = indptr[u], indptr[u + 1]
+            if first == last:
+                continue
+
+            # -log(U) is exponential, divided by rate -log(1 - p)
+            delay = np.log(1 - np.random.random(last - first)) \
+                    * inv_log_fail[first:last]
+            if time == 'discrete':
+                delay = np.floor(delay) + 1
+
+            arrival = t + delay
+            v = indices[first:last]
+            better = (arrival <= n) & (arrival < t_aware[v])
+            for a, w in zip(arrival[better], v[better]):
+                if a < t_aware[w]:
+                    t_aware[w] = a
+                    heapq.heappush(queue, (a, w))
+
+    S = times <= n
+    avg_aware_inc_per_step = (S.sum(axis = 1) - (times == 0).sum(axis = 1)) \
+                             / n
+
+    return S, avg_aware_inc_per_step, times
@@ -26,8 +26,8 @@ import difpy as dp
 import time
 import networkx as nx
 
-from xgboost import XGBRegressor
-from sklearn.model_selection import train_test_split
+# xgboost and sklearn are imported only by feature_importance function,
+# so nodes' scores may be computed without them
 
 #=============================================================================#
 # nodes_score function #
@@ -44,7 +44,17 @@ def nodes_score_simulation(
         custom_kernel = None, # custom kernel function
         WERE_multiplier = 10, 
         oblivion = False, # information oblivion feature 
-        engagement_enforcement = 1.00
+        engagement_enforcement = 1.00,
+        
+        time_budget = None, # maximal time of computation
+        simulation_budget = None, # maximal number of simulations
+        callback = None, # function receiving progress information
+        
+        method = 'simulation', # method of scores computation
+        sketch_size = 32, # accuracy of sketch method
+        n_jobs = None, # number of processes for parallel method
+        
+        cache_dir = None # directory of nodes' scores cache
         ): 
                 
     
@@ -112,6 +122,74 @@ def nodes_score_simulation(
     
     oblivion : bool, optional
         Option which enable agents information oblivion. 
+    
+    
+    Budget and progress parameters:
+    -------------------------------
+    
+    time_budget : float, optional
+        Maximal wall-clock time of computation in seconds. If None, 
+        time is unlimited.
+    
+    simulation_budget : integer, optional
+        Maximal number of performed simulations. Each node requires
+        sequence_len simulations. If None, number of simulations 
+        is unlimited.
+    
+    callback : function, optional
+        Function called after each node with dictionary of progress
+        information (see difpy.progress module).
+    
+    
+    
+    Computation method:
+    -------------------
+    
+    method : string
+        Levels: "simulation", "batched", "sketch", "parallel"
+        
+        * simulation - each node is scored with simulation_sequence 
+            function on the NetworkX graph
+        * batched - simulations of many nodes are performed at once
+            with nodes_score_batched function (weights and WERE kernels
+            only). Steps are synchronous, nodes which become aware pass
+            information from the next step.
+        * sketch - scores of the synchronous model (as in batched 
+            method) are estimated with nodes_score_sketch function
+            from sequence_len sampled worlds (weights and WERE kernels,
+            without oblivion and engagement enforcement).
+        * parallel - each node is scored as in simulation method, 
+            in a pool of processes with nodes_score_parallel function. 
+            G is not modified.
+        
+        Simulation (and parallel) method and batched (and sketch) 
+        method are different diffusion models, not approximations 
+        of one another. In simulation_step nodes are updated in place 
+        in nodes order, so information may pass many hops in one step,
+        and scores are higher than with synchronous steps. Ranking 
+        of nodes may differ, so scores computed with different methods
+        should not be compared or mixed.
+    
+    sketch_size : integer
+        Accuracy of sketch method. Relative error of estimation is 
+        about 1 / sqrt(sketch_size - 2).
+    
+    n_jobs : integer, optional
+        Number of processes for parallel method. If None, number 
+        of CPUs is used.
+    
+    
+    
+    Cache parameters:
+    -----------------
+    
+    cache_dir : string, optional
+        Directory of nodes' scores cache. Scores are loaded from cache
+        if they were computed before for the same graph (see 
+        graph_fingerprint function) and simulation parameters, 
+        otherwise they are computed and saved. Scores computed with 
+        custom kernel or with time or simulation budget are not saved.
+        If None, cache is not used.
         
         
     Returns
@@ -119,13 +197,131 @@ def nodes_score_simulation(
     list_solution : list
         List with nodes information propagation capabilities. Each value 
         is an average increment of aware nodes per one simulation step
-        for each node.
+        for each node. If budget is exhausted, list contains scores
+        only for nodes computed before, in nodes order.
         
     
-    """        
+    """
+
+    # Sampled worlds do not express oblivion and engagement enforcement
+    if method == 'sketch' and (oblivion == True
+                               or engagement_enforcement != 1):
+        raise ValueError("Sketch method does not support oblivion and "
+                         "engagement enforcement, use 'simulation' or "
+                         "'batched' method.")
+
+    #===============#
+    # Cached scores #
+    #===============#
+
+    if cache_dir is not None and kernel != 'custom':
+        
+        # Parameters which have influence on scores
+        params = {'n': n,
+                  'sequence_len': sequence_len,
+                  'kernel': kernel,
+                  'WERE_multiplier': WERE_multiplier,
+                  'oblivion': oblivion,
+                  'engagement_enforcement': engagement_enforcement,
+                  'method': method}
+        if method == 'sketch':
+            params['sketch_size'] = sketch_size
+        
+        key = dp.scores_cache_key(G, params)
+        list_solution = dp.load_scores(cache_dir, key)
+        
+        if list_solution is not None:
+            print("")                
+            print("List of solutions loaded from cache:",\
+                  list_solution)
+            return list_solution
+        
+        start = time.time()
+        list_solution = nodes_score_simulation(G, log_info_interval, n, 
+                                               sequence_len, kernel, 
+                                               custom_kernel, 
+                                               WERE_multiplier, oblivion,
+                                               engagement_enforcement,
+                                               time_budget, 
+                                               simulation_budget, callback,
+                                               method, sketch_size, n_jobs)
+        
+        # Save only complete scores, scores computed with budget
+        # may be partial (e.g. sketch estimates from fewer worlds)
+        if time_budget is None and simulation_budget is None:
+            dp.save_scores(cache_dir, key, list_solution, params, 
+                           time.time() - start)
+        return list_solution
+
+    #=====================#
+    # Batched computation #
+    #=====================#
+    
+    if method == 'batched':
+        list_solution = dp.nodes_score_batched(G,
+                                               n,
+                                               sequence_len,
+                                               kernel,
+                                               WERE_multiplier,
+                                               oblivion,
+                                               engagement_enforcement,
+                                               time_budget = time_budget,
+                                               simulation_budget = \
+                                               simulation_budget,
+                                               callback = callback)
+        print("")                
+        print("List of solutions:",\
+              list_solution)
+        return list_solution
+    
+    #======================#
+    # Parallel computation #
+    #======================#
+    
+    if method == 'parallel':
+        list_solution = dp.nodes_score_parallel(G,
+                                                n_jobs,
+                                                n,
+                                                sequence_len,
+                                                kernel,
+                                                custom_kernel,
+                                                WERE_multiplier,
+                                                oblivion,
+                                                engagement_enforcement,
+                                                time_budget = time_budget,
+                                                simulation_budget = \
+                                                simulation_budget,
+                                                callback = callback)
+        print("")                
+        print("List of solutions:",\
+              list_solution)
+        return list_solution
+    
+    #====================#
+    # Sketch computation #
+    #====================#
+    
+    if method == 'sketch':
+        list_solution = dp.nodes_score_sketch(G,
+                                              n,
+                                              sequence_len,
+                                              sketch_size,
+                                              kernel,
+                                              WERE_multiplier,
+                                              time_budget = time_budget,
+                                              simulation_budget = \
+                                              simulation_budget,
+                                              callback = callback)
+        print("")                
+        print("List of solutions:",\
+              list_solution)
+        return list_solution
 
     # Start time measuring
     start = time.time()
+    
+    # Number of performed simulations
+    evaluations = 0
 
     # Compute number of nodes
     population = range(len(G))
@@ -139,6 +335,12 @@ def nodes_score_simulation(
     #====================================#
     
     for i in population:
+        
+        # Stop if budget is exhausted
+        if dp.budget_exhausted(start, evaluations, 
+                               time_budget, simulation_budget,
+                               cost = sequence_len):
+            break
     
         # Add 'unaware' state for all nodes
         nx.set_node_attributes(G, 'unaware', 'state') # (G, value, key)
@@ -157,9 +359,16 @@ def nodes_score_simulation(
                                               engagement_enforcement
                                               )
               
+        evaluations += sequence_len
+              
         # Save new node result to list
         list_solution.append(new_solution)
         
+        # Pass progress information to callback
+        if callback is not None:
+            callback(dp.progress_info(i + 1, max(list_solution), 
+                                      evaluations, start))
+        
         # Show log information
         if log_info_interval is not None:
             if i > 0:
@@ -199,7 +408,16 @@ def feature_importance(
         custom_kernel = None, # custom kernel function
         WERE_multiplier = 10, 
         oblivion = False, # information oblivion feature 
-        engagement_enforcement = 1.00
+        engagement_enforcement = 1.00,
+        
+        time_budget = None, # maximal time of simulation phase
+        simulation_budget = None, # maximal number of simulations
+        callback = None, # function receiving progress information
+        
+        method = 'simulation', # method of nodes' scores computation
+        sketch_size = 32, # accuracy of sketch method
+        n_jobs = None, # number of processes for parallel method
+        cache_dir = None # directory of nodes' scores cache
         ):
 
     
@@ -273,6 +491,41 @@ def feature_importance(
     oblivion : bool, optional
         Option which enable agents information oblivion. 
         
+    
+    
+    Parameters wrapped from nodes_score_simulation function:
+    --------------------------------------------------------
+    
+    time_budget : float, optional
+        Maximal wall-clock time of nodes' scores computation in seconds.
+        If budget is exhausted, model is fitted only on nodes with 
+        computed scores. If None, time is unlimited.
+    
+    simulation_budget : integer, optional
+        Maximal number of performed simulations. If None, number of 
+        simulations is unlimited.
+    
+    callback : function, optional
+        Function called after each node with dictionary of progress
+        information (see difpy.progress module).
+    
+    method : string
+        Levels: "simulation", "batched", "sketch", "parallel"
+        Method of nodes' scores computation. Methods use different 
+        diffusion models (see nodes_score_simulation function), so 
+        scores Y and fitted model depend on method.
+    
+    sketch_size : integer
+        Accuracy of sketch method.
+    
+    n_jobs : integer, optional
+        Number of processes for parallel method.
+    
+    cache_dir : string, optional
+        Directory of nodes' scores cache. Repeated runs for the same 
+        graph and simulation parameters, but different X, load scores
+        from cache instead of simulation.
+        
 
         
     Returns
@@ -298,9 +551,28 @@ def feature_importance(
                     custom_kernel, # custom kernel function
                     WERE_multiplier, 
                     oblivion, # information oblivion feature 
-                    engagement_enforcement
+                    engagement_enforcement,
+                    
+                    time_budget,
+                    simulation_budget,
+                    callback,
+                    
+                    method,
+                    sketch_size,
+                    n_jobs,
+                    cache_dir
                     )
+    
+    # Use only nodes with computed scores if budget was exhausted
+    if len(Y) < 2:
+        raise ValueError("Budget allowed to score " + str(len(Y)) + " "
+                         "nodes, at least 2 are needed to fit the model. "
+                         "Increase time_budget or simulation_budget.")
+    X = X[:len(Y)]
 
+    from xgboost import XGBRegressor
+    from sklearn.model_selection import train_test_split
+    
     X_train, X_test, Y_train, Y_test \
     = train_test_split(X, Y, test_size = 0.20, random_state = 10)
 
@@ -0,0 +1,397 @@
+"""
+Created on Sun Oct 18 15:02:27 2026
+
+
+    Module enables fast creation of large graphs for simulations
+    in Difpy package.
+
+    Graphs are generated directly as compiled graphs (CSR arrays), with
+    the same weights and nodes' attributes as in graph_init function,
+    without building NetworkX dict-of-dict structures. Edges may be
+    generated in chunks by a pool of processes. Compiled graph may be
+    converted to NetworkX graph with to_networkx function when needed.
+
+    Multiple edges and self loops which may be drawn by generators
+    are removed, as in NetworkX simple graphs.
+
+
+    Objects
+    ----------
+    watts_strogatz_compiled : function
+        A function creates Watts-Strogatz small-world graph.
+
+
+    barabasi_albert_compiled : function
+        A function creates Barabasi-Albert preferential attachment graph.
+
+
+    stochastic_block_compiled : function
+        A function creates stochastic block model graph.
+
+
+    configuration_compiled : function
+        A function creates configuration model graph with given degrees.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Number of nodes in one chunk of edges, chunks (and their seeds) do not
+# depend on number of processes, so graphs are the same for any n_jobs
+_CHUNK_NODES = 100000
+
+
+#=============================================================================#
+# Function for chunks computation #
+#=================================#
+
+def _map_chunks(function, chunks, n_jobs = 1):
+
+    """ Apply function to each tuple of arguments in chunks list,
+    in a pool of n_jobs processes if n_jobs > 1.
+
+    """
+
+    if n_jobs is None or n_jobs <= 1 or len(chunks) <= 1:
+        return [function(*args) for args in chunks]
+
+    with ProcessPoolExecutor(max_workers = n_jobs) as executor:
+        return list(executor.map(function, *zip(*chunks)))
+
+
+
+#=============================================================================#
+# Function for compiled graph with difpy attributes #
+#===================================================#
+
+def _compiled_graph(n, src, dst, initiation_perc, rng):
+
+    """ Build compiled graph from edges and add difpy attributes.
+
+    Weights, receptiveness, extraversion, engagement and state are
+    generated as in graph_init function.
+
+    """
+
+    indptr, indices, _ = dp.compiled._csr_from_edges(
+        n, src, dst, np.zeros(len(src)))
+
+    # Weights are generated for undirected edges and mirrored
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    upper = np.flatnonzero(rows < indices)
+    CG = {'nodes': np.arange(n),
+          'indptr': indptr,
+          'indices': indices,
+          'weight': np.zeros(len(indices)),
+          'aware': np.zeros(n, dtype = bool),
+          'node_attrs': {},
+          'directed': False}
+
+    weights = dp.initialize._scale_feature(np.round(rng.exponential(
+        scale = 0.1, size = len(upper)), 6))
+    dp.initialize._add_compiled_feature(CG, weights, 'weights')
+
+    CG['node_attrs']['receptiveness'] = dp.initialize._scale_feature(
+        np.round(rng.normal(size = n), 6))
+    CG['node_attrs']['extraversion'] = dp.initialize._scale_feature(
+        np.round(rng.normal(size = n), 6))
+    CG['node_attrs']['engagement'] = dp.initialize._scale_feature(
+        np.round(rng.exponential(size = n), 6))
+
+    # Random initiation
+    CG['aware'][rng.choice(n, size = int(n * initiation_perc),
+                           replace = False)] = True
+
+    return CG
+
+
+
+#=============================================================================#
+# Watts-Strogatz graph #
+#======================#
+
+def _watts_strogatz_chunk(first, last, n, k, rewire_prob, seed):
+
+    """ Generate edges of ring lattice for nodes first..last - 1
+    and rewire them.
+
+    """
+
+    rng = np.random.default_rng(seed)
+
+    # Each node is joined with k // 2 next nodes on the ring
+    src = np.repeat(np.arange(first, last), k // 2)
+    dst = (src + np.tile(np.arange(1, k // 2 + 1), last - first)) % n
+
+    # Rewire ends of edges to random nodes, without self loops
+    rewire = rng.random(len(src)) < rewire_prob
+    new_dst = rng.integers(0, n - 1, size = rewire.sum())
+    new_dst = new_dst + (new_dst >= src[rewire])
+    dst[rewire] = new_dst
+
+    return src, dst
+
+
+
+def watts_strogatz_compiled(n = 26, # number of nodes
+                            k = 5, # number of neighbours before rewiring
+                            rewire_prob = 0.1, # probability of rewiring
+                            initiation_perc = 0.1, # percent of aware nodes
+                            seed = None, # seed of random generator
+                            n_jobs = 1): # number of processes
+
+    """ Create Watts-Strogatz graph as compiled graph.
+
+    Graph corresponds to graph_init function, but is created with
+    arrays, so graphs with millions of nodes are created in seconds.
+
+
+    Parameters
+    ----------
+
+    n : integer
+       Nodes number of the graph.
+
+    k : integer
+        number of single node neighbours before rewriting edges
+
+    rewire_prob : float
+        probability of rewrite edge in random place
+
+    initiation_perc : float
+       Percent of randomly aware nodes.
+
+    seed : integer, optional
+        Seed of random number generator.
+
+    n_jobs : integer, optional
+        Number of processes generating edges. Graph generated with
+        given seed does not depend on n_jobs.
+
+
+    Returns
+    -------
+    CG : dictionary
+        A compiled graph.
+
+    """
+
+    n_chunks = max(1, -(-n // _CHUNK_NODES))
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks + 1)
+    bounds = np.linspace(0, n, n_chunks + 1).astype(np.int64)
+    chunks = [(bounds[i], bounds[i + 1], n, k, rewire_prob, seeds[i])
+              for i in range(len(bounds) - 1)]
+
+    edges = _map_chunks(_watts_strogatz_chunk, chunks, n_jobs)
+    src = np.concatenate([e[0] for e in edges])
+    dst = np.concatenate([e[1] for e in edges])
+
+    return _compiled_graph(n, src, dst, initiation_perc,
+                           np.random.default_rng(seeds[-1]))
+
+
+
+#=============================================================================#
+# Barabasi-Albert graph #
+#=======================#
+
+def barabasi_albert_compiled(n = 26, # number of nodes
+                             m = 2, # number of edges of each new node
+                             initiation_perc = 0.1, # percent of aware nodes
+                             seed = None): # seed of random generator
+
+    """ Create Barabasi-Albert graph as compiled graph.
+
+    Each new node is joined with m existing nodes chosen with
+    probability proportional to their degree (Batagelj-Brandes
+    method). References to earlier edges are resolved with pointer
+    jumping, so the whole graph is generated with vectorized
+    operations. Multiple edges and self loops drawn for a new node are
+    removed, so degree of some nodes may be lower than m.
+
+
+    Parameters
+    ----------
+
+    n : integer
+       Nodes number of the graph.
+
+    m : integer
+        Number of edges joining each new node with existing nodes.
+
+    initiation_perc : float
+       Percent of randomly aware nodes.
+
+    seed : integer, optional
+        Seed of random number generator.
+
+
+    Returns
+    -------
+    CG : dictionary
+        A compiled graph.
+
+    """
+
+    rng = np.random.default_rng(seed)
+
+    # Endpoints list: even positions are new nodes, odd positions
+    # copy randomly chosen earlier position
+    edges = (n - m) * m
+    new_node = np.repeat(np.arange(m, n), m)
+    endpoints = np.empty(2 * edges, dtype = np.int64)
+    endpoints[0::2] = new_node
+
+    # The first m nodes are joined with the first new node
+    pointer = np.empty(2 * edges, dtype = np.int64)
+    pointer[0::2] = np.arange(0, 2 * edges, 2)
+    position = np.arange(1, 2 * edges, 2)
+    pointer[1::2] = (rng.random(edges) * position).astype(np.int64)
+
+    resolved = np.zeros(2 * edges, dtype = bool)
+    resolved[0::2] = True
+    first = position[:m]
+    endpoints[first] = np.arange(m)
+    resolved[first] = True
+    pointer[first] = first
+
+    # Pointer jumping until all odd positions point to known nodes
+    pending = np.flatnonzero(~resolved[pointer])
+    while len(pending) > 0:
+        pointer[pending] = pointer[pointer[pending]]
+        pending = pending[~resolved[pointer[pending]]]
+    odd = np.setdiff1d(position, first)
+    endpoints[odd] = endpoints[pointer[odd]]
+
+    return _compiled_graph(n, endpoints[0::2], endpoints[1::2],
+                           initiation_perc, rng)
+
+
+
+#=============================================================================#
+# Stochastic block model graph #
+#==============================#
+
+def _block_chunk(first_a, size_a, first_b, size_b, prob, same, seed):
+
+    """ Generate random edges between two blocks of nodes. """
+
+    rng = np.random.default_rng(seed)
+
+    pairs = size_a * (size_a - 1) // 2 if same else size_a * size_b
+    count = rng.binomial(pairs, prob)
+    src = first_a + rng.integers(0, size_a, size = count)
+    dst = first_b + rng.integers(0, size_b, size = count)
+
+    return src, dst
+
+
+
+def stochastic_block_compiled(sizes, # list of blocks sizes
+                              probs, # matrix of edges probabilities
+                              initiation_perc = 0.1, # percent of aware
+                              seed = None, # seed of random generator
+                              n_jobs = 1): # number of processes
+
+    """ Create stochastic block model graph as compiled graph.
+
+    For each pair of blocks number of edges is sampled from binomial
+    distribution and endpoints are drawn uniformly, which corresponds
+    to the model for sparse blocks (repeated pairs are merged).
+
+
+    Parameters
+    ----------
+
+    sizes : list of integers
+        Number of nodes in each block.
+
+    probs : list of lists of floats
+        Symmetric matrix with probability of edge between nodes
+        of each pair of blocks.
+
+    initiation_perc : float
+       Percent of randomly aware nodes.
+
+    seed : integer, optional
+        Seed of random number generator.
+
+    n_jobs : integer, optional
+        Number of processes generating edges. Graph generated with
+        given seed does not depend on n_jobs.
+
+
+    Returns
+    -------
+    CG : dictionary
+        A compiled graph.
+
+    """
+
+    sizes = np.asarray(sizes, dtype = np.int64)
+    probs = np.asarray(probs, dtype = np.float64)
+    firsts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    n = int(sizes.sum())
+
+    pairs = [(a, b) for a in range(len(sizes)) for b in range(a, len(sizes))]
+    seeds = np.random.SeedSequence(seed).spawn(len(pairs) + 1)
+    chunks = [(firsts[a], sizes[a], firsts[b], sizes[b], probs[a, b],
+               a == b, seeds[i]) for i, (a, b) in enumerate(pairs)]
+
+    edges = _map_chunks(_block_chunk, chunks, n_jobs)
+    src = np.concatenate([e[0] for e in edges] + [np.zeros(0, np.int64)])
+    dst = np.concatenate([e[1] for e in edges] + [np.zeros(0, np.int64)])
+
+    return _compiled_graph(n, src, dst, initiation_perc,
+                           np.random.default_rng(seeds[-1]))
+
+
+
+#=============================================================================#
+# Configuration model graph #
+#===========================#
+
+def configuration_compiled(degrees, # degree of each node
+                           initiation_perc = 0.1, # percent of aware nodes
+                           seed = None): # seed of random generator
+
+    """ Create configuration model graph as compiled graph.
+
+    Stubs of all nodes are shuffled and joined in pairs. Self loops and
+    multiple edges are removed, so degrees of some nodes may be lower.
+
+
+    Parameters
+    ----------
+
+    degrees : list of integers
+        Degree of each node, sum of degrees has to be even.
+
+    initiation_perc : float
+       Percent of randomly aware nodes.
+
+    seed : integer, optional
+        Seed of random number generator.
+
+
+    Returns
+    -------
+    CG : dictionary
+        A compiled graph.
+
+    """
+
+    rng = np.random.default_rng(seed)
+    degrees = np.asarray(degrees, dtype = np.int64)
+
+    if degrees.sum() % 2 != 0:
+        raise ValueError("Sum of degrees has to be even.")
+
+    stubs = rng.permutation(np.repeat(np.arange(len(degrees)), degrees))
+
+    return _compiled_graph(len(degrees), stubs[0::2], stubs[1::2],
+                           initiation_perc, rng)
@@ -0,0 +1,383 @@
+"""
+Created on Sun Oct 18 13:48:19 2026
+
+
+    Module enables incremental computation of nodes' scores in Difpy
+    package after small changes of the graph.
+
+    In the batched engine information travels at most n hops from the
+    seed in n steps, so score of a node may change only if some changed
+    edge or node lies within n hops from it. In simulation_step nodes
+    are processed in place in nodes order, so in one step information
+    travels along paths with increasing positions of nodes (and one
+    more hop to any node), and score of a node may change only if some
+    change is reached with n such sweeps. Only affected nodes are
+    simulated again, scores of all other nodes are reused.
+
+    In graphs whose nodes order follows the structure (e.g. ring
+    lattice of graph_init function) one sweep may pass through most
+    of the graph, so most nodes are affected with simulation method.
+
+
+    Objects
+    ----------
+    affected_nodes : function
+        A function finds nodes which reach changed edges or nodes
+        within n steps.
+
+
+    nodes_score_incremental : function
+        A function updates nodes' scores after changes of the graph.
+
+
+"""
+
+import difpy as dp
+import networkx as nx
+import numpy as np
+import time
+
+
+#=============================================================================#
+# Function for affected nodes #
+#=============================#
+
+def affected_nodes(G,
+                   changed_edges = None,
+                   changed_nodes = None,
+                   removed_edges = None,
+                   n = 5,
+                   in_order = False):
+
+    """ Find nodes which reach changed edges or nodes within n steps
+    of simulation.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph after changes.
+
+    changed_edges : list of tuples, optional
+        Added edges and edges with changed weights, as (u, v) pairs
+        of nodes' names.
+
+    changed_nodes : list, optional
+        Names of added nodes and nodes with changed attributes.
+
+    removed_edges : list of tuples, optional
+        Edges removed from the graph, as (u, v) pairs of nodes' names.
+        Removed edges are also used to find paths to changes.
+
+    n : integer
+        A number of simulation steps.
+
+    in_order : bool, optional
+        If False, steps are synchronous as in simulation_batch function
+        and nodes within n hops are affected. If True, nodes are
+        updated in place in nodes order as in simulation_step function,
+        and nodes which reach changes with n sweeps are affected.
+
+
+    Returns
+    -------
+    affected : ndarray
+        Sorted ndarray with numbers (positions in G.nodes()) of
+        affected nodes.
+
+    """
+
+    CG = dp.compile_graph(G)
+    index = {v: i for i, v in enumerate(CG['nodes'].tolist())}
+
+    changed_edges = list(changed_edges or [])
+    removed_edges = list(removed_edges or [])
+    changed_nodes = list(changed_nodes or [])
+
+    # Endpoints of all changes
+    sources = [index[v] for v in changed_nodes if v in index]
+    for u, v in changed_edges + removed_edges:
+        sources.extend(index[x] for x in (u, v) if x in index)
+
+    removed = np.array([(index[u], index[v]) for u, v in removed_edges
+                        if u in index and v in index],
+                       dtype = np.int64).reshape(-1, 2)
+
+    return _affected_positions(CG, np.asarray(sources, dtype = np.int64),
+                               removed, n, in_order)
+
+
+
+def _affected_positions(CG, sources, removed, n, in_order = False):
+
+    """ Find nodes which reach sources within n steps.
+
+    Sources are numbers of changed nodes, removed is (k, 2) ndarray with
+    numbers of endpoints of removed edges, which are also used to find
+    paths to changes. Returns sorted ndarray with numbers of nodes.
+
+    """
+
+    N = len(CG['indptr']) - 1
+
+    #===================================#
+    # Graph with removed edges restored #
+    #===================================#
+
+    src = np.repeat(np.arange(N), np.diff(CG['indptr']))
+    dst = np.asarray(CG['indices'])
+    if len(removed) > 0:
+        removed_src, removed_dst = removed[:, 0], removed[:, 1]
+        if CG['directed'] == False:
+            removed_src, removed_dst \
+            = np.concatenate([removed_src, removed_dst]), \
+              np.concatenate([removed_dst, removed_src])
+        src = np.concatenate([src, removed_src])
+        dst = np.concatenate([dst, removed_dst])
+
+    visited = np.zeros(N, dtype = bool)
+    visited[np.asarray(sources, dtype = np.int64)] = True
+
+    if in_order == True:
+        return _affected_in_order(N, src, dst, visited, n)
+
+    # Seeds reach changes along edges, so search goes backwards
+    indptr, indices, _ = dp.compiled._csr_from_edges(
+        N, dst, src, np.ones(len(src)), symmetric = False)
+
+    #======================#
+    # Breadth first search #
+    #======================#
+
+    frontier = np.flatnonzero(visited)
+
+    for hop in range(n):
+        if len(frontier) == 0:
+            break
+        starts, ends = indptr[frontier], indptr[frontier + 1]
+        lengths = ends - starts
+        positions = np.repeat(ends - np.cumsum(lengths), lengths) \
+                    + np.arange(lengths.sum())
+        neighbours = np.unique(indices[positions])
+        frontier = neighbours[~visited[neighbours]]
+        visited[frontier] = True
+
+    return np.flatnonzero(visited)
+
+
+
+def _affected_in_order(N, src, dst, reached, n):
+
+    """ Find nodes which reach nodes marked in reached within n sweeps
+    of simulation_step function.
+
+    Node processed in a step passes information to its neighbours, and
+    neighbours with higher positions pass it further in the same step,
+    others in the next step. So node x is affected in step k if some
+    neighbour y is a source, or y is affected in step k and y > x,
+    or y is affected in step k - 1. Seed is affected if it is affected
+    in step n - 1 (seed is processed in the first step).
+
+    """
+
+    # Successors of each node, edges to higher positions separately
+    indptr, indices, _ = dp.compiled._csr_from_edges(
+        N, src, dst, np.ones(len(src)), symmetric = False)
+    rows = np.repeat(np.arange(N), np.diff(indptr))
+    forward = indices > rows
+    forward_indptr = np.concatenate([[0], np.cumsum(
+        np.bincount(rows[forward], minlength = N))])
+    forward_indices = indices[forward]
+
+    def touches(marked):
+        # Nodes with some successor in marked nodes
+        hits = np.zeros(len(indices) + 1, dtype = np.int64)
+        hits[1:] = np.cumsum(marked[indices])
+        return hits[indptr[1:]] - hits[indptr[:-1]] > 0
+
+    # Sources and nodes which pass information to sources
+    affected = reached | touches(reached)
+
+    for step in range(n):
+
+        if step > 0:
+            affected = affected | touches(affected)
+
+        # Paths with increasing positions are followed backwards
+        # from higher to lower positions in one sweep
+        marked = affected.tolist()
+        for x in range(N - 1, -1, -1):
+            if marked[x] == False:
+                for y in forward_indices[forward_indptr[x]:
+                                         forward_indptr[x + 1]].tolist():
+                    if marked[y] == True:
+                        marked[x] = True
+                        break
+        affected = np.array(marked, dtype = bool)
+
+    return np.flatnonzero(affected)
+
+
+
+#=============================================================================#
+# nodes_score_incremental function #
+#==================================#
+
+def nodes_score_incremental(
+        G,
+        previous_scores, # scores before changes
+        changed_edges = None, # added edges or edges with new weights
+        changed_nodes = None, # added nodes or nodes with new attributes
+        removed_edges = None, # removed edges
+
+        n = 5, # number of simulation steps in simulation
+        sequence_len = 10, # number of simulations in one sequence
+
+        kernel = 'weights', # kernel type
+        custom_kernel = None, # custom kernel function
+        WERE_multiplier = 10,
+        oblivion = False, # information oblivion feature
+        engagement_enforcement = 1.00,
+
+        method = 'batched' # method of scores computation
+        ):
+
+    """ Update nodes information propagation capability after changes
+    of the graph.
+
+    Nodes which reach any change within n steps are scored again
+    (within n hops for batched method, with n sweeps in nodes order
+    for simulation method), previous scores are reused for other nodes.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object (or compiled graph for batched method)
+        after changes. New nodes have to be added after existing ones.
+
+    previous_scores : list
+        List with nodes' scores computed before changes, in nodes order.
+
+    changed_edges : list of tuples, optional
+        Added edges and edges with changed weights, as (u, v) pairs.
+
+    changed_nodes : list, optional
+        Added nodes and nodes with changed attributes.
+
+    removed_edges : list of tuples, optional
+        Edges removed from the graph, as (u, v) pairs.
+
+
+
+    Parameters wrapped from nodes_score_simulation function:
+    --------------------------------------------------------
+
+    n : integer
+        A number of simulation steps for a given graph.
+
+    sequence_len : integer
+        A number of simulations to perform in one sequence.
+
+    kernel : string
+        Levels: "weights", "WERE", "custom"
+
+    custom_kernel : function
+        Function which compute probability of information propagation
+        for each node in simulation step.
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    oblivion : bool, optional
+        Option which enable agents information oblivion.
+
+    engagement_enforcement : float
+        Enforcement of agent engagement by multiplier.
+        If engagement_enforcement == 1, no enforcement occurs.
+
+    method : string
+        Levels: "batched", "simulation"
+        Method used to score affected nodes, as in nodes_score_simulation
+        function. Previous scores have to be computed with the same
+        method.
+
+        * batched - synchronous steps, only nodes within n hops from
+            changes are scored again
+        * simulation - nodes are updated in place in nodes order, so
+            information may pass many hops in one step. If nodes order
+            follows the structure of the graph (e.g. graph_init
+            function), almost all nodes are scored again, as with
+            nodes_score_simulation function.
+
+
+    Returns
+    -------
+    list_solution : list
+        List with nodes information propagation capabilities.
+
+    """
+
+    # Start time measuring
+    start = time.time()
+
+    N = len(G['nodes']) if isinstance(G, dict) else len(G)
+
+    # In simulation_step nodes are updated in place in nodes order
+    affected = affected_nodes(G, changed_edges, changed_nodes,
+                              removed_edges, n,
+                              in_order = method != 'batched')
+
+    # Nodes without previous score are always scored
+    list_solution = list(previous_scores[:N]) \
+                    + [None] * max(0, N - len(previous_scores))
+    affected = np.union1d(affected,
+                          np.arange(min(len(previous_scores), N), N))
+
+    #======================#
+    # Score affected nodes #
+    #======================#
+
+    if method == 'batched':
+        scores = dp.nodes_score_batched(G, n, sequence_len, kernel,
+                                        WERE_multiplier, oblivion,
+                                        engagement_enforcement,
+                                        nodes = affected)
+
+    elif method == 'simulation':
+        nodes = list(G.nodes())
+        scores = []
+        for i in affected:
+
+            # Add 'unaware' state for all nodes
+            nx.set_node_attributes(G, 'unaware', 'state') # (G, value, key)
+
+            # Set choosen node as aware
+            G.nodes[nodes[i]]['state'] = 'aware'
+
+            # perform sequence of simulations
+            scores.append(dp.simulation_sequence(G,
+                                                 n,
+                                                 sequence_len,
+                                                 kernel,
+                                                 custom_kernel,
+                                                 WERE_multiplier,
+                                                 oblivion,
+                                                 engagement_enforcement
+                                                 ))
+
+    else:
+        raise ValueError("Method '" + str(method) + "' is not supported "
+                         "in incremental mode, use 'simulation' or "
+                         "'batched'.")
+
+    for i, score in zip(affected, scores):
+        list_solution[i] = score
+
+    print("")
+    print(len(affected), "of", N, "nodes scored again in",\
+          round(time.time() - start, 2), "seconds.")
+
+    return list_solution
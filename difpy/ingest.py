@@ -0,0 +1,301 @@
+"""
+Created on Sun Oct 18 22:51:37 2026
+
+
+    Module enables out-of-core ingestion of large edge lists in Difpy
+    package.
+
+    Edge list (CSV or Parquet file, or any iterable of tables) is read
+    in chunks. Nodes' ids are mapped to consecutive numbers, and edges
+    are spilled to bucket files on disk by range of rows (source node
+    numbers). Then each bucket is sorted and its duplicated edges are
+    merged separately (external sort), and CSR arrays are written to
+    graph directory in the format of save_graph function. So memory
+    use is bounded by chunk size, bucket size and number of nodes, not
+    by number of edges.
+
+    Loaded graph is a compiled graph with memory mapped arrays, ready
+    for batched simulation engine and add_feature function.
+
+
+    Objects
+    ----------
+    ingest_edges : function
+        A function builds graph from large edge list.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+import os
+import shutil
+import tempfile
+
+
+# Record of spilled edge
+_EDGE = np.dtype([('src', '<i8'), ('dst', '<i8'), ('weight', '<f8')])
+
+
+#=============================================================================#
+# Function for reading chunks #
+#=============================#
+
+def _read_chunks(source, columns, chunk_size, delimiter):
+
+    """ Yield dictionaries of ndarrays with chunks of source columns.
+
+    CSV files are read with pandas and Parquet files with pyarrow,
+    which are imported only when needed.
+
+    """
+
+    if isinstance(source, str) and source.endswith(('.parquet', '.pq')):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(source).iter_batches(
+                batch_size = chunk_size, columns = columns):
+            yield {k: batch.column(k).to_numpy(zero_copy_only = False)
+                   for k in columns}
+
+    elif isinstance(source, str):
+        import pandas as pd
+        for frame in pd.read_csv(source, usecols = columns,
+                                 chunksize = chunk_size, sep = delimiter):
+            yield {k: frame[k].to_numpy() for k in columns}
+
+    else:
+        for table in source:
+            table = dp.initialize._table_columns(table)
+            yield {k: np.asarray(table[k]) for k in columns}
+
+
+
+#=============================================================================#
+# Function for nodes' ids mapping #
+#=================================#
+
+def _map_ids(ids, codes, values):
+
+    """ Map values to nodes' numbers, new values get next numbers.
+
+    ids is sorted ndarray of known ids, codes holds number of each of
+    them. Returns numbers of values and updated ids and codes.
+
+    """
+
+    # Text ids are compared as str
+    if values.dtype.kind == 'O':
+        values = values.astype(str)
+
+    unique, inverse = np.unique(values, return_inverse = True)
+    if ids is None:
+        ids = unique[:0]
+        codes = np.zeros(0, dtype = np.int64)
+    if ids.dtype != unique.dtype:
+        ids = ids.astype(np.result_type(ids, unique))
+
+    position = np.searchsorted(ids, unique)
+    found = position < len(ids)
+    found[found] = ids[position[found]] == unique[found]
+
+    unique_codes = np.empty(len(unique), dtype = np.int64)
+    unique_codes[found] = codes[position[found]]
+    unique_codes[~found] = len(codes) + np.arange((~found).sum())
+
+    # Insert new ids keeping ids sorted
+    ids = np.insert(ids, position[~found], unique[~found])
+    codes = np.insert(codes, position[~found], unique_codes[~found])
+
+    return unique_codes[inverse.ravel()], ids, codes
+
+
+
+#=============================================================================#
+# ingest_edges function #
+#=======================#
+
+def ingest_edges(source, # edge list file or iterable of tables
+                 path, # directory of created graph
+                 source_column = 'source',
+                 target_column = 'target',
+                 weight_column = None, # if None, each edge has weight 1
+                 directed = False,
+                 aggregate = 'sum', # merging of duplicated edges
+                 chunk_size = 1000000, # edges read at once
+                 bucket_rows = 1000000, # nodes in one bucket
+                 delimiter = ',', # delimiter of CSV file
+                 overwrite = False,
+                 tmp_dir = None): # directory of spilled buckets
+
+    """ Build graph from edge list larger than memory.
+
+
+    Parameters
+    ----------
+
+    source : string or iterable
+        Path of CSV or Parquet (.parquet, .pq) file, or iterable of
+        tables (pandas DataFrames, Arrow tables, NumPy structured arrays
+        or dictionaries of arrays) with chunks of edge list.
+
+    path : string
+        Path of directory created for the graph, as in save_graph
+        function.
+
+    source_column, target_column : string
+        Names of columns with ids of edges' endpoints.
+
+    weight_column : string, optional
+        Name of column with edges' weights.
+
+    directed : bool, optional
+        Create directed graph.
+
+    aggregate : string, optional
+        Levels: "sum", "max", "mean", "last"
+        Method of merging weights of duplicated edges. For undirected
+        graph edges (u, v) and (v, u) are duplicates. With default
+        weights "sum" counts occurrences of edges.
+
+    chunk_size : integer, optional
+        Number of edges read at once.
+
+    bucket_rows : integer, optional
+        Number of nodes (CSR rows) in one bucket sorted in memory.
+
+    delimiter : string, optional
+        Delimiter of CSV file.
+
+    overwrite : bool, optional
+        Replace graph previously saved in path.
+
+    tmp_dir : string, optional
+        Directory for spilled buckets. If None, system temporary
+        directory is used.
+
+
+    Returns
+    -------
+    CG : dictionary
+        A compiled graph loaded with load_graph function.
+
+    """
+
+    columns = [source_column, target_column]
+    if weight_column is not None:
+        columns.append(weight_column)
+
+    graph_tmp = dp.storage._prepare_path(path, overwrite)
+    spill = tempfile.mkdtemp(prefix = 'difpy-ingest-', dir = tmp_dir)
+
+    try:
+
+        #====================================#
+        # Map ids and spill edges to buckets #
+        #====================================#
+
+        ids, codes = None, None
+        for chunk in _read_chunks(source, columns, chunk_size, delimiter):
+            size = len(chunk[source_column])
+            numbers, ids, codes = _map_ids(
+                ids, codes, np.concatenate([chunk[source_column],
+                                            chunk[target_column]]))
+
+            edges = np.empty(size, dtype = _EDGE)
+            edges['src'], edges['dst'] = numbers[:size], numbers[size:]
+            edges['weight'] = 1.0 if weight_column is None \
+                              else chunk[weight_column]
+
+            # Drop self loops, undirected edges are stored in both rows,
+            # next to each other to keep order of input for "last" merging
+            edges = edges[edges['src'] != edges['dst']]
+            if directed == False:
+                reverse = edges.copy()
+                reverse['src'], reverse['dst'] = edges['dst'], edges['src']
+                edges = np.stack([edges, reverse], axis = 1).ravel()
+
+            bucket = edges['src'] // bucket_rows
+            order = np.argsort(bucket, kind = 'stable')
+            edges, bucket = edges[order], bucket[order]
+            bounds = np.flatnonzero(np.diff(bucket)) + 1
+            for part in np.split(edges, bounds):
+                if len(part) > 0:
+                    name = 'bucket_' + str(part['src'][0] // bucket_rows)
+                    with open(os.path.join(spill, name), 'ab') as f:
+                        part.tofile(f)
+
+        N = 0 if codes is None else len(codes)
+
+        #=====================================#
+        # Sort and merge edges in each bucket #
+        #=====================================#
+
+        counts = np.zeros(N, dtype = np.int64)
+        n_buckets = -(-N // bucket_rows)
+        for b in range(n_buckets):
+            name = os.path.join(spill, 'bucket_' + str(b))
+            if not os.path.exists(name):
+                continue
+            edges = np.fromfile(name, dtype = _EDGE)
+            first = b * bucket_rows
+            key, weight = dp.compiled._merge_edges(
+                (edges['src'] - first) * N + edges['dst'],
+                edges['weight'], aggregate)
+            counts[first:first + bucket_rows] = np.bincount(
+                key // N, minlength = min(bucket_rows, N - first))
+            merged = np.empty(len(key), dtype = _EDGE)
+            merged['src'], merged['dst'] = key // N + first, key % N
+            merged['weight'] = weight
+            merged.tofile(name)
+
+        #==================#
+        # Write CSR arrays #
+        #==================#
+
+        indptr = np.zeros(N + 1, dtype = np.int64)
+        np.cumsum(counts, out = indptr[1:])
+        np.save(os.path.join(graph_tmp, 'indptr.npy'), indptr)
+
+        indices = np.lib.format.open_memmap(
+            os.path.join(graph_tmp, 'indices.npy'), mode = 'w+',
+            dtype = np.int64, shape = (int(indptr[-1]),))
+        weights = np.lib.format.open_memmap(
+            os.path.join(graph_tmp, 'weight.npy'), mode = 'w+',
+            dtype = np.float64, shape = (int(indptr[-1]),))
+        for b in range(n_buckets):
+            name = os.path.join(spill, 'bucket_' + str(b))
+            if not os.path.exists(name):
+                continue
+            edges = np.fromfile(name, dtype = _EDGE)
+            start = indptr[b * bucket_rows]
+            indices[start:start + len(edges)] = edges['dst']
+            weights[start:start + len(edges)] = edges['weight']
+        indices.flush()
+        weights.flush()
+        del indices, weights
+
+        np.save(os.path.join(graph_tmp, 'aware.npy'),
+                np.zeros(N, dtype = bool))
+
+        # Ids in order of nodes' numbers
+        nodes = np.empty(N, dtype = ids.dtype if ids is not None else int)
+        if N > 0:
+            nodes[codes] = ids
+        if nodes.dtype.kind in 'biuU':
+            np.save(os.path.join(graph_tmp, 'nodes.npy'), nodes)
+            node_names = None
+        else:
+            node_names = nodes.tolist()
+
+        dp.storage._finish_graph(graph_tmp, path, N, directed, [],
+                                 node_names)
+
+    finally:
+        shutil.rmtree(spill, ignore_errors = True)
+        shutil.rmtree(graph_tmp, ignore_errors = True)
+
+    print("Graph with", N, "nodes and",
+          int(counts.sum()) // (1 if directed else 2), "edges saved in",
+          path)
+
+    return dp.load_graph(path)
@@ -15,6 +15,9 @@ Created on Wed Nov  6 05:47:09 2019
        A function to create a graph ready for simulation purposes 
        in difpy.
 
+    graph_layout() : function
+       A function to compute positions of nodes, cached in the graph.
+
     draw_graph() : function
        A function to draw colored graph.
 
@@ -24,6 +27,10 @@ Created on Wed Nov  6 05:47:09 2019
     add_feature() : function
        A function dedicated to add existing feature to the graph 
        with optional feature scaling.     
+
+    add_features() : function
+       A function to add many nodes' features at once from a table
+       (NumPy structured array, pandas DataFrame, Arrow table).
     
     add_state_random(): function
         A function to assign "aware" or "unaware" state for nodes.    
@@ -34,9 +41,105 @@ import difpy as dp
 import networkx as nx
 import numpy as np
 import random
-import matplotlib.pyplot as plt
-from sklearn.preprocessing import MinMaxScaler
 import statistics as st
+import warnings
+import weakref
+# matplotlib is imported only by drawing functions, it is slow to import
+
+# Positions of nodes computed by graph_layout function for each graph,
+# kept outside of the graph, so they are not copied with it
+_layout_cache = weakref.WeakKeyDictionary()
+
+
+#=============================================================================#
+# Function for feature scaling #
+#==============================#
+
+def _scale_feature(feature, decimals = 6):
+
+    """ Scale feature to (0,1] range.
+
+    Values of each column are scaled to [0,1] range, rounded, and zeros
+    are filled with 0.000001 for computation purposes. Constant columns
+    are scaled to zeros (filled with 0.000001) as with min-max scaling.
+
+    """
+
+    feature = np.asarray(feature, dtype = np.float64)
+    minimum = feature.min(axis = 0)
+    spread = feature.max(axis = 0) - minimum
+    spread = np.where(spread == 0, 1, spread)
+
+    feature = np.round((feature - minimum) / spread, decimals)
+    feature[feature == 0] = 0.000001
+
+    return feature
+
+
+
+#=============================================================================#
+# Function for setting nodes' attributes #
+#========================================#
+
+def _set_node_columns(G, columns):
+
+    """ Set many nodes' attributes from arrays in one pass over nodes.
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object.
+
+    columns : dictionary
+        Dictionary with attributes' names as keys and ndarrays with
+        value for each node in order of G.nodes() as values.
+
+    """
+
+    names = list(columns.keys())
+    rows = zip(*[np.asarray(c).tolist() for c in columns.values()])
+
+    for (v, d), row in zip(G.nodes(data = True), rows):
+        d.update(zip(names, row))
+
+
+
+#=============================================================================#
+# Function for adding feature to compiled graph #
+#===============================================#
+
+def _add_compiled_feature(CG, values, feature_type):
+
+    """ Store feature in compiled graph as an array.
+
+    Weights are given for each edge in order of to_networkx function
+    and written to both CSR entries of undirected edges.
+
+    """
+
+    if feature_type == "weights":
+        indptr, indices = CG['indptr'], CG['indices']
+        N = len(indptr) - 1
+        rows = np.repeat(np.arange(N), np.diff(indptr))
+        weight = np.array(CG['weight'], dtype = np.float64)
+
+        if CG['directed'] == True:
+            weight[:] = values
+        else:
+            upper = np.flatnonzero(rows < indices)
+            weight[upper] = values
+            # Position of reversed entry of each edge
+            key = rows * N + indices
+            reverse = np.searchsorted(key, indices[upper] * N + rows[upper])
+            weight[reverse] = values
+        CG['weight'] = weight
+
+    elif feature_type == "state":
+        CG['aware'] = np.asarray(values) == 'aware'
+
+    else:
+        CG['node_attrs'][feature_type] = np.asarray(values)
 
 
 #=============================================================================#
@@ -49,8 +152,9 @@ def graph_init(n = 26, # number of nodes
                rewire_prob = 0.1, # probability of node rewrite 
                initiation_perc = 0.1, # percent of randomly informed nodes
                show_attr = True, # show node weights and attributes
-               draw_graph = True): # probability of rewrite edge 
-                                   # in random place
+               draw_graph = True, # probability of rewrite edge 
+                                  # in random place
+               layout = 'auto'): # method of computing nodes positions
     
     """ Graph initialization with watts_strogatz_graph() function. 
 
@@ -81,15 +185,20 @@ def graph_init(n = 26, # number of nodes
     draw_graph : bool, optional
         Draw graph.
 
+    layout : string, optional
+        Method of computing nodes positions, see graph_layout function.
+
 
     Returns
     -------
     G : graph
         A networkx graph object.
 
-    pos : dictionary with 2 element ndarrays as values
+    pos : dictionary with 2 element ndarrays as values, or None
        Object contains positions of nodes in the graph chart. Pos is used 
-       to draw the graph after simulation step. 
+       to draw the graph after simulation step. Positions are computed 
+       only if the graph is drawn, otherwise pos is None and positions 
+       are computed on first drawing (see graph_layout function).
        
     """    
     
@@ -99,8 +208,8 @@ def graph_init(n = 26, # number of nodes
     
     # Create basic watts-strogatz graph
     G = nx.watts_strogatz_graph(n = n, k = k, p = rewire_prob, seed=None)
-    # Compute a position of graph elements
-    pos = nx.spring_layout(G)
+    # Method of computing positions is used on first drawing
+    G.graph['layout'] = layout
 
 
     #======================#
@@ -114,23 +223,17 @@ def graph_init(n = 26, # number of nodes
     # but after generation and scaling, and filling zeros with 0.000001
     # for computation purposes
     
-    # Create ndarray of weights
-    weights = np.round(np.random.exponential(scale = 0.1, 
-        size = G.number_of_edges()), 6).reshape(G.number_of_edges(),1)
+    # Compute number of nodes and edges
+    N = G.number_of_nodes()
+    E = G.number_of_edges()
     
-    # Scale weights to [0,1] range
-    scaler = MinMaxScaler()
-    scaler.fit(weights)
-    scaled_weights = scaler.transform(weights)
-    scaled_weights = np.round(scaled_weights, 6)
-    # eliminate zeros for computation purposes
-    for (x,y), i in np.ndenumerate(scaled_weights):
-        if i == 0:
-            scaled_weights[x,y] =0.000001
+    # Create ndarray of weights scaled to (0,1] range
+    scaled_weights = _scale_feature(np.round(np.random.exponential(
+        scale = 0.1, size = E), 6))
     
     # Add weights to the graph
-    for i, (u, v) in enumerate(G.edges()):
-        G[u][v]['weight'] = scaled_weights[i,0]
+    nx.set_edge_attributes(G, dict(zip(G.edges(), scaled_weights.tolist())), 
+                           'weight')
 
     #============================#
     # Set node attribute - state #
@@ -143,8 +246,7 @@ def graph_init(n = 26, # number of nodes
     # * Aware - is the actor who internalized the information and is able 
     #   to pass it down.
     
-    nx.set_node_attributes(G, 'unaware', 'state') # (G, value, key)
-
+    state = np.full(N, 'unaware', dtype = object)
 
     #====================================#
     # Set node attribute - receptiveness #
@@ -154,23 +256,9 @@ def graph_init(n = 26, # number of nodes
     # in general the actor is receptive in context of given social network.
     # Receptiveness is randomly sampled from normal distribution.
 
-    # Create ndarray of receptiveness
-    receptiveness = np.round(np.random.normal(
-        size = G.number_of_edges()), 6).reshape(G.number_of_edges(),1)
-    
-    # Scale weights to [0,1] range
-    scaler = MinMaxScaler()
-    scaler.fit(receptiveness)
-    scaled_receptiveness = scaler.transform(receptiveness)
-    scaled_receptiveness = np.round(scaled_receptiveness, 6)
-    # eliminate zeros for computation purposes
-    for (x,y), i in np.ndenumerate(scaled_receptiveness):
-        if i == 0:
-            scaled_receptiveness[x,y] =0.000001
-
-    # Add receptiveness parameter to nodes 
-    for v in G.nodes():
-        G.nodes[v]['receptiveness'] = scaled_receptiveness[v,0]
+    # Create ndarray of receptiveness scaled to (0,1] range
+    scaled_receptiveness = _scale_feature(np.round(np.random.normal(
+        size = N), 6))
 
     #===================================#
     # Set node attribute - extraversion #
@@ -179,23 +267,9 @@ def graph_init(n = 26, # number of nodes
     # Extraversion is agent eagerness to express itself to other agents
     # Extraversion is randomly sampled from normal distribution.
 
-    # Create ndarray of extraversion
-    extraversion = np.round(np.random.normal(
-        size = G.number_of_edges()), 6).reshape(G.number_of_edges(),1)
-    
-    # Scale weights to [0,1] range
-    scaler = MinMaxScaler()
-    scaler.fit(extraversion)
-    scaled_extraversion = scaler.transform(extraversion)
-    scaled_extraversion = np.round(scaled_extraversion, 6)
-    # eliminate zeros for computation purposes
-    for (x,y), i in np.ndenumerate(scaled_extraversion):
-        if i == 0:
-            scaled_extraversion[x,y] =0.000001
-
-    # Add receptiveness parameter to nodes 
-    for v in G.nodes():
-        G.nodes[v]['extraversion'] = scaled_extraversion[v,0]
+    # Create ndarray of extraversion scaled to (0,1] range
+    scaled_extraversion = _scale_feature(np.round(np.random.normal(
+        size = N), 6))
 
     #=================================#
     # Set node attribute - engagement #
@@ -206,36 +280,28 @@ def graph_init(n = 26, # number of nodes
     # How much the information is objectivly relevant for actor. 
     # Engagement is randomly sampled from exponential distribution.
 
-    # Create ndarray of engagement
-    engagement = np.round(np.random.exponential(
-        size = G.number_of_edges()), 6).reshape(G.number_of_edges(),1)
-    
-    # Scale weights to [0,1] range
-    scaler = MinMaxScaler()
-    scaler.fit(engagement)
-    scaled_engagement = scaler.transform(engagement)
-    scaled_engagement = np.round(scaled_engagement, 6)
-    # eliminate zeros for computation purposes
-    for (x,y), i in np.ndenumerate(scaled_engagement):
-        if i == 0:
-            scaled_engagement[x,y] =0.000001
-
-    # Add receptiveness parameter to nodes 
-    for v in G.nodes():
-        G.nodes[v]['engagement'] = scaled_engagement[v,0]
+    # Create ndarray of engagement scaled to (0,1] range
+    scaled_engagement = _scale_feature(np.round(np.random.exponential(
+        size = N), 6))
     
     #===================#
     # Random initiation #
     #===================#
 
-    # Compute number of nodes
-    N = G.number_of_nodes()
-    # Return list of numbers of randomly aware agents
-    infected_agents_id = random.sample(population = range(0,N), 
-                                       k = int(N * initiation_perc))
+    # Return array of numbers of randomly aware agents
+    infected_agents_id = np.random.choice(N, size = int(N * initiation_perc), 
+                                          replace = False)
     # Set those nodes as aware
-    for v in infected_agents_id:
-        G.nodes[v]['state'] = 'aware'
+    state[infected_agents_id] = 'aware'
+    
+    #=========================#
+    # Add attributes to nodes #
+    #=========================#
+    
+    _set_node_columns(G, {'state': state,
+                          'receptiveness': scaled_receptiveness,
+                          'extraversion': scaled_extraversion,
+                          'engagement': scaled_engagement})
     
     #=======================#
     # Show nodes attributes #
@@ -247,19 +313,18 @@ def graph_init(n = 26, # number of nodes
             print(u, v)     
     
         # Check how scaled weights looks like
-        x = list(range(len(scaled_weights)))
-        scaled_weights = np.sort(scaled_weights, axis = 0)
-        # show numbered values
-        dict_0 = dict(zip(x,scaled_weights))
         print("Wages:")
-        for u, v in dict_0.items():
+        for u, v in enumerate(np.sort(scaled_weights)):
             print(u, v) 
 
     #============#
     # Draw graph #
     #============#
 
+    # Compute a position of graph elements only for drawing
+    pos = None
     if draw_graph == True:    
+        pos = dp.graph_layout(G, layout)
         dp.draw_graph(G = G, pos = pos)
     # draw_colored_graph_2
     return G, pos
@@ -268,30 +333,243 @@ def graph_init(n = 26, # number of nodes
 
 
 
+#=============================================================================#
+# Function for spectral positions of nodes #
+#==========================================#
+
+def _spectral_positions(CG, seed = None, maxiter = 200, tol = 1e-4):
+
+    """ Return (N, 2) ndarray with spectral positions of compiled graph.
+    
+    Positions are eigenvectors of the two smallest nonzero eigenvalues
+    of unweighted Laplacian matrix (edges are treated as undirected).
+    They are computed with LOBPCG method limited to maxiter iterations,
+    so the cost is bounded by O(maxiter * (N + E)) also when eigenvectors
+    do not reach the tolerance, which is enough for drawing.
+    
+    """
+    
+    import scipy.sparse as sp
+    from scipy.sparse.linalg import lobpcg
+    
+    N = len(CG['nodes'])
+    if N < 3:
+        xy = np.zeros((N, 2))
+        xy[:, 0] = np.linspace(-1, 1, N) if N > 1 else 0
+        return xy
+    
+    A = sp.csr_matrix((np.ones(len(CG['indices'])), CG['indices'], 
+                       CG['indptr']), shape = (N, N))
+    A = ((A + A.T) > 0).astype(np.float64)
+    L = sp.diags(np.asarray(A.sum(axis = 1)).ravel()) - A
+    
+    if N < 100:
+        # Small graphs are solved exactly
+        xy = np.linalg.eigh(L.toarray())[1][:, 1:3]
+    else:
+        # Constant eigenvector of zero eigenvalue is excluded by Y,
+        # unconverged eigenvectors are accepted after maxiter iterations
+        rng = np.random.default_rng(seed)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            xy = lobpcg(L.tocsr(), rng.standard_normal((N, 2)), 
+                        Y = np.ones((N, 1)), largest = False, 
+                        tol = tol, maxiter = maxiter)[1]
+    
+    # Rescale positions to [-1, 1] like networkx layouts
+    xy = xy - xy.mean(axis = 0)
+    scale = np.abs(xy).max()
+    
+    return xy / scale if scale > 0 else xy
+
+
+
+#=============================================================================#
+# Function for computing nodes positions #
+#========================================#
+
+def graph_layout(G, 
+                 layout = None, # method of computing positions
+                 seed = None): # seed of random layouts
+    
+    """ Compute positions of nodes used to draw the graph.
+    
+    Positions of networkx graph are cached for each graph object (outside
+    of the graph, so they are not copied or pickled with it). Positions 
+    of compiled graph are cached in the dictionary under 'pos' key. They 
+    are computed again only if nodes of the graph or layout are changed.
+    
+    
+    Parameters
+    ----------
+    
+    G : graph
+        A networkx graph object or compiled graph (see compile_graph 
+        function).
+    
+    layout : string, optional
+        Levels: "auto", "spring", "spectral", "random"
+        
+        * spring - force-directed layout, O(N^2) per iteration, 
+            suitable for small graphs
+        * spectral - eigenvectors of sparse Laplacian matrix computed 
+            with at most 200 LOBPCG iterations, O(N + E) per iteration, 
+            suitable for large graphs (requires scipy)
+        * random - uniformly random positions, the cheapest one
+        * auto - spring for graphs up to 1000 nodes, spectral 
+            for larger graphs
+        
+        If None, layout saved in G.graph['layout'] or "auto" is used.
+    
+    seed : integer, optional
+        Seed of random number generator for spring, spectral and 
+        random layouts.
+        
+        
+    Returns
+    -------
+    pos : dictionary with 2 element ndarrays as values or ndarray
+       Object contains positions of nodes in the graph chart. For 
+       compiled graph it is (N, 2) ndarray in order of CG['nodes'].
+       
+    """
+    
+    compiled = isinstance(G, dict)
+    if layout is None:
+        layout = 'auto' if compiled else G.graph.get('layout', 'auto')
+    
+    # Use cached positions if they fit the graph
+    if compiled:
+        N = len(G['nodes'])
+        cached_layout, pos = G.get('pos', (None, None))
+        if cached_layout == layout and len(pos) == N:
+            return pos
+    else:
+        N = G.number_of_nodes()
+        cached_layout, pos = _layout_cache.get(G, (None, None))
+        if cached_layout == layout and len(pos) == N \
+        and all(v in pos for v in G):
+            return pos
+    
+    method = layout
+    if method == 'auto':
+        method = 'spring' if N <= 1000 else 'spectral'
+    
+    if method == 'spring':
+        pos = nx.spring_layout(dp.to_networkx(G) if compiled else G, 
+                               seed = seed)
+    elif method == 'spectral':
+        pos = _spectral_positions(G if compiled else dp.compile_graph(G), 
+                                  seed)
+    elif method == 'random':
+        pos = nx.random_layout(dp.to_networkx(G) if compiled else G, 
+                               seed = seed)
+    else:
+        raise ValueError("Unknown layout '" + str(layout) + "'.")
+    
+    if compiled:
+        if isinstance(pos, dict):
+            pos = np.array([pos[v] for v in G['nodes'].tolist()], 
+                           dtype = np.float64).reshape(N, 2)
+        G['pos'] = (layout, pos)
+    else:
+        if isinstance(pos, np.ndarray):
+            pos = dict(zip(G.nodes(), pos))
+        _layout_cache[G] = (layout, pos)
+    
+    return pos
+    
+    method = layout
+    if method == 'auto':
+        method = 'spring' if G.number_of_nodes() <= 1000 else 'spectral'
+    
+    if method == 'spring':
+        pos = nx.spring_layout(G, seed = seed)
+    elif method == 'spectral':
+        pos = nx.spectral_layout(G)
+    elif method == 'random':
+        pos = nx.random_layout(G, seed = seed)
+    else:
+        raise ValueError("Unknown layout '" + str(layout) + "'.")
+    
+    _layout_cache[G] = (layout, pos)
+    
+    return pos
+
+
+
+
+
+#=============================================================================#
+# Function for arrays used in drawing #
+#=====================================#
+
+def _drawing_arrays(G, pos = None):
+
+    """ Return list of nodes, nodes' positions as (N, 2) ndarray, bool
+    ndarray with aware nodes, and ndarrays with ends of undirected edges.
+
+    """
+
+    CG = dp.compile_graph(G)
+    nodes = CG['nodes'].tolist()
+
+    # Compute positions on first drawing
+    if pos is None:
+        pos = dp.graph_layout(G if isinstance(G, nx.Graph) else CG)
+    if isinstance(pos, dict):
+        xy = np.array([pos[v] for v in nodes], dtype = np.float64)
+    else:
+        xy = np.asarray(pos, dtype = np.float64)
+    xy = xy.reshape(len(nodes), 2)
+
+    # Each undirected edge is stored twice in CSR, only one is drawn
+    src = np.repeat(np.arange(len(nodes)), np.diff(CG['indptr']))
+    dst = np.asarray(CG['indices'])
+    if CG['directed'] == False:
+        src, dst = src[src < dst], dst[src < dst]
+
+    return nodes, xy, np.asarray(CG['aware'], dtype = bool), src, dst
+
+
+
 #=============================================================================#
 # Function for drawing the graph #
 #================================#
 
 def draw_graph(G, # graph
-               pos, # position of nodes
+               pos = None, # position of nodes
                aware_color = '#f63f89',
                not_aware_color = '#58f258',
-               legend = True):
+               legend = True,
+               labels = None, # draw nodes' labels
+               max_nodes = 20000, # nodes drawn one by one
+               max_edges = 20000, # edges drawn
+               density = None, # draw density of nodes instead of nodes
+               ax = None): # matplotlib axes
     
-    """ Draw the graph G using Matplotlib and NetworkX.
+    """ Draw the graph G using Matplotlib.
 
-    Draw the graph with Matplotlib and NetworkX with two colors associated 
+    Draw the graph with Matplotlib with two colors associated 
     with 2 types of agents - aware of certain information, and unaware one.
     Legend describing nodes is optional.
     
+    Nodes are drawn with one scatter per state and edges with a single 
+    LineCollection, so drawing cost is linear in graph size. Large graphs 
+    are rasterized, random sample of max_edges edges is drawn, and with 
+    more than max_nodes nodes fraction of aware nodes is drawn on 
+    regular grid instead of single nodes.
+    
     Parameters
     ----------
     G : graph
-       A networkx graph
+       A networkx graph or compiled graph.
 
-    pos : dictionary with 2 element ndarrays as values
+    pos : dictionary with 2 element ndarrays as values, optional
        Object contains positions of nodes in the graph chart. Pos is used 
-       to draw the graph after simulation step. 
+       to draw the graph after simulation step. Ndarray in shape 
+       (<number of nodes>, 2) is accepted also. If None, positions are
+       computed with graph_layout function and cached for the graph.
 
     aware_color : string
        Specify the color of nodes aware of certain information.
@@ -302,46 +580,235 @@ def draw_graph(G, # graph
     legend : bool, optional
        Add legend to the graph which describes colored nodes.
        
+    labels : bool, optional
+       Draw nodes' labels. If None, labels are drawn for graphs up 
+       to 100 nodes.
+       
+    max_nodes : integer, optional
+       Maximal number of nodes drawn one by one.
+       
+    max_edges : integer, optional
+       Maximal number of drawn edges, other edges are skipped.
+       
+    density : bool, optional
+       Draw fraction of aware nodes on regular grid instead of nodes.
+       If None, density is drawn for graphs larger than max_nodes.
+       
+    ax : matplotlib axes, optional
+       Axes to draw the graph on. If None, current axes are used.
+       
     """
     
-    # Create variables for store nodes numbers    
-    color_map_1 = []   
-    color_map_2 = []
-    # Create list of nodes numbers which are 'aware'
-    awarelist = [i for i, d in G.nodes.data() if d['state'] == 'aware' ]
-    # Create list of nodes numbers which are not 'aware'
-    notawarelist = [i for i in range(len(G.nodes.data())) if i not in awarelist]
-    # Append strings about colors to color_map lists
-    for node in G:
-        if node in awarelist:
-            color_map_1.append(aware_color) # aware
-        else: color_map_2.append(not_aware_color) # not aware
-    # Draw the graph
-    plt.title("Graph")
-    nx.draw_networkx_nodes(G,pos = pos, nodelist = awarelist, 
-                           node_color = color_map_1, with_labels = True, 
-                           label='Aware agent', alpha = 0.7)
-    nx.draw_networkx_nodes(G,pos = pos, nodelist = notawarelist, 
-                           node_color = color_map_2, with_labels = True, 
-                           label='Not aware agent', alpha = 0.7)
-    nx.draw_networkx_labels(G, pos = pos, font_size=12, font_color='k', 
-                            font_family='sans-serif', font_weight='normal', 
-                            alpha=1.0)
-    nx.draw_networkx_edges(G,pos=pos)
-    
-    # optional legend
-    if legend == True:
-        plt.legend(numpoints = 1)
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import LinearSegmentedColormap
+    
+    nodes, xy, aware, src, dst = _drawing_arrays(G, pos)
+    N = len(xy)
+    
+    if ax is None:
+        ax = plt.gca()
+    if labels is None:
+        labels = N <= 100
+    if density is None:
+        density = N > max_nodes
+    # Vector graphics are too heavy for large graphs
+    rasterized = N > max_nodes or len(src) > max_edges
+    
+    #============#
+    # Draw edges #
+    #============#
+    
+    if len(src) > max_edges:
+        chosen = np.random.default_rng(0).choice(len(src), max_edges, 
+                                                 replace = False)
+        src, dst = src[chosen], dst[chosen]
+    
+    segments = np.stack([xy[src], xy[dst]], axis = 1)
+    ax.add_collection(LineCollection(segments, colors = 'k', 
+                                     linewidths = 1.0 if N <= 1000 else 0.1,
+                                     alpha = 1.0 if N <= 1000 else 0.2,
+                                     zorder = 3 if density else 1,
+                                     rasterized = rasterized))
+    
+    #============#
+    # Draw nodes #
+    #============#
+    
+    if density == True:
+        # Fraction of aware nodes in cells of regular grid
+        bins = 200
+        extent = [xy[:, 0].min(), xy[:, 0].max(), 
+                  xy[:, 1].min(), xy[:, 1].max()]
+        counts, _, _ = np.histogram2d(xy[:, 0], xy[:, 1], bins = bins, 
+                                      range = [extent[:2], extent[2:]])
+        aware_counts, _, _ = np.histogram2d(xy[aware, 0], xy[aware, 1], 
+                                            bins = bins, 
+                                            range = [extent[:2], extent[2:]])
+        fraction = np.full(counts.shape, np.nan)
+        np.divide(aware_counts, counts, out = fraction, where = counts > 0)
+        
+        colormap = LinearSegmentedColormap.from_list(
+            'awareness', [not_aware_color, aware_color])
+        image = ax.imshow(fraction.T, origin = 'lower', extent = extent,
+                          cmap = colormap, vmin = 0, vmax = 1, 
+                          aspect = 'auto', interpolation = 'nearest',
+                          zorder = 2)
+        if legend == True:
+            plt.colorbar(image, ax = ax, label = 'Aware agents fraction')
+    
+    else:
+        size = 300 if N <= 1000 else max(1, 300000 / N)
+        ax.scatter(xy[aware, 0], xy[aware, 1], s = size, c = aware_color,
+                   label = 'Aware agent', alpha = 0.7, zorder = 2,
+                   rasterized = rasterized)
+        ax.scatter(xy[~aware, 0], xy[~aware, 1], s = size, 
+                   c = not_aware_color, label = 'Not aware agent', 
+                   alpha = 0.7, zorder = 2, rasterized = rasterized)
+        if legend == True:
+            ax.legend(numpoints = 1)
+    
+    if labels == True:
+        for v, (x, y) in zip(nodes, xy):
+            ax.text(x, y, str(v), fontsize = 12, color = 'k', 
+                    ha = 'center', va = 'center', zorder = 3)
+    
+    ax.set_title("Graph")
+    ax.autoscale_view()
+    ax.set_xticks([])
+    ax.set_yticks([])
     
 
 
 
+#=============================================================================#
+# Functions for approximate graph statistics #
+#============================================#
+
+def _summary(values, bins = 20):
+
+    """ Return dictionary with mean, standard deviation, quantiles and
+    histogram (counts, bin edges) of values.
+
+    """
+
+    values = np.asarray(values, dtype = np.float64)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {'count': 0}
+
+    q = [0, 0.01, 0.25, 0.5, 0.75, 0.99, 1]
+    counts, bin_edges = np.histogram(values, bins = bins)
+
+    return {'count': len(values),
+            'mean': float(values.mean()),
+            'std': float(values.std()),
+            'quantiles': dict(zip(q, np.quantile(values, q).tolist())),
+            'histogram': (counts.tolist(), bin_edges.tolist())}
+
+
+
+def _closed_wedges(indptr, indices, centers, rng):
+
+    """ Sample one wedge (pair of distinct neighbours) for each center 
+    and return bool ndarray, True if the wedge is closed by an edge.
+    Centers need to have at least 2 neighbours.
+
+    """
+
+    N = len(indptr) - 1
+    degree = indptr[centers + 1] - indptr[centers]
+
+    # Two distinct positions in the neighbourhood
+    first = (rng.random(len(centers)) * degree).astype(np.int64)
+    second = (rng.random(len(centers)) * (degree - 1)).astype(np.int64)
+    second += second >= first
+    u = indices[indptr[centers] + first].astype(np.int64)
+    v = indices[indptr[centers] + second].astype(np.int64)
+
+    # Edges are sorted by (row, column), so edge (u, v) is found 
+    # with binary search
+    keys = np.repeat(np.arange(N, dtype = np.int64), 
+                     np.diff(indptr)) * N + indices
+    found = np.searchsorted(keys, u * N + v)
+    found = np.minimum(found, len(keys) - 1)
+
+    return keys[found] == u * N + v
+
+
+
+def _approximate_stats(G, samples, confidence, seed):
+
+    """ Compute graph statistics from arrays, with clustering 
+    coefficient and transitivity estimated by wedge sampling.
+
+    """
+
+    CG = dp.compile_graph(G)
+    N = len(CG['indptr']) - 1
+    indptr, indices = CG['indptr'], CG['indices']
+    edges = len(indices) if CG['directed'] else len(indices) // 2
+
+    # Clustering is defined for undirected graph
+    if CG['directed'] == True:
+        src = np.repeat(np.arange(N), np.diff(indptr))
+        indptr, indices, _ = dp.compiled._csr_from_edges(
+            N, src, indices, np.ones(len(src)))
+
+    rng = np.random.default_rng(seed)
+    degree = np.diff(indptr)
+    wedges = degree * (degree - 1) / 2.0
+
+    # Average clustering: closed random wedge of random node, 
+    # nodes with degree below 2 have coefficient 0
+    nodes = rng.integers(0, N, size = samples)
+    nodes = nodes[degree[nodes] >= 2]
+    avg_clustering_coef = _closed_wedges(indptr, indices, nodes, 
+                                         rng).sum() / samples
+
+    # Transitivity: closed wedge chosen uniformly from all wedges
+    if wedges.sum() > 0:
+        centers = rng.choice(N, size = samples, p = wedges / wedges.sum())
+        transitivity = _closed_wedges(indptr, indices, centers, rng).mean()
+    else:
+        transitivity = 0.0
+
+    # Hoeffding bound of both estimates
+    error = np.sqrt(np.log(2 / (1 - confidence)) / (2 * samples))
+
+    out_degree = np.diff(CG['indptr'])
+    weight = CG['weight'] if CG['directed'] \
+             else CG['weight'][np.repeat(np.arange(N), out_degree) 
+                               < CG['indices']]
+
+    return {'nodes': N,
+            'edges': edges,
+            'mean node degree': float(out_degree.mean()) if N else 0.0,
+            'average clustering coefficient': round(float(
+                avg_clustering_coef), 4),
+            'average clustering coefficient error': round(float(error), 4),
+            'transitivity': round(float(transitivity), 4),
+            'transitivity error': round(float(error), 4),
+            'confidence': confidence,
+            'degree': _summary(out_degree),
+            'weight': _summary(weight),
+            'attributes': {k: _summary(v) 
+                           for k, v in CG['node_attrs'].items()
+                           if np.asarray(v).dtype.kind in 'biuf'},
+            'aware': int(np.sum(CG['aware']))}
+
+
+
 #=============================================================================#
 # Function for graph review #
 #===========================# 
 
-def graph_stats(G, pos, draw_degree = True, show_attr = True, 
-                draw_graph = True):
+def graph_stats(G, pos = None, draw_degree = True, show_attr = True, 
+                draw_graph = True, 
+                approximate = False, # estimate statistics by sampling
+                samples = 100000, # number of sampled wedges
+                confidence = 0.95, # confidence of estimates' error
+                seed = None): # seed of random number generator
 
     """ 
     Function for checking basic graph statistics, node attributes and
@@ -366,6 +833,23 @@ def graph_stats(G, pos, draw_degree = True, show_attr = True,
     draw_graph : bool
         Draw graph.
         
+    approximate : bool, optional
+        Compute statistics from arrays for very large graphs. Average 
+        clustering coefficient and transitivity are estimated by wedge 
+        sampling, with error bound from Hoeffding inequality. Summaries 
+        (quantiles, histograms) of degrees, weights and nodes' attributes
+        are returned instead of printing each node and weight. G may be 
+        a compiled graph in this mode.
+        
+    samples : integer, optional
+        Number of wedges sampled for each estimate.
+        
+    confidence : float, optional
+        Probability that estimates are within returned error.
+        
+    seed : integer, optional
+        Seed of random number generator.
+        
     Returns
     -------
     
@@ -374,6 +858,11 @@ def graph_stats(G, pos, draw_degree = True, show_attr = True,
        
     """    
     
+    if approximate == True:
+        return _graph_stats_approximate(G, pos, draw_degree, show_attr, 
+                                        draw_graph, samples, confidence, 
+                                        seed)
+    
     #===============================#
     # Compute basic graph satistics #
     #===============================# 
@@ -433,6 +922,8 @@ def graph_stats(G, pos, draw_degree = True, show_attr = True,
     #==========================#
     
     if draw_degree == True:
+        import matplotlib.pyplot as plt
+        
         # degree distribution
         degree_distribution = sorted([v for k,v in nx.degree(G)], reverse = True)
         x = range(len(degree_distribution))    
@@ -448,9 +939,70 @@ def graph_stats(G, pos, draw_degree = True, show_attr = True,
     #============#
     
     if draw_graph == True:    
+        import matplotlib.pyplot as plt
         fig_01, ax_01 = plt.subplots() # enable to plot one by one
                                        # in separate windows
         dp.draw_graph(G = G, pos = pos)
+    
+    return dict_stat
+
+
+
+def _graph_stats_approximate(G, pos, draw_degree, show_attr, draw_graph, 
+                             samples, confidence, seed):
+
+    """ Approximate mode of graph_stats function. """
+    
+    dict_stat = _approximate_stats(G, samples, confidence, seed)
+    
+    print('\n' + "General information:" + '\n')
+    for k in ['nodes', 'edges', 'mean node degree', 
+              'average clustering coefficient', 'transitivity']:
+        if k + ' error' in dict_stat:
+            print(k,': ', dict_stat[k], '+/-', dict_stat[k + ' error'])
+        else:
+            print(k,': ', dict_stat[k])
+    
+    #==============================#
+    # Show summaries of attributes #
+    #==============================#
+    
+    if show_attr == True:
+        summaries = [('degree', dict_stat['degree']), 
+                     ('weight', dict_stat['weight'])] \
+                    + list(dict_stat['attributes'].items())
+        print('\n' + "Quantiles of degrees, weights and attributes:" + '\n')
+        for k, summary in summaries:
+            if summary['count'] > 0:
+                print(k, {q: round(v, 4) 
+                          for q, v in summary['quantiles'].items()})
+    
+    #===============================#
+    # Degree distribution histogram #
+    #===============================#
+    
+    if draw_degree == True:
+        import matplotlib.pyplot as plt
+        
+        counts, bin_edges = dict_stat['degree']['histogram']
+        fig_01, ax_01 = plt.subplots() # enable to plot one by one
+        plt.stairs(counts, bin_edges, fill = True, color = 'blue', 
+                   alpha = 0.5)
+        plt.ylabel('Number of nodes');
+        plt.xlabel('Node degree');
+        plt.suptitle('Nodes degree distribution', fontsize=16)
+    
+    #============#
+    # Draw graph #
+    #============#
+    
+    if draw_graph == True:    
+        import matplotlib.pyplot as plt
+        fig_01, ax_01 = plt.subplots() # enable to plot one by one
+                                       # in separate windows
+        dp.draw_graph(G = G, pos = pos)
+    
+    return dict_stat
 
 
 
@@ -460,7 +1012,7 @@ def graph_stats(G, pos, draw_degree = True, show_attr = True,
 #========================================# 
 
 def add_feature(G,
-                pos,
+                pos = None,
                 feature = None,
                 feature_type = None,
                 scaling = True,
@@ -478,14 +1030,16 @@ def add_feature(G,
     ----------
     
     G : graph
-        A networkx graph object.
+        A networkx graph object or compiled graph. Feature is stored
+        in compiled graph as an array, without showing and drawing.
     
     pos : dictionary with 2 element ndarrays as values
        Object contains positions of nodes in the graph chart. Pos is used 
        to draw the graph after simulation step. 
 
     feature : ndarray
-       ndarray in shape (<number of nodes/edges>, 1).
+       ndarray in shape (<number of nodes/edges>, 1). For compiled graph
+       weights are given for each edge in order of to_networkx function.
 
     feature_type : string
         Levels: "weights", "receptiveness", "extraversion", "engagement",
@@ -521,16 +1075,21 @@ def add_feature(G,
     # Only for numeric variables
     if scaling == True:
     
-        # Scale weights to [0,1] range
-        scaler = MinMaxScaler()
-        scaler.fit(feature)
-        feature = scaler.transform(feature)
-        feature = np.round(feature, decimals)
-        # eliminate zeros for computation purposes
-        for (x,y), i in np.ndenumerate(feature):
-            if i == 0:
-                feature[x,y] =0.000001
-                
+        # Scale feature to (0,1] range
+        feature = _scale_feature(np.asarray(feature, dtype = np.float64), 
+                                 decimals)
+    
+    feature = np.asarray(feature)
+    if feature.ndim == 1:
+        feature = feature.reshape(-1, 1)
+    
+    #========================================#
+    # Add feature to compiled graph as array #
+    #========================================#
+    
+    if isinstance(G, dict):
+        _add_compiled_feature(G, feature[:, 0], feature_type)
+        return G
     
     #======================#
     # Add weights to graph #
@@ -541,79 +1100,37 @@ def add_feature(G,
     if feature_type == "weights":
     
         # Add weights to the graph
-        for i, (u, v) in enumerate(G.edges()):
-            G[u][v]['weight'] = feature[i,0]
-
-    #====================================#
-    # Set node attribute - receptiveness #
-    #====================================#
-    
-    # Receptiveness - general parameter of each node, expressing how much 
-    # in general the actor is receptive in context of given social network.
- 
-
-    if feature_type == "receptiveness":
-
-        # Add receptiveness parameter to nodes 
-        for v in G.nodes():
-            G.nodes[v]['receptiveness'] = feature[v,0]
-
-
-    #===================================#
-    # Set node attribute - extraversion #
-    #===================================#
-
-    # Extraversion is agent eagerness to express itself to other agents.
-
-
-    if feature_type == "extraversion":
-
-        # Add extraversion parameter to nodes 
-        for v in G.nodes():
-            G.nodes[v]['extraversion'] = feature[v,0]
-
-    #=================================#
-    # Set node attribute - engagement #
-    #=================================#
-
-    # Engagement - engagement with the information related topic, 
-    # strengthness of the experiences connected with information topic.
-    # How much the information is objectivly relevant for actor.
-
-
-    if feature_type == "engagement":
-
-        # Add engagement parameter to nodes 
-        for v in G.nodes():
-            G.nodes[v]['engagement'] = feature[v,0]
-    
-
-    #============================#
-    # Set node attribute - state #
-    #============================#
-    
-    # "State" Variable levels:
-    # * Unaware - is actor who did not internalized the information and 
-    #   is not able to pass it down.
-    # * Aware - is the actor who internalized the information and is able 
-    #   to pass it down.
-
-    if feature_type == "state":
-
-        # Add engagement parameter to nodes 
-        for v in G.nodes():
-            G.nodes[v]['state'] = feature[v,0]
-
-    #=======================================#
-    # Set node attribute - custom parameter #
-    #=======================================#
-    
-    if feature_type not in ["weights", "receptiveness", "extraversion", 
-                            "engagement", "state"]:
+        nx.set_edge_attributes(G, dict(zip(G.edges(), feature[:, 0].tolist())), 
+                               'weight')
+
+    #=====================#
+    # Set node attributes #
+    #=====================#
+    
+    # Levels of node attributes:
+    # * Receptiveness - general parameter of each node, expressing how much 
+    #   in general the actor is receptive in context of given social 
+    #   network.
+    # * Extraversion is agent eagerness to express itself to other agents.
+    # * Engagement - engagement with the information related topic, 
+    #   strengthness of the experiences connected with information topic.
+    #   How much the information is objectivly relevant for actor.
+    # * "State" - Unaware is actor who did not internalized the information
+    #   and is not able to pass it down. Aware is the actor who internalized 
+    #   the information and is able to pass it down.
+    # * custom parameter
+    
+    else:
+        
+        # Row of feature for each node (node number for integer names)
+        nodes = np.asarray(list(G.nodes()))
+        if nodes.dtype.kind in 'iu':
+            values = feature[nodes, 0]
+        else:
+            values = feature[:len(nodes), 0]
         
         # Add parameter to nodes 
-        for v in G.nodes():
-            G.nodes[v][feature_type] = feature[v,0]
+        _set_node_columns(G, {feature_type: values})
     
     #========================#
     # Show nodes' attributes #
@@ -650,6 +1167,165 @@ def add_feature(G,
 
 
 
+#=============================================================================#
+# Function for adding many features to a graph #
+#==============================================# 
+
+def _table_columns(table):
+
+    """ Return dictionary of ndarrays with columns of a table.
+
+    Table may be NumPy structured array, pandas DataFrame, Arrow table
+    or dictionary of arrays. Optional libraries are not imported.
+
+    """
+
+    # NumPy structured array
+    if isinstance(table, np.ndarray) and table.dtype.names is not None:
+        return {name: table[name] for name in table.dtype.names}
+
+    # Arrow table
+    if hasattr(table, 'column_names') and hasattr(table, 'column'):
+        return {name: table.column(name).to_numpy() 
+                for name in table.column_names}
+
+    # pandas DataFrame
+    if hasattr(table, 'columns') and hasattr(table, 'to_numpy'):
+        return {name: table[name].to_numpy() for name in table.columns}
+
+    # Dictionary of arrays
+    if isinstance(table, dict):
+        return {name: np.asarray(column) for name, column in table.items()}
+
+    raise TypeError("Table has to be NumPy structured array, pandas "
+                    "DataFrame, Arrow table or dictionary of arrays.")
+
+
+
+def add_features(G,
+                 table, # table with features in columns
+                 id_column = None, # column with nodes' names
+                 columns = None, # names of columns to add
+                 scaling = True,
+                 decimals = 6):
+    
+    """ Add many nodes' features to the graph at once.
+    
+    Rows of the table are matched with nodes by nodes' names with 
+    vectorized lookup, so loading tables with many features and 
+    millions of rows takes one call.
+    
+    
+    Parameters
+    ----------
+    
+    G : graph
+        A networkx graph object or compiled graph. In compiled graph 
+        features are stored as typed arrays in G['node_attrs'].
+    
+    table : structured ndarray, DataFrame, Arrow table or dictionary
+        Table with features in columns.
+    
+    id_column : string, optional
+        Name of the column with nodes' names. If None, index of 
+        DataFrame is used, and for other tables rows are matched 
+        with nodes in order of G.nodes().
+    
+    columns : list of strings, optional
+        Names of columns to add. If None, all columns except id_column
+        are added.
+        
+    scaling : bool, optional
+        Scale numeric features to (0,1] range.
+    
+    decimals : integer, optional
+        Number of decimal digits due to rounding features.
+    
+    
+    Returns
+    -------
+    G : graph
+        A networkx graph object or compiled graph.
+    
+    """
+    
+    table_columns = _table_columns(table)
+    
+    #=============================#
+    # Match table rows with nodes #
+    #=============================#
+    
+    if isinstance(G, dict):
+        nodes = dp.compiled._node_array(G['nodes'])
+    else:
+        nodes = dp.compiled._node_array(G.nodes())
+    N = len(nodes)
+    
+    if id_column is not None:
+        ids = np.asarray(table_columns[id_column])
+    elif hasattr(table, 'index') and hasattr(table, 'columns'):
+        ids = np.asarray(table.index)
+    else:
+        ids = None
+    
+    if ids is None:
+        rows = np.arange(len(next(iter(table_columns.values()))))
+    else:
+        # Vectorized lookup of nodes' numbers in sorted names
+        sorter = np.argsort(nodes, kind = 'stable')
+        position = np.searchsorted(nodes[sorter], ids)
+        position = np.minimum(position, N - 1)
+        found = nodes[sorter][position] == ids
+        if not found.all():
+            raise ValueError(str((~found).sum()) + " ids in the table are "
+                             "not names of nodes in the graph.")
+        rows = sorter[position]
+    
+    if columns is None:
+        columns = [c for c in table_columns if c != id_column]
+    
+    #======================#
+    # Create typed columns #
+    #======================#
+    
+    # Nodes without row in the table get empty values
+    covered = np.zeros(N, dtype = bool)
+    covered[rows] = True
+    complete = covered.all()
+    
+    new_columns = {}
+    for name in columns:
+        values = np.asarray(table_columns[name])
+        
+        # Only numeric features are scaled, type is kept if possible
+        if values.dtype.kind in 'biuf':
+            if scaling == True:
+                values = _scale_feature(values, decimals)
+            if complete:
+                column = np.empty(N, dtype = values.dtype)
+            else:
+                column = np.full(N, np.nan, 
+                                 dtype = np.result_type(values, np.float64))
+        else:
+            column = np.empty(N, dtype = object)
+        column[rows] = values
+        new_columns[name] = column
+    
+    #===============#
+    # Store columns #
+    #===============#
+    
+    # Columns are nodes' features, also when named 'weights' or 'state'
+    if isinstance(G, dict):
+        G['node_attrs'].update(new_columns)
+    else:
+        _set_node_columns(G, new_columns)
+    
+    return G
+
+
+
+
 #=============================================================================#
 # Function for adding random state to graph #
 #===========================================#
@@ -718,6 +1394,7 @@ def add_state_random(G, pos, initiation_perc, show_attr = True,
     #============#
     
     if draw_graph == True:    
+        import matplotlib.pyplot as plt
         fig_01, ax_01 = plt.subplots() # enable to plot one by one
                                        # in separate windows
         dp.draw_graph(G = G, pos = pos)
@@ -0,0 +1,161 @@
+"""
+Created on Mon Oct 19 03:52:41 2026
+
+
+    Module enables profiling of simulations in Difpy package.
+
+    Instrumentation object passed to simulation_step, simulation or
+    simulation_sequence collects timers of phases (in seconds) and
+    counters of events for each step and each replica (simulation of
+    a sequence):
+
+        * step timers - oblivion, kernel, rng (drawing numbers for
+          transmission attempts), recording
+        * step counters - edges_examined, transmission_attempts,
+          successes, oblivion_events, bytes_recorded (to trajectory
+          store, or size of pickled graph_list record)
+        * replica timers - deepcopy, recording of the initial step
+
+    Instrumentation is off by default (instrumentation = None), and then
+    functions only check one flag, timers and counters are not updated.
+
+
+    Objects
+    ----------
+    Instrumentation : class
+        A class collects timers and counters of simulations.
+
+
+"""
+
+import contextlib
+import json
+import time
+
+
+#=============================================================================#
+# Instrumentation class #
+#=======================#
+
+class Instrumentation:
+
+    """ Timers and counters of simulation phases.
+
+    Records are kept in replicas attribute - list of dictionaries with
+    'timers', 'counters' and 'steps' (list of dictionaries with 'timers'
+    and 'counters').
+
+    """
+
+    def __init__(self):
+
+        self.replicas = []
+
+
+    def start_replica(self):
+
+        """ Start record of a new simulation. """
+
+        self.replicas.append({'timers': {}, 'counters': {}, 'steps': []})
+
+
+    def _record(self, level):
+
+        if not self.replicas:
+            self.start_replica()
+        replica = self.replicas[-1]
+        if level == 'replica':
+            return replica
+        if not replica['steps']:
+            self.add_step()
+        return replica['steps'][-1]
+
+
+    def add_step(self, timers = None, counters = None):
+
+        """ Start record of a new step with given timers and counters. """
+
+        if not self.replicas:
+            self.start_replica()
+        self.replicas[-1]['steps'].append({'timers': dict(timers or {}),
+                                           'counters': dict(counters or {})})
+
+
+    def add(self, timers = None, counters = None, level = 'step'):
+
+        """ Add values of timers and counters to the last step
+        (level = 'step') or to the last replica (level = 'replica').
+
+        """
+
+        record = self._record(level)
+        for kind, values in (('timers', timers), ('counters', counters)):
+            for name, value in (values or {}).items():
+                record[kind][name] = record[kind].get(name, 0) + value
+
+
+    @contextlib.contextmanager
+    def timer(self, name, level = 'step'):
+
+        """ Context manager adding its duration to timer name. """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(timers = {name: time.perf_counter() - start},
+                     level = level)
+
+
+    def totals(self):
+
+        """ Return dictionary with timers and counters summed over all
+        replicas and steps.
+
+        """
+
+        totals = {'timers': {}, 'counters': {}}
+        records = [r for replica in self.replicas
+                   for r in [replica] + replica['steps']]
+        for record in records:
+            for kind in ('timers', 'counters'):
+                for name, value in record[kind].items():
+                    totals[kind][name] = totals[kind].get(name, 0) + value
+
+        return totals
+
+
+    def to_dict(self):
+
+        """ Return dictionary with totals and records of replicas. """
+
+        return {'totals': self.totals(), 'replicas': self.replicas}
+
+
+    def to_json(self, path = None):
+
+        """ Return records as JSON string, and write it to path if given. """
+
+        text = json.dumps(self.to_dict(), indent = 2)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text)
+
+        return text
+
+
+
+#=============================================================================#
+# Function for optional timers #
+#==============================#
+
+def _timer(instrumentation, name, level = 'step'):
+
+    """ Return timer of instrumentation, or empty context manager if
+    instrumentation is None.
+
+    """
+
+    if instrumentation is None:
+        return contextlib.nullcontext()
+    return instrumentation.timer(name, level)
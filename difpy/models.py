@@ -0,0 +1,337 @@
+"""
+Created on Mon Oct 19 02:21:37 2026
+
+
+    Module enables simulations of diffusion models other than
+    aware/unaware model in Difpy package.
+
+    Diffusion model is declared once as a set of states and transitions
+    between them, and is run by vectorized engine on compiled graph for
+    many simulations at once (as (simulations x nodes) matrix of states'
+    numbers). Transitions have one of kinds:
+
+        * contact - node changes state with probability of receiving
+          information from neighbours in infectious states, computed
+          with weights or WERE kernel (as in simulation_batch function),
+        * spontaneous - node changes state with fixed probability,
+        * threshold - node changes state when sum of weights of edges
+          from infectious neighbours reaches its threshold.
+
+    Transitions are evaluated for states at the beginning of a step, and
+    each node makes at most one transition in a step - the first one
+    declared which succeeds.
+
+
+    Objects
+    ----------
+    DiffusionModel : class
+        A class declares states and transitions of diffusion model.
+
+
+    si_model : function
+        A function returns susceptible-infected model.
+
+
+    sir_model : function
+        A function returns susceptible-infected-recovered model.
+
+
+    sis_model : function
+        A function returns susceptible-infected-susceptible model.
+
+
+    linear_threshold_model : function
+        A function returns linear threshold model.
+
+
+    model_simulation : function
+        A function performs simulations of diffusion model.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+
+
+#=============================================================================#
+# DiffusionModel class #
+#======================#
+
+class DiffusionModel:
+
+    """ Declaration of states and transitions of diffusion model.
+
+
+    Parameters
+    ----------
+
+    states : list of strings
+        Names of states. The first state is initial state of nodes
+        which are not aware in the graph.
+
+    infectious : list of strings
+        States of nodes which pass information to neighbours.
+
+    seed_state : string, optional
+        Initial state of nodes which are aware in the graph. If None,
+        the first of infectious states is used.
+
+    thresholds : string or ndarray, optional
+        Thresholds of nodes for threshold transitions: name of node
+        attribute or ndarray. If None, thresholds are drawn uniformly
+        from (0, 1) for each simulation.
+
+    """
+
+    def __init__(self, states, infectious, seed_state = None,
+                 thresholds = None):
+
+        self.states = list(states)
+        self.infectious = list(infectious)
+        self.seed_state = self.infectious[0] if seed_state is None \
+                          else seed_state
+        self.thresholds = thresholds
+        self.transitions = []
+
+
+    def add_transition(self, source, target, kind = 'contact', rate = 1.0):
+
+        """ Declare transition between states.
+
+
+        Parameters
+        ----------
+
+        source, target : string
+            Names of states.
+
+        kind : string
+            Levels: "contact", "spontaneous", "threshold"
+
+        rate : float, optional
+            Probability of spontaneous transition, or multiplier of
+            kernel probabilities for contact transition.
+
+
+        Returns
+        -------
+        model : DiffusionModel
+            The same model, so declarations may be chained.
+
+        """
+
+        if kind not in ('contact', 'spontaneous', 'threshold'):
+            raise ValueError("Transition kind '" + str(kind) + "' is not "
+                             "supported, use 'contact', 'spontaneous' or "
+                             "'threshold'.")
+        for state in (source, target):
+            if state not in self.states:
+                raise ValueError("State '" + str(state) + "' is not "
+                                 "declared in the model.")
+
+        self.transitions.append({'source': source, 'target': target,
+                                 'kind': kind, 'rate': rate})
+
+        return self
+
+
+    def codes(self, states):
+
+        """ Return int8 ndarray with numbers of states' names. """
+
+        lookup = {name: i for i, name in enumerate(self.states)}
+        return np.vectorize(lookup.__getitem__, otypes = [np.int8])(states)
+
+
+
+#=============================================================================#
+# Predefined models #
+#===================#
+
+def si_model():
+
+    """ Return susceptible-infected model - aware/unaware model without
+    oblivion.
+
+    """
+
+    return DiffusionModel(['susceptible', 'infected'], ['infected']) \
+           .add_transition('susceptible', 'infected')
+
+
+
+def sir_model(recovery = 0.1):
+
+    """ Return susceptible-infected-recovered model, where infected
+    nodes recover with probability recovery in each step.
+
+    """
+
+    return DiffusionModel(['susceptible', 'infected', 'recovered'],
+                          ['infected']) \
+           .add_transition('susceptible', 'infected') \
+           .add_transition('infected', 'recovered', 'spontaneous', recovery)
+
+
+
+def sis_model(recovery = 0.1):
+
+    """ Return susceptible-infected-susceptible model, where infected
+    nodes become susceptible again with probability recovery in each
+    step.
+
+    """
+
+    return DiffusionModel(['susceptible', 'infected'], ['infected']) \
+           .add_transition('susceptible', 'infected') \
+           .add_transition('infected', 'susceptible', 'spontaneous',
+                           recovery)
+
+
+
+def linear_threshold_model(thresholds = None):
+
+    """ Return linear threshold model, where inactive node becomes
+    active when sum of weights of edges from active neighbours reaches
+    its threshold (see DiffusionModel for thresholds).
+
+    """
+
+    return DiffusionModel(['inactive', 'active'], ['active'],
+                          thresholds = thresholds) \
+           .add_transition('inactive', 'active', 'threshold')
+
+
+
+#=============================================================================#
+# Function for model simulation #
+#===============================#
+
+def model_simulation(G,
+                     model,
+                     S = None, # initial states of nodes
+                     n = 5, # number of simulation steps
+
+                     kernel = 'weights', # kernel type
+                     WERE_multiplier = 10,
+                     simulations = 1): # number of simulations if S is None
+
+    """ Perform simulations of diffusion model.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph.
+
+    model : DiffusionModel
+        Declaration of the model, e.g. from sir_model function.
+
+    S : ndarray, optional
+        Ndarray in shape (<number of simulations>, <number of nodes>)
+        with names or numbers of initial states. If None, aware nodes
+        of G start in seed state of the model and other nodes in its
+        first state.
+
+    n : integer
+        number of simulation steps.
+
+    kernel : string
+        Levels: "weights", "WERE"
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    simulations : integer, optional
+        Number of simulations, used when S is None.
+
+
+    Returns
+    -------
+    S : ndarray
+        Int8 ndarray with numbers of nodes' states (positions in
+        model.states) after simulations.
+
+    history : ndarray
+        Ndarray in shape (<n + 1>, <number of simulations>, <number of
+        states>) with number of nodes in each state before the first
+        and after each step.
+
+    """
+
+    CG = dp.compile_graph(G)
+    indptr, indices, weight = CG['indptr'], CG['indices'], CG['weight']
+    if CG['directed'] == True:
+        indptr, indices, weight = dp.compiled._reverse_csr(indptr, indices,
+                                                           weight)
+    CG_in = dict(CG, indptr = indptr, indices = indices, weight = weight)
+    N = len(indptr) - 1
+
+    #================#
+    # Initial states #
+    #================#
+
+    if S is None:
+        S = np.where(CG['aware'], model.seed_state, model.states[0])
+        S = np.tile(S, (simulations, 1))
+    S = np.asarray(S)
+    S = model.codes(S) if S.dtype.kind in 'OUS' \
+        else np.array(S, dtype = np.int8)
+    B = S.shape[0]
+    K = len(model.states)
+
+    infectious = model.codes(model.infectious)
+    kinds = set(t['kind'] for t in model.transitions)
+
+    if 'contact' in kinds:
+        prob = dp.engine._edge_probabilities(CG_in, kernel, WERE_multiplier)
+    if 'threshold' in kinds:
+        if model.thresholds is None:
+            thresholds = np.random.random((B, N))
+        elif isinstance(model.thresholds, str):
+            thresholds = np.asarray(CG['node_attrs'][model.thresholds])
+        else:
+            thresholds = np.asarray(model.thresholds)
+
+    def counts(S):
+        return np.stack([np.bincount(s, minlength = K) for s in S])
+
+    history = [counts(S)]
+
+    for step in range(n):
+
+        senders = np.isin(S, infectious)[:, indices]
+        S_next = S.copy()
+        moved = np.zeros((B, N), dtype = bool)
+
+        for t in model.transitions:
+
+            candidates = (S == model.states.index(t['source'])) & ~moved
+            if not candidates.any():
+                continue
+
+            #========#
+            # Kernel #
+            #========#
+
+            if t['kind'] == 'contact':
+                log_fail = np.log1p(-np.clip(prob * t['rate'], 0, 1 - 1e-12))
+                p = 1 - np.exp(dp.engine._neighbour_sum(
+                    np.where(senders, log_fail[None, :], 0.0), indptr))
+                hit = candidates & (np.random.random((B, N)) < p)
+            elif t['kind'] == 'spontaneous':
+                hit = candidates & (np.random.random((B, N)) < t['rate'])
+            else:
+                influence = dp.engine._neighbour_sum(
+                    np.where(senders, weight[None, :], 0.0), indptr)
+                hit = candidates & (influence >= thresholds)
+
+            S_next[hit] = model.states.index(t['target'])
+            moved |= hit
+
+        S = S_next
+        history.append(counts(S))
+
+    return S, np.array(history)
@@ -105,7 +105,11 @@ def optimize_rs(G,
                 custom_kernel = None, # custom kernel function
                 WERE_multiplier = 10, 
                 oblivion = False, # information oblivion feature 
-                engagement_enforcement = 1.00
+                engagement_enforcement = 1.00,
+                
+                time_budget = None, # maximal time of optimization
+                simulation_budget = None, # maximal number of simulations
+                callback = None # function receiving progress information
                 ): 
                 
     """ Show n best nodes for information diffusion in a graph. 
@@ -175,6 +179,26 @@ def optimize_rs(G,
     oblivion : bool, optional
         Option which enable agents information oblivion. 
         
+    
+    
+    Budget and progress parameters:
+    -------------------------------
+    
+    time_budget : float, optional
+        Maximal wall-clock time of optimization in seconds. Optimization
+        stops after the first iteration which exceeds the budget. 
+        If None, time is unlimited.
+    
+    simulation_budget : integer, optional
+        Maximal number of performed simulations. Each iteration performs
+        sequence_len simulations. If None, number of simulations 
+        is unlimited. ValueError is raised if budget allows no 
+        iteration.
+    
+    callback : function, optional
+        Function called after each iteration with dictionary of progress
+        information (see difpy.progress module).
+        
 
         
     Returns
@@ -187,6 +211,9 @@ def optimize_rs(G,
 
     # Start time measuring
     start = time.time()
+    
+    # Number of performed simulations
+    evaluations = 0
 
     # Compute number of nodes
     population = range(len(G))
@@ -200,6 +227,12 @@ def optimize_rs(G,
     #====================================#
     
     for i in range(number_of_iter):
+        
+        # Stop if budget is exhausted
+        if dp.budget_exhausted(start, evaluations, 
+                               time_budget, simulation_budget,
+                               cost = sequence_len):
+            break
     
         # Add 'unaware' state for all nodes
         nx.set_node_attributes(G, 'unaware', 'state') # (G, value, key)
@@ -222,11 +255,17 @@ def optimize_rs(G,
                                                     oblivion,
                                                     engagement_enforcement
                                                     )
+        evaluations += sequence_len
               
         # Save results if its better than before    
         if candidate_solution > best_solution[0]:
             best_solution[0] = candidate_solution
             best_solution[1] = infected_agents_id
+        
+        # Pass progress information to callback
+        if callback is not None:
+            callback(dp.progress_info(i + 1, best_solution[0], 
+                                      evaluations, start))
 
         # Show log information
         if log_info_interval is not None:
@@ -236,6 +275,13 @@ def optimize_rs(G,
                     print(i, "Iterations passed with best solution:",\
                           round(best_solution[0],4), "in", \
                           round(end - start, 2), "seconds." )
+    # No seed set was evaluated, so there is no solution to return
+    if evaluations == 0:
+        raise ValueError("Budget allowed no iteration, at least "
+                         + str(sequence_len) + " simulations are needed "
+                         "to evaluate one set of nodes. Increase "
+                         "time_budget or simulation_budget.")
+
     #==============#
     # Show results #
     #==============#
@@ -0,0 +1,279 @@
+"""
+Created on Sun Oct 18 12:20:44 2026
+
+
+    Module enables parallel computation of nodes' information spreading
+    capability in Difpy package.
+
+    Nodes are scored with the same per-node algorithm as in
+    nodes_score_simulation function, but in a pool of processes.
+    Compiled graph is sent once to each process (its arrays are pickled
+    faster than NetworkX graph), and each process builds its own
+    NetworkX copy of the graph, because simulation_sequence function
+    works on NetworkX graphs. Graph passed by the caller is not
+    modified.
+
+    Nodes are sent to processes in chunks of dynamically chosen size.
+    Cost of a node is estimated by its degree, and chunks get smaller
+    as remaining work decreases, so processes which finish early take
+    the next chunk from the common queue. If budget is given, chunks
+    have one node, so budget is not exceeded by scheduled chunks.
+
+
+    Objects
+    ----------
+    nodes_score_parallel : function
+        A function computes score of information spreading capability
+        for each node in a pool of processes.
+
+
+"""
+
+import difpy as dp
+import networkx as nx
+import numpy as np
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+
+# Graph and simulation parameters of a worker process
+_worker = {}
+
+
+#=============================================================================#
+# Functions executed in worker processes #
+#========================================#
+
+def _init_worker(CG, params):
+
+    """ Build worker's NetworkX graph from compiled graph. """
+
+    _worker['G'] = dp.to_networkx(CG)
+    _worker['nodes'] = CG['nodes'].tolist()
+    _worker['params'] = params
+
+
+
+def _score_chunk(first, last):
+
+    """ Score nodes with numbers from first to last - 1. """
+
+    G = _worker['G']
+    nodes = _worker['nodes']
+    params = _worker['params']
+
+    scores = []
+    for i in range(first, last):
+
+        # Add 'unaware' state for all nodes
+        nx.set_node_attributes(G, 'unaware', 'state') # (G, value, key)
+
+        # Set choosen node as aware
+        G.nodes[nodes[i]]['state'] = 'aware'
+
+        # perform sequence of simulations
+        scores.append(dp.simulation_sequence(G, **params))
+
+    return first, scores
+
+
+
+#=============================================================================#
+# Function for chunk size #
+#=========================#
+
+def _next_chunk(first, cumulative_cost, n_jobs, min_chunk_cost,
+                max_nodes = None):
+
+    """ Return end of the next chunk which starts at node first.
+
+    Chunk cost is a part of remaining cost divided among processes
+    (guided scheduling), but not smaller than min_chunk_cost. Chunk
+    has at most max_nodes nodes (if given, at least one).
+
+    """
+
+    remaining = cumulative_cost[-1] - cumulative_cost[first]
+    target = max(remaining / (2 * n_jobs), min_chunk_cost)
+    last = int(np.searchsorted(cumulative_cost,
+                               cumulative_cost[first] + target,
+                               side = 'left'))
+    if max_nodes is not None:
+        last = min(last, first + max_nodes)
+
+    return min(max(last, first + 1), len(cumulative_cost) - 1)
+
+
+
+#=============================================================================#
+# nodes_score_parallel function #
+#===============================#
+
+def nodes_score_parallel(
+        G,
+        n_jobs = None, # number of processes
+
+        n = 5, # number of simulation steps in simulation
+        sequence_len = 10, # number of simulations in one sequence
+
+        kernel = 'weights', # kernel type
+        custom_kernel = None, # custom kernel function
+        WERE_multiplier = 10,
+        oblivion = False, # information oblivion feature
+        engagement_enforcement = 1.00,
+
+        time_budget = None, # maximal time of computation
+        simulation_budget = None, # maximal number of simulations
+        callback = None # function receiving progress information
+        ):
+
+    """ Compute nodes information propagation capability in a pool
+    of processes.
+
+    Results correspond to nodes_score_simulation function with
+    "simulation" method.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph. G is not modified.
+
+    n_jobs : integer, optional
+        Number of processes. If None, number of CPUs is used.
+
+
+
+    Parameters wrapped from nodes_score_simulation function:
+    --------------------------------------------------------
+
+    n : integer
+        A number of simulation steps for a given graph.
+
+    sequence_len : integer
+        A number of simulations to perform in one sequence.
+
+    kernel : string
+        Levels: "weights", "WERE", "custom"
+
+    custom_kernel : function
+        Function which compute probability of information propagation
+        for each node in simulation step. Function has to be defined
+        on module level to be sent to processes.
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    oblivion : bool, optional
+        Option which enable agents information oblivion.
+
+    engagement_enforcement : float
+        Enforcement of agent engagement by multiplier.
+        If engagement_enforcement == 1, no enforcement occurs.
+
+    time_budget : float, optional
+        Maximal wall-clock time of computation in seconds. No new chunks
+        are started after budget is exhausted.
+
+    simulation_budget : integer, optional
+        Maximal number of performed simulations.
+
+    callback : function, optional
+        Function called after each finished chunk with dictionary
+        of progress information (see difpy.progress module).
+
+
+    Returns
+    -------
+    list_solution : list
+        List with nodes information propagation capabilities in nodes
+        order. If budget is exhausted, list contains scores only for
+        first nodes with all scores computed.
+
+    """
+
+    # Start time measuring
+    start = time.time()
+
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+
+    CG = dp.compile_graph(G)
+    N = len(CG['indptr']) - 1
+
+    params = {'n': n,
+              'sequence_len': sequence_len,
+              'kernel': kernel,
+              'custom_kernel': custom_kernel,
+              'WERE_multiplier': WERE_multiplier,
+              'oblivion': oblivion,
+              'engagement_enforcement': engagement_enforcement}
+
+    # Cost of node grows with its degree
+    cost = np.diff(CG['indptr']) + 1.0
+    cumulative_cost = np.concatenate([[0.0], np.cumsum(cost)])
+    min_chunk_cost = cumulative_cost[-1] / (N + 1) # about one node
+
+    # With budget, one node per chunk and one chunk per process
+    # are scheduled, so simulations (counted when chunk is scheduled)
+    # do not exceed simulation budget and time budget is checked often
+    if time_budget is None and simulation_budget is None:
+        max_nodes, queue_len = None, 2 * n_jobs
+    else:
+        max_nodes, queue_len = 1, n_jobs
+
+    results = {}
+    evaluations = 0
+
+    with ProcessPoolExecutor(max_workers = n_jobs,
+                             initializer = _init_worker,
+                             initargs = (CG, params)) as executor:
+
+        first = 0
+        running = set()
+        done_nodes = 0
+
+        while first < N or running:
+
+            # Keep chunks in the queue for each process
+            while first < N and len(running) < queue_len \
+            and not dp.budget_exhausted(start, evaluations, time_budget,
+                                        simulation_budget,
+                                        cost = sequence_len):
+                last = _next_chunk(first, cumulative_cost, n_jobs,
+                                   min_chunk_cost, max_nodes)
+                running.add(executor.submit(_score_chunk, first, last))
+                # Simulations are counted when chunk is scheduled
+                evaluations += (last - first) * sequence_len
+                first = last
+
+            if not running:
+                break
+
+            finished, running = wait(running, return_when = FIRST_COMPLETED)
+
+            for future in finished:
+                chunk_first, scores = future.result()
+                results[chunk_first] = scores
+                done_nodes += len(scores)
+
+                # Pass progress information to callback
+                if callback is not None:
+                    best = max(max(s) for s in results.values())
+                    callback(dp.progress_info(done_nodes, best,
+                                              done_nodes * sequence_len,
+                                              start))
+
+    #=============================#
+    # Merge scores in nodes order #
+    #=============================#
+
+    list_solution = []
+    position = 0
+    while position in results:
+        list_solution.extend(results[position])
+        position += len(results[position])
+
+    return list_solution
@@ -0,0 +1,175 @@
+"""
+Created on Sun Oct 18 09:12:40 2026
+
+
+    Module enables progress reporting and computation budgets for long
+    running functions in Difpy package.
+
+    Functions which run many simulations (optimize_rs,
+    nodes_score_simulation, feature_importance) may be stopped after
+    given wall-clock time or given number of simulations, and may report
+    their progress to a callback function instead of the console.
+
+    A callback is any function which takes one dictionary argument
+    with the following keys:
+
+        * iteration - number of finished iterations
+        * best_score - best score found so far
+        * evaluations - number of simulations performed so far
+        * evaluations_per_second - simulations throughput
+        * elapsed - time passed from the start in seconds
+
+
+    Objects
+    ----------
+    progress_info : function
+        A function creates dictionary with progress information.
+
+
+    budget_exhausted : function
+        A function checks if time or simulation budget is exhausted.
+
+
+    print_progress : function
+        A callback function which prints progress information.
+
+
+"""
+
+import time
+
+
+#=============================================================================#
+# Function for progress information #
+#===================================#
+
+def progress_info(iteration,
+                  best_score,
+                  evaluations,
+                  start):
+
+    """ Create dictionary with progress information passed to callbacks.
+
+
+    Parameters
+    ----------
+
+    iteration : integer
+        Number of finished iterations.
+
+    best_score : float
+        Best score found so far.
+
+    evaluations : integer
+        Number of simulations performed so far.
+
+    start : float
+        Start time returned by time.time().
+
+
+    Returns
+    -------
+    info : dictionary
+        A dictionary with progress information.
+
+
+    """
+
+    elapsed = time.time() - start
+
+    # Avoid division by zero right after the start
+    if elapsed > 0:
+        evaluations_per_second = evaluations / elapsed
+    else:
+        evaluations_per_second = 0.0
+
+    info = {'iteration': iteration,
+            'best_score': best_score,
+            'evaluations': evaluations,
+            'evaluations_per_second': evaluations_per_second,
+            'elapsed': elapsed}
+
+    return info
+
+
+
+#=============================================================================#
+# Function for budget checking #
+#==============================#
+
+def budget_exhausted(start,
+                     evaluations,
+                     time_budget = None,
+                     simulation_budget = None,
+                     cost = 1):
+
+    """ Check if time or simulation budget is exhausted.
+
+
+    Parameters
+    ----------
+
+    start : float
+        Start time returned by time.time().
+
+    evaluations : integer
+        Number of simulations performed so far.
+
+    time_budget : float, optional
+        Maximal wall-clock time in seconds. If None, time is unlimited.
+
+    simulation_budget : integer, optional
+        Maximal number of simulations. If None, number of simulations
+        is unlimited.
+
+    cost : integer, optional
+        Number of simulations of the next iteration. Budget is exhausted
+        if they would exceed simulation_budget.
+
+
+    Returns
+    -------
+    exhausted : bool
+        True if any of budgets is exhausted.
+
+
+    """
+
+    if time_budget is not None:
+        if time.time() - start >= time_budget:
+            return True
+
+    if simulation_budget is not None:
+        if evaluations + max(cost, 1) > simulation_budget:
+            return True
+
+    return False
+
+
+
+#=============================================================================#
+# Callback function printing progress #
+#=====================================#
+
+def print_progress(info):
+
+    """ Print progress information in the console.
+
+    Function may be passed as callback argument to optimize_rs,
+    nodes_score_simulation or feature_importance.
+
+
+    Parameters
+    ----------
+
+    info : dictionary
+        A dictionary with progress information created with
+        progress_info function.
+
+
+    """
+
+    print(info['iteration'], "Iterations passed with best score:",\
+          round(info['best_score'], 4), "in", \
+          round(info['elapsed'], 2), "seconds,", \
+          round(info['evaluations_per_second'], 2), "simulations per second." )
@@ -33,8 +33,46 @@ import difpy as dp
 # import networkx as nx # used only by difpy subfunction
 import numpy as np
 # import random # used only by difpy subfunction
-import matplotlib.pyplot as plt
+# matplotlib is imported only when graph is drawn
 import copy
+import pickle
+import time
+
+#=============================================================================#
+# Functions for recording simulation step #
+#=========================================#
+
+def _record_step(G, trajectory):
+
+    """ Append states and engagement of nodes to trajectory store.
+    Engagement is recorded if nodes have engagement attribute.
+    Returns number of recorded bytes.
+
+    """
+
+    state = np.fromiter((d == 'aware' for i, d in G.nodes.data('state')),
+                        dtype = bool, count = len(G))
+    engagement = None
+    if len(G) > 0 and 'engagement' in G.nodes[next(iter(G))]:
+        engagement = np.fromiter((d for i, d in G.nodes.data('engagement')),
+                                 dtype = np.float64, count = len(G))
+    trajectory.append(state, engagement)
+
+    return (len(state) + 7) // 8 \
+           + (engagement.nbytes if engagement is not None else 0)
+
+
+
+def _recorded_bytes(record):
+
+    """ Return size of pickled step record of graph_list, used as number
+    of recorded bytes when trajectory store is not used.
+
+    """
+
+    return len(pickle.dumps(record, protocol = pickle.HIGHEST_PROTOCOL))
+
+
 
 #=============================================================================#
 # Function one simulation step #
@@ -48,7 +86,9 @@ def simulation_step(G, # NetworkX graph
                     WERE_multiplier = 10, 
                     oblivion = False, 
                     draw = False, 
-                    show_attr = False):
+                    show_attr = False,
+                    instrumentation = None): # collector of timers and
+                                             # counters
 
     """ Perform one simulation step of information diffusion 
         in a graph G.
@@ -101,6 +141,10 @@ def simulation_step(G, # NetworkX graph
     draw : bool, optional
         Draw graph.
 
+    instrumentation : Instrumentation, optional
+        Object collecting timers and counters of the step (see
+        difpy.instrument module). If None, nothing is collected.
+
 
     Returns
     -------
@@ -110,8 +154,17 @@ def simulation_step(G, # NetworkX graph
 
     """        
 
+    # Timers and counters are updated only with instrumentation
+    timed = instrumentation is not None
+    clock = time.perf_counter
+    edges_examined = transmission_attempts = successes = oblivion_events = 0
+    oblivion_time = kernel_time = rng_time = 0.0
+
     for n in G.nodes():
     
+        if timed == True:
+            t_oblivion = clock()
+    
         
         #=================#
         # Oblivion option #
@@ -144,6 +197,8 @@ def simulation_step(G, # NetworkX graph
                 # Attempt to oblivion
                 if np.random.uniform(0, 1) < oblivion_prob:
                     G.nodes[n]['state'] = 'unaware'
+                    if timed == True:
+                        oblivion_events += 1
                     
                     # increasing of engagement after oblivion
                     G.nodes[n]['engagement'] = np.round(min(1, G.nodes[n]['engagement'] * engagement_enforcement), 6)
@@ -154,8 +209,15 @@ def simulation_step(G, # NetworkX graph
         #========#
         # If node is still aware, it disseminate information
 
+        if timed == True:
+            t_kernel = clock()
+            oblivion_time += t_kernel - t_oblivion
+
         if G.nodes[n]['state'] == 'aware':
             
+            if timed == True:
+                edges_examined += len(G[n])
+            
             global neighbour
             for neighbour in G.neighbors(n):
             
@@ -195,8 +257,18 @@ def simulation_step(G, # NetworkX graph
                     # Attempt to internalization #
                     #============================#
                     
-                    if np.random.uniform(0, 1) < prob_of_internalization:
+                    if timed == True:
+                        transmission_attempts += 1
+                        t_rng = clock()
+                        random_draw = np.random.uniform(0, 1)
+                        rng_time += clock() - t_rng
+                    else:
+                        random_draw = np.random.uniform(0, 1)
+
+                    if random_draw < prob_of_internalization:
                         G.nodes[neighbour]['state'] = 'aware'
+                        if timed == True:
+                            successes += 1
             
                 #===================#
                 # Engagement rising #
@@ -209,6 +281,19 @@ def simulation_step(G, # NetworkX graph
                              engagement_enforcement, 6)
                         # reinforcing already informed actors
 
+        if timed == True:
+            kernel_time += clock() - t_kernel
+
+    if timed == True:
+        # time of drawing numbers is not included in kernel time
+        instrumentation.add_step(
+            timers = {'oblivion': oblivion_time,
+                      'kernel': kernel_time - rng_time,
+                      'rng': rng_time},
+            counters = {'edges_examined': edges_examined,
+                        'transmission_attempts': transmission_attempts,
+                        'successes': successes,
+                        'oblivion_events': oblivion_events})
     
     #=======================#
     # Show nodes attributes #
@@ -224,6 +309,7 @@ def simulation_step(G, # NetworkX graph
     #============#
     
     if draw == True:
+        import matplotlib.pyplot as plt
         fig_01, ax_01 = plt.subplots() # enable to plot one by one
                                        # in separate windows
         dp.draw_graph(G, pos)
@@ -248,7 +334,9 @@ def simulation(G,  # graph object
                oblivion = False, # enable information oblivion
                engagement_enforcement = 1.01,
                draw = False, # draw graph
-               show_attr = False): # show attributes
+               show_attr = False, # show attributes
+               trajectory = None, # store for steps of simulation
+               instrumentation = None): # collector of timers and counters
     
     """ Perform n simulation steps of information diffusion for 
         a given graph.
@@ -303,6 +391,15 @@ def simulation(G,  # graph object
     draw : bool, optional
         Draw graph.
 
+    trajectory : TrajectoryStore, optional
+        Store where states and engagement of nodes in each step are 
+        appended instead of graph_list, for long simulations of large
+        graphs.
+
+    instrumentation : Instrumentation, optional
+        Object collecting timers and counters of steps (see
+        difpy.instrument module). If None, nothing is collected.
+
                             
     Returns
     -------
@@ -315,6 +412,8 @@ def simulation(G,  # graph object
         Each element of primary lists is a list. Everyinner list contains
         information about certain step of simulation, consists of information
         about nodes.
+        
+        If trajectory is given, trajectory store is returned instead.
     
     avg_aware_inc_per_step: list
         Average increment of aware agents per one step of simulation.
@@ -325,8 +424,19 @@ def simulation(G,  # graph object
     # append nodes data from 0 step to list #
     #=======================================#
     
-    graph_list = []
-    graph_list.append(copy.deepcopy(list(G.nodes.data() ) )  )
+    with dp.instrument._timer(instrumentation, 'recording', 'replica'):
+        if trajectory is not None:
+            first_step = len(trajectory)
+            recorded = _record_step(G, trajectory)
+            graph_list = trajectory
+        else:
+            graph_list = []
+            graph_list.append(copy.deepcopy(list(G.nodes.data() ) )  )
+    if instrumentation is not None:
+        if trajectory is None:
+            recorded = _recorded_bytes(graph_list[-1])
+        instrumentation.add(counters = {'bytes_recorded': recorded},
+                            level = 'replica')
     
 
     #===================#
@@ -343,16 +453,30 @@ def simulation(G,  # graph object
                            oblivion = oblivion, 
                            engagement_enforcement = engagement_enforcement,
                            draw = draw, 
-                           show_attr = show_attr)
+                           show_attr = show_attr,
+                           instrumentation = instrumentation)
 
         # save nodes data to to list
-        graph_list.append(copy.deepcopy(list(G.nodes.data() ) )   )
+        with dp.instrument._timer(instrumentation, 'recording'):
+            if trajectory is not None:
+                recorded = _record_step(G, trajectory)
+            else:
+                graph_list.append(copy.deepcopy(list(G.nodes.data() ) )   )
+        if instrumentation is not None:
+            if trajectory is None:
+                recorded = _recorded_bytes(graph_list[-1])
+            instrumentation.add(counters = {'bytes_recorded': recorded})
         
     
     #======================================================#
     # Count aware agents before and after simulation steps #
     #======================================================#
     
+    if trajectory is not None:
+        aware_first_c = int(trajectory[first_step].sum())
+        aware_last_c = int(trajectory[-1].sum())
+        return trajectory, (aware_last_c - aware_first_c) / n
+    
     # Check number of aware agents in 0 step
     #global aware_first
     aware_first = []
@@ -399,7 +523,11 @@ def simulation_sequence(G,  # networkX graph object
                         oblivion = False, # information oblivion feature 
                         engagement_enforcement = 1.01,
                         draw = False, # draw graph
-                        show_attr = False): # show nodes attributes
+                        show_attr = False, # show nodes attributes
+                        instrumentation = None, # collector of timers
+                                                # and counters
+                        return_stats = False): # return statistics
+                                               # of simulations
     
     """ Perform n simulation steps of information diffusion for 
         a given graph.
@@ -454,6 +582,14 @@ def simulation_sequence(G,  # networkX graph object
             when another agent B is trying to pass information towards 
             agent A, but agent A is already aware.
         
+    instrumentation : Instrumentation, optional
+        Object collecting timers and counters of each simulation (replica)
+        and its steps (see difpy.instrument module). If None, nothing is
+        collected.
+    
+    return_stats : bool, optional
+        Return also statistics of simulations' outcomes.
+    
     
     Returns
     -------
@@ -462,19 +598,38 @@ def simulation_sequence(G,  # networkX graph object
         Average increment of aware agents per simulation step for a sequence
         of simulations.
     
+    stats : dictionary
+        Returned if return_stats is True. Mergeable statistics (see
+        difpy.streaming module) of simulations' outcomes:
+        
+        * avg_aware_inc - StreamStats of average increments per step
+        * cascade_size - StreamStats of increments of aware agents in
+            simulations, with histogram of 0 to number of nodes range
+            in at most 100 bins (decreases with oblivion are counted
+            as underflow)
+    
     
     """ 
     
     # list for storing average increment of aware agents per step
     avg_inc = []
     
+    if return_stats == True:
+        N = G.number_of_nodes()
+        stats = {'avg_aware_inc': dp.StreamStats(),
+                 'cascade_size': dp.StreamStats(
+                     np.linspace(0, N, min(N, 100) + 1))}
+    
     # Need to pass this arg for bug fixing
     pos = None
     # simulation f. needs this arg even if its set default as none
     
     # Run sequence of simulations
     for i in range(sequence_len):
-        G_zero = copy.deepcopy(G) # Create copy of Graph for simulation i
+        if instrumentation is not None:
+            instrumentation.start_replica()
+        with dp.instrument._timer(instrumentation, 'deepcopy', 'replica'):
+            G_zero = copy.deepcopy(G) # Create copy of Graph for simulation i
         graph_list, avg_aware_inc_per_step \
         = dp.simulation(G_zero,  # networkX graph object
                         pos, # position of nodes
@@ -486,12 +641,19 @@ def simulation_sequence(G,  # networkX graph object
                         oblivion, # information oblivion feature
                         engagement_enforcement,
                         draw, # draw graph
-                        show_attr) # show nodes attributes
+                        show_attr, # show nodes attributes
+                        instrumentation = instrumentation)
         
         # Append average aware agents increment per step for simulation i
         avg_inc.append(avg_aware_inc_per_step)
+        
+        if return_stats == True:
+            stats['avg_aware_inc'].update(avg_aware_inc_per_step)
+            stats['cascade_size'].update(round(avg_aware_inc_per_step * n))
     
     # compute average aware agents increment per step for simulation sequence
     avg_aware_inc = sum(avg_inc) / len(avg_inc)
 
+    if return_stats == True:
+        return avg_aware_inc, stats
     return avg_aware_inc
@@ -0,0 +1,297 @@
+"""
+Created on Sun Oct 18 11:36:05 2026
+
+
+    Module enables approximate computation of nodes' information
+    spreading capability in Difpy package with reachability sketches.
+
+    Information diffusion without oblivion may be expressed with sampled
+    worlds. In each world every edge gets a delay - number of steps
+    after which the sender passes information to the receiver - sampled
+    from geometric distribution with probability of internalization.
+    Node v makes aware all nodes reachable from v within n steps
+    of delays.
+
+    Instead of counting reachable nodes in each world separately,
+    each (node, world) pair gets random rank, and for each node only
+    k smallest ranks of reachable pairs are kept (bottom-k sketch).
+    Number of reachable pairs is estimated from the k-th smallest rank,
+    so expected spread of all nodes is estimated in near-linear time.
+
+
+    Objects
+    ----------
+    nodes_score_sketch : function
+        A function estimates score of information spreading capability
+        for each node with combined reachability sketches.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+import time
+
+
+#=============================================================================#
+# Function for bottom-k selection #
+#=================================#
+
+def _bottom_k(groups, values, N, k):
+
+    """ Keep k smallest distinct values for each group.
+
+    Parameters
+    ----------
+
+    groups : ndarray
+        Integer ndarray with group (node) number for each value.
+
+    values : ndarray
+        Ndarray with ranks, infinite values are skipped.
+
+    N : integer
+        Number of groups.
+
+    k : integer
+        Size of sketches.
+
+
+    Returns
+    -------
+    sketch : ndarray
+        Ndarray in shape (N, k) with sorted values for each group,
+        padded with infinity.
+
+    """
+
+    sketch = np.full((N, k), np.inf, dtype = values.dtype)
+
+    keep = np.isfinite(values)
+    groups, values = groups[keep], values[keep]
+    if len(values) == 0:
+        return sketch
+
+    order = np.lexsort((values, groups))
+    groups, values = groups[order], values[order]
+
+    # Drop the same pair reached by many paths
+    distinct = np.ones(len(values), dtype = bool)
+    distinct[1:] = (groups[1:] != groups[:-1]) | (values[1:] != values[:-1])
+    groups, values = groups[distinct], values[distinct]
+
+    # Position of value in its group
+    index = np.arange(len(groups))
+    new_group = np.ones(len(groups), dtype = bool)
+    new_group[1:] = groups[1:] != groups[:-1]
+    position = index - np.maximum.accumulate(np.where(new_group, index, 0))
+
+    keep = position < k
+    sketch[groups[keep], position[keep]] = values[keep]
+
+    return sketch
+
+
+
+#=============================================================================#
+# Function for sketches in one world #
+#====================================#
+
+def _world_sketch(indptr, indices, prob, n, k):
+
+    """ Compute bottom-k reachability sketches in one sampled world.
+
+    Parameters
+    ----------
+
+    indptr, indices : ndarray
+        CSR arrays with successors of nodes.
+
+    prob : ndarray
+        Probability of information propagation for each CSR entry.
+
+    n : integer
+        Number of simulation steps (time horizon).
+
+    k : integer
+        Size of sketches.
+
+
+    Returns
+    -------
+    sketch : ndarray
+        Ndarray in shape (N, k) with ranks of pairs reachable from
+        each node within n steps.
+
+    """
+
+    N = len(indptr) - 1
+    rows = np.repeat(np.arange(N), np.diff(indptr))
+
+    # Delay of each edge, edges slower than horizon are not used
+    delay = np.random.geometric(np.clip(prob, 1e-12, 1))
+    live = delay <= n
+    rows, targets, delay = rows[live], indices[live], delay[live]
+
+    # Random rank of each node in this world
+    ranks = np.full((N, k), np.inf)
+    ranks[:, 0] = np.random.random(N)
+
+    # Sketches of nodes reachable within t steps, for t = 0..n
+    sketches = [ranks]
+    node_groups = np.repeat(np.arange(N), k)
+
+    for t in range(1, n + 1):
+        groups = [node_groups]
+        values = [sketches[t - 1].ravel()]
+        for d in np.unique(delay[delay <= t]):
+            edges = delay == d
+            groups.append(np.repeat(rows[edges], k))
+            values.append(sketches[t - d][targets[edges]].ravel())
+        sketches.append(_bottom_k(np.concatenate(groups),
+                                  np.concatenate(values), N, k))
+
+    return sketches[n]
+
+
+
+#=============================================================================#
+# nodes_score_sketch function #
+#=============================#
+
+def nodes_score_sketch(G,
+                       n = 5, # number of simulation steps
+                       sequence_len = 10, # number of sampled worlds
+                       sketch_size = 32, # accuracy of estimation
+
+                       kernel = 'weights', # kernel type
+                       WERE_multiplier = 10,
+
+                       time_budget = None, # maximal time of computation
+                       simulation_budget = None, # maximal sampled worlds
+                       callback = None # function receiving progress info
+                       ):
+
+    """ Estimate nodes information propagation capability with
+    combined reachability sketches.
+
+    Results estimate scores of the synchronous model of
+    nodes_score_batched function without oblivion and engagement
+    enforcement, which is a different diffusion model than
+    in nodes_score_simulation function with simulation method.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph.
+
+    n : integer
+        A number of simulation steps. Only nodes reachable within
+        n steps are counted.
+
+    sequence_len : integer
+        A number of sampled worlds, which corresponds to number
+        of simulations for each node.
+
+    sketch_size : integer
+        A number of ranks kept for each node. Relative error of
+        estimation is about 1 / sqrt(sketch_size - 2), memory
+        usage grows with (n + 1) * sketch_size * number of nodes.
+
+    kernel : string
+        Levels: "weights", "WERE"
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    time_budget : float, optional
+        Maximal wall-clock time of computation in seconds. Estimates
+        are computed from worlds sampled before budget is exhausted.
+
+    simulation_budget : integer, optional
+        Maximal number of sampled worlds.
+
+    callback : function, optional
+        Function called after each world with dictionary of progress
+        information (see difpy.progress module).
+
+
+    Returns
+    -------
+    list_solution : list
+        List with estimated nodes information propagation capabilities.
+        Each value is an average increment of aware nodes per one
+        simulation step for each node. If budget is exhausted before
+        the first world, list is empty.
+
+    """
+
+    # Start time measuring
+    start = time.time()
+
+    CG = dp.compile_graph(G)
+    indptr, indices = CG['indptr'], CG['indices']
+    N = len(indptr) - 1
+    k = sketch_size
+
+    prob = dp.engine._edge_probabilities(CG, kernel, WERE_multiplier,
+                                         receivers = 'indices')
+
+    # Combined sketches over all sampled worlds
+    combined = np.full((N, k), np.inf)
+    node_groups = np.repeat(np.arange(N), k)
+    worlds = 0
+
+    for i in range(sequence_len):
+
+        # Stop if budget is exhausted
+        if dp.budget_exhausted(start, worlds,
+                               time_budget, simulation_budget):
+            break
+
+        # Ranks are float64, so equal ranks of pairs from different
+        # worlds are unlikely (probability about pairs^2 / 2^53)
+        sketch = _world_sketch(indptr, indices, prob, n, k)
+        combined = _bottom_k(np.concatenate([node_groups, node_groups]),
+                             np.concatenate([combined.ravel(),
+                                             sketch.ravel()]), N, k)
+        worlds += 1
+
+        # Pass progress information to callback
+        if callback is not None:
+            scores = _estimate_scores(combined, worlds, n)
+            callback(dp.progress_info(worlds, scores.max(), worlds, start))
+
+    if worlds == 0:
+        return []
+
+    list_solution = _estimate_scores(combined, worlds, n).tolist()
+
+    return list_solution
+
+
+
+#=============================================================================#
+# Function for estimation of scores #
+#===================================#
+
+def _estimate_scores(combined, worlds, n):
+
+    """ Estimate average increment of aware nodes per step from combined
+    sketches of given number of worlds.
+
+    """
+
+    k = combined.shape[1]
+
+    # Exact count for small sketches, k-th rank estimator otherwise
+    reachable = np.isfinite(combined).sum(axis = 1).astype(np.float64)
+    full = reachable == k
+    reachable[full] = (k - 1) / combined[full, k - 1]
+
+    # Expected number of aware nodes minus the seed, per step
+    spread = reachable / worlds
+
+    return (spread - 1) / n
@@ -0,0 +1,208 @@
+"""
+Created on Sun Oct 18 22:10:52 2026
+
+
+    Module enables fast saving and loading of graphs in Difpy package.
+
+    Graph is saved as compiled graph in a directory with one .npy file
+    for each array (CSR structure, weights, states, nodes' attributes)
+    and meta.json file with format version and description of arrays.
+    Arrays are loaded with np.load(mmap_mode = 'r'), so loading takes
+    milliseconds regardless of graph size, and many processes mapping
+    the same files share one copy in operating system page cache.
+
+
+    Objects
+    ----------
+    save_graph : function
+        A function saves graph in directory.
+
+
+    load_graph : function
+        A function loads graph saved with save_graph function.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+import json
+import os
+import shutil
+
+
+# Version of saved files layout
+FORMAT_VERSION = 1
+
+
+#=============================================================================#
+# Functions for writing graph directory #
+#=======================================#
+
+def _prepare_path(path, overwrite = False):
+
+    """ Check path of saved graph and return new empty temporary
+    directory, where files of the graph are written.
+
+    """
+
+    if os.path.exists(path):
+        if overwrite == False:
+            raise ValueError("Path '" + path + "' already exists.")
+        if not os.path.exists(os.path.join(path, 'meta.json')):
+            raise ValueError("Path '" + path + "' is not a saved graph.")
+
+    tmp = path.rstrip(os.sep) + '.tmp'
+    shutil.rmtree(tmp, ignore_errors = True)
+    os.makedirs(tmp)
+
+    return tmp
+
+
+
+def _finish_graph(tmp, path, N, directed, node_attrs, node_names = None):
+
+    """ Write meta.json describing .npy files in temporary directory
+    and move it to path, so readers never see partial graph.
+
+    """
+
+    arrays = {}
+    for name in sorted(os.listdir(tmp)):
+        if name.endswith('.npy'):
+            array = np.load(os.path.join(tmp, name), mmap_mode = 'r')
+            arrays[name[:-4]] = {'dtype': array.dtype.str,
+                                 'shape': list(array.shape)}
+
+    meta = {'format': 'difpy-graph',
+            'version': FORMAT_VERSION,
+            'nodes': N,
+            'directed': bool(directed),
+            'node_attrs': list(node_attrs),
+            'node_names': node_names,
+            'arrays': arrays}
+
+    with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent = 2, default = str)
+
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(tmp, path)
+
+    return meta
+
+
+
+#=============================================================================#
+# Function for saving graph #
+#===========================#
+
+def save_graph(G, path, overwrite = False):
+
+    """ Save graph in directory with .npy files.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph.
+
+    path : string
+        Path of directory created for the graph.
+
+    overwrite : bool, optional
+        Replace graph previously saved in path.
+
+
+    Returns
+    -------
+    meta : dictionary
+        A dictionary with description of saved graph.
+
+    """
+
+    CG = dp.compile_graph(G)
+    tmp = _prepare_path(path, overwrite)
+
+    arrays = {'indptr': np.asarray(CG['indptr'], dtype = np.int64),
+              'indices': np.asarray(CG['indices'], dtype = np.int64),
+              'weight': np.asarray(CG['weight'], dtype = np.float64),
+              'aware': np.asarray(CG['aware'], dtype = bool)}
+    for k, v in CG['node_attrs'].items():
+        arrays['attr_' + k] = np.asarray(v)
+
+    # Names which are not numbers or strings are saved in meta.json
+    nodes = np.asarray(CG['nodes'])
+    if nodes.dtype.kind in 'biuU':
+        arrays['nodes'] = nodes
+        node_names = None
+    else:
+        node_names = nodes.tolist()
+
+    for k, v in arrays.items():
+        np.save(os.path.join(tmp, k + '.npy'), v, allow_pickle = False)
+
+    return _finish_graph(tmp, path, len(CG['indptr']) - 1, CG['directed'],
+                         CG['node_attrs'].keys(), node_names)
+
+
+
+#=============================================================================#
+# Function for loading graph #
+#============================#
+
+def load_graph(path, mmap = True):
+
+    """ Load graph saved with save_graph function.
+
+
+    Parameters
+    ----------
+
+    path : string
+        Path of directory with saved graph.
+
+    mmap : bool, optional
+        Map arrays from files read-only instead of reading them. Mapped
+        arrays cannot be modified, copy them with np.array if needed.
+        Aware array is always read, because states change in simulations.
+
+
+    Returns
+    -------
+    CG : dictionary
+        A compiled graph.
+
+    """
+
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+
+    if meta.get('format') != 'difpy-graph':
+        raise ValueError("Path '" + path + "' is not a saved graph.")
+    if meta.get('version', 0) > FORMAT_VERSION:
+        raise ValueError("Graph saved in format version "
+                         + str(meta['version']) + " is not supported, "
+                         "update difpy package.")
+
+    def load(name):
+        return np.load(os.path.join(path, name + '.npy'),
+                       mmap_mode = 'r' if mmap == True else None,
+                       allow_pickle = False)
+
+    if meta['node_names'] is None:
+        nodes = load('nodes')
+    else:
+        # Tuples are saved in JSON as lists
+        nodes = np.empty(meta['nodes'], dtype = object)
+        for i, v in enumerate(meta['node_names']):
+            nodes[i] = tuple(v) if isinstance(v, list) else v
+
+    return {'nodes': nodes,
+            'indptr': load('indptr'),
+            'indices': load('indices'),
+            'weight': load('weight'),
+            'aware': np.array(load('aware')),
+            'node_attrs': {k: load('attr_' + k) for k in meta['node_attrs']},
+            'directed': meta['directed']}
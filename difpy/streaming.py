@@ -0,0 +1,401 @@
+"""
+Created on Mon Oct 19 04:27:15 2026
+
+
+    Module enables mergeable statistics of simulation outputs in Difpy
+    package.
+
+    Accumulators are updated with values one batch at a time and keep
+    only fixed-size summaries, so outputs of many simulations are not
+    stored. Accumulators of the same kind (e.g. computed in separate
+    processes or machines) are combined with merge method, and are
+    exported to plain dictionaries (to_dict) and restored (from_dict):
+
+        * RunningMoments - count, mean and variance (Welford's algorithm,
+          merged with Chan's formula), minimum and maximum
+        * FixedHistogram - counts in fixed bins, merged by adding counts
+        * QuantileSketch - quantiles with relative accuracy, values are
+          counted in logarithmic buckets (as in DDSketch), merged by
+          adding counts
+
+
+    Objects
+    ----------
+    RunningMoments : class
+        A class accumulates mean and variance.
+
+
+    FixedHistogram : class
+        A class accumulates histogram with fixed bins.
+
+
+    QuantileSketch : class
+        A class accumulates approximate quantiles.
+
+
+    StreamStats : class
+        A class accumulates all statistics of one output.
+
+
+"""
+
+import numpy as np
+
+
+#=============================================================================#
+# RunningMoments class #
+#======================#
+
+class RunningMoments:
+
+    """ Count, mean, variance, minimum and maximum of values. """
+
+    def __init__(self):
+
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0 # sum of squared differences from the mean
+        self.min = np.inf
+        self.max = -np.inf
+
+
+    def update(self, values):
+
+        """ Add values (number or ndarray). """
+
+        values = np.asarray(values, dtype = np.float64).ravel()
+        if len(values) == 0:
+            return
+        batch = RunningMoments()
+        batch.count = len(values)
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.min, batch.max = float(values.min()), float(values.max())
+        self.merge(batch)
+
+
+    def merge(self, other):
+
+        """ Add values accumulated in other RunningMoments object. """
+
+        count = self.count + other.count
+        if count == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        return self
+
+
+    def variance(self, ddof = 1):
+
+        """ Return variance of values, NaN for too few values. """
+
+        if self.count - ddof <= 0:
+            return np.nan
+        return self.m2 / (self.count - ddof)
+
+
+    def std(self, ddof = 1):
+
+        return float(np.sqrt(self.variance(ddof)))
+
+
+    def to_dict(self):
+
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2,
+                'min': self.min, 'max': self.max}
+
+
+    @classmethod
+    def from_dict(cls, d):
+
+        moments = cls()
+        moments.count, moments.mean, moments.m2 = d['count'], d['mean'], \
+                                                  d['m2']
+        moments.min, moments.max = d['min'], d['max']
+
+        return moments
+
+
+
+#=============================================================================#
+# FixedHistogram class #
+#======================#
+
+class FixedHistogram:
+
+    """ Histogram with fixed bins.
+
+
+    Parameters
+    ----------
+
+    edges : ndarray
+        Edges of bins. Values below the first edge and above the last
+        edge are counted as underflow and overflow.
+
+    """
+
+    def __init__(self, edges):
+
+        self.edges = np.asarray(edges, dtype = np.float64)
+        self.counts = np.zeros(len(self.edges) - 1, dtype = np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+
+    def update(self, values):
+
+        """ Add values (number or ndarray). """
+
+        values = np.asarray(values, dtype = np.float64).ravel()
+        self.underflow += int((values < self.edges[0]).sum())
+        self.overflow += int((values > self.edges[-1]).sum())
+        self.counts += np.histogram(values, self.edges)[0]
+
+
+    def merge(self, other):
+
+        """ Add counts of other histogram with the same bins. """
+
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Histograms have different bins.")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+        return self
+
+
+    def to_dict(self):
+
+        return {'edges': self.edges.tolist(), 'counts': self.counts.tolist(),
+                'underflow': self.underflow, 'overflow': self.overflow}
+
+
+    @classmethod
+    def from_dict(cls, d):
+
+        histogram = cls(d['edges'])
+        histogram.counts = np.asarray(d['counts'], dtype = np.int64)
+        histogram.underflow, histogram.overflow = d['underflow'], \
+                                                  d['overflow']
+
+        return histogram
+
+
+
+#=============================================================================#
+# QuantileSketch class #
+#======================#
+
+class QuantileSketch:
+
+    """ Approximate quantiles with relative accuracy.
+
+    Value x > 0 is counted in bucket ceil(log(x) / log(gamma)), where
+    gamma = (1 + relative_accuracy) / (1 - relative_accuracy), so
+    returned quantiles differ from true ones by at most relative_accuracy
+    times their value. Negative values are counted in buckets of -x.
+
+
+    Parameters
+    ----------
+
+    relative_accuracy : float, optional
+        Relative accuracy of quantiles.
+
+    """
+
+    def __init__(self, relative_accuracy = 0.01):
+
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.positive = {}
+        self.negative = {}
+        self.zeros = 0
+
+
+    def count(self):
+
+        return self.zeros + sum(self.positive.values()) \
+               + sum(self.negative.values())
+
+
+    @staticmethod
+    def _add(store, keys, counts):
+
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+
+    def update(self, values):
+
+        """ Add values (number or ndarray). """
+
+        values = np.asarray(values, dtype = np.float64).ravel()
+        self.zeros += int((values == 0).sum())
+        for store, part in ((self.positive, values[values > 0]),
+                            (self.negative, -values[values < 0])):
+            keys = np.ceil(np.log(part) / np.log(self.gamma)).astype(np.int64)
+            keys, counts = np.unique(keys, return_counts = True)
+            self._add(store, keys, counts)
+
+
+    def merge(self, other):
+
+        """ Add counts of other sketch with the same accuracy. """
+
+        if self.gamma != other.gamma:
+            raise ValueError("Sketches have different accuracy.")
+        for store, other_store in ((self.positive, other.positive),
+                                   (self.negative, other.negative)):
+            self._add(store, np.array(list(other_store.keys()), dtype = int),
+                      np.array(list(other_store.values()), dtype = int))
+        self.zeros += other.zeros
+
+        return self
+
+
+    def quantile(self, q):
+
+        """ Return approximate q-quantile (0 <= q <= 1), NaN if sketch
+        is empty.
+
+        """
+
+        total = self.count()
+        if total == 0:
+            return np.nan
+
+        # Buckets from the smallest values: negative ones with decreasing
+        # keys, zeros, positive ones with increasing keys
+        negative = sorted(self.negative.items(), reverse = True)
+        values = [-2 * self.gamma ** k / (self.gamma + 1)
+                  for k, c in negative] + [0.0] \
+                 + [2 * self.gamma ** k / (self.gamma + 1)
+                    for k in sorted(self.positive)]
+        counts = [c for k, c in negative] + [self.zeros] \
+                 + [self.positive[k] for k in sorted(self.positive)]
+
+        rank = q * (total - 1)
+        position = int(np.searchsorted(np.cumsum(counts), rank,
+                                       side = 'right'))
+
+        return values[min(position, len(values) - 1)]
+
+
+    def to_dict(self):
+
+        return {'relative_accuracy': self.relative_accuracy,
+                'positive': {str(k): c for k, c in self.positive.items()},
+                'negative': {str(k): c for k, c in self.negative.items()},
+                'zeros': self.zeros}
+
+
+    @classmethod
+    def from_dict(cls, d):
+
+        sketch = cls(d['relative_accuracy'])
+        sketch.positive = {int(k): c for k, c in d['positive'].items()}
+        sketch.negative = {int(k): c for k, c in d['negative'].items()}
+        sketch.zeros = d['zeros']
+
+        return sketch
+
+
+
+#=============================================================================#
+# StreamStats class #
+#===================#
+
+class StreamStats:
+
+    """ Moments, histogram and quantiles of one output of simulations.
+
+
+    Parameters
+    ----------
+
+    edges : ndarray, optional
+        Edges of histogram bins. If None, histogram is not computed.
+
+    relative_accuracy : float, optional
+        Relative accuracy of quantiles.
+
+    """
+
+    def __init__(self, edges = None, relative_accuracy = 0.01):
+
+        self.moments = RunningMoments()
+        self.histogram = None if edges is None else FixedHistogram(edges)
+        self.sketch = QuantileSketch(relative_accuracy)
+
+
+    def update(self, values):
+
+        """ Add values (number or ndarray). """
+
+        self.moments.update(values)
+        if self.histogram is not None:
+            self.histogram.update(values)
+        self.sketch.update(values)
+
+
+    def merge(self, other):
+
+        """ Add statistics of other StreamStats object. """
+
+        self.moments.merge(other.moments)
+        if self.histogram is not None:
+            self.histogram.merge(other.histogram)
+        self.sketch.merge(other.sketch)
+
+        return self
+
+
+    def quantile(self, q):
+
+        return self.sketch.quantile(q)
+
+
+    def summary(self):
+
+        """ Return dictionary with count, mean, std, min, median, max
+        and quartiles.
+
+        """
+
+        return {'count': self.moments.count,
+                'mean': self.moments.mean,
+                'std': self.moments.std(),
+                'min': self.moments.min,
+                'q25': self.quantile(0.25),
+                'median': self.quantile(0.5),
+                'q75': self.quantile(0.75),
+                'max': self.moments.max}
+
+
+    def to_dict(self):
+
+        return {'moments': self.moments.to_dict(),
+                'histogram': None if self.histogram is None
+                             else self.histogram.to_dict(),
+                'sketch': self.sketch.to_dict()}
+
+
+    @classmethod
+    def from_dict(cls, d):
+
+        stats = cls()
+        stats.moments = RunningMoments.from_dict(d['moments'])
+        if d['histogram'] is not None:
+            stats.histogram = FixedHistogram.from_dict(d['histogram'])
+        stats.sketch = QuantileSketch.from_dict(d['sketch'])
+
+        return stats
@@ -0,0 +1,273 @@
+"""
+Created on Mon Oct 19 01:05:26 2026
+
+
+    Module enables information diffusion simulations on temporal
+    networks in Difpy package.
+
+    Contacts between nodes are given as edge stream - arrays with time,
+    source, target and optionally weight of each contact, sorted by
+    time and saved as .npy files, which are read with memory mapping.
+    Simulation replays the stream in time windows: in each window
+    information may pass only over contacts active in the window, from
+    nodes aware at the beginning of the window (as in one step of
+    simulation_batch function). Contacts of a window are read in chunks,
+    so memory use does not depend on stream length.
+
+
+    Objects
+    ----------
+    save_edge_stream : function
+        A function saves contacts as time-sorted edge stream.
+
+
+    load_edge_stream : function
+        A function opens edge stream with memory mapping.
+
+
+    temporal_simulation : function
+        A function performs simulations over edge stream.
+
+
+"""
+
+import difpy as dp
+import numpy as np
+import json
+import os
+
+
+#=============================================================================#
+# Functions for edge stream #
+#===========================#
+
+def save_edge_stream(path, src, dst, time, weight = None, overwrite = False):
+
+    """ Save contacts as edge stream sorted by time.
+
+
+    Parameters
+    ----------
+
+    path : string
+        Path of directory created for the stream.
+
+    src, dst : ndarray
+        Numbers of contacts' endpoints (positions of nodes in the graph).
+
+    time : ndarray
+        Time of each contact.
+
+    weight : ndarray, optional
+        Weight of each contact used by kernels. If None, weights are 1.
+
+    overwrite : bool, optional
+        Replace stream previously saved in path.
+
+
+    Returns
+    -------
+    stream : dictionary
+        Edge stream opened with load_edge_stream function.
+
+    """
+
+    if os.path.exists(path) and overwrite == False:
+        raise ValueError("Path '" + path + "' already exists.")
+    os.makedirs(path, exist_ok = True)
+
+    time = np.asarray(time)
+    order = np.argsort(time, kind = 'stable')
+    arrays = {'time': time[order],
+              'src': np.asarray(src, dtype = np.int64)[order],
+              'dst': np.asarray(dst, dtype = np.int64)[order]}
+    if weight is not None:
+        arrays['weight'] = np.asarray(weight, dtype = np.float64)[order]
+
+    for k, v in arrays.items():
+        np.save(os.path.join(path, k + '.npy'), v)
+    with open(os.path.join(path, 'meta.json'), 'w') as f:
+        json.dump({'format': 'difpy-edge-stream', 'version': 1,
+                   'contacts': len(time), 'arrays': list(arrays)}, f,
+                  indent = 2)
+
+    return load_edge_stream(path)
+
+
+
+def load_edge_stream(path):
+
+    """ Open edge stream saved with save_edge_stream function.
+
+    Returns dictionary of read-only memory mapped ndarrays: time, src,
+    dst and optionally weight.
+
+    """
+
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+
+    return {k: np.load(os.path.join(path, k + '.npy'), mmap_mode = 'r')
+            for k in meta['arrays']}
+
+
+
+#=============================================================================#
+# Function for temporal simulation #
+#==================================#
+
+def temporal_simulation(G,
+                        stream, # edge stream or its path
+                        window = 1, # length of time window
+                        start = None, # time of first window
+                        end = None, # end of the last window
+
+                        kernel = 'weights', # kernel type
+                        WERE_multiplier = 10,
+                        directed = False, # contacts pass information
+                                          # only from src to dst
+
+                        S = None, # initial states of nodes
+                        chunk_size = 1000000, # contacts read at once
+                        trajectory = None): # store for states in windows
+
+    """ Perform simulations of information diffusion over edge stream.
+
+
+    Parameters
+    ----------
+
+    G : graph
+        A networkx graph object or compiled graph with nodes, their
+        states and attributes. Edges of G are not used.
+
+    stream : dictionary or string
+        Edge stream from load_edge_stream function or its path.
+
+    window : number
+        Length of time window. Each window is one simulation step.
+
+    start : number, optional
+        Beginning of the first window. If None, time of the first
+        contact is used.
+
+    end : number, optional
+        End of the last window. If None, time after the last contact
+        is used.
+
+    kernel : string
+        Levels: "weights", "WERE"
+
+        * weights - probability of information propagation equals
+            weight of the contact
+        * WERE - probability of information propagation equals
+            weights-extraversion-receptiveness-engagement equation
+
+    WERE_multiplier : Float, optional
+        Multiplier used for scaling WERE kernel outcome.
+
+    directed : bool, optional
+        If False, information passes in both directions of contacts.
+
+    S : ndarray, optional
+        Bool ndarray in shape (<number of simulations>, <number of nodes>)
+        with initial states of nodes. If None, one simulation starts
+        from states of G.
+
+    chunk_size : integer, optional
+        Maximal number of contacts read from stream at once.
+
+    trajectory : TrajectoryStore, optional
+        Store where states of the first simulation are appended after
+        each window.
+
+
+    Returns
+    -------
+    S : ndarray
+        Bool ndarray with states of nodes after simulations.
+
+    avg_aware_inc_per_step : ndarray
+        Average increment of aware agents per one window for each
+        simulation, as in simulation function.
+
+    """
+
+    if isinstance(stream, str):
+        stream = load_edge_stream(stream)
+    if kernel not in ('weights', 'WERE'):
+        raise ValueError("Kernel '" + str(kernel) + "' is not supported "
+                         "by temporal simulation, use 'weights' or 'WERE'.")
+
+    CG = dp.compile_graph(G)
+    N = len(CG['indptr']) - 1
+    attrs = CG['node_attrs']
+
+    S = np.array(CG['aware'][None, :] if S is None else S, dtype = bool)
+    B = S.shape[0]
+    aware_first = S.sum(axis = 1)
+    if trajectory is not None:
+        trajectory.append(S[0])
+
+    time = stream['time']
+    if len(time) == 0:
+        return S, np.zeros(B)
+    start = time[0] if start is None else start
+    end = time[-1] + window if end is None else end
+    n_windows = max(int(np.ceil((end - start) / window)), 1)
+
+    # Offsets of simulations in flattened (simulations x nodes) states
+    offsets = (np.arange(B) * N)[:, None]
+
+    for w in range(n_windows):
+        first, last = np.searchsorted(time, [start + w * window,
+                                             start + (w + 1) * window],
+                                      side = 'left')
+
+        # Sum of logs of failure probabilities for each receiver
+        log_fail = np.zeros(B * N)
+
+        for chunk in range(first, last, chunk_size):
+            stop = min(chunk + chunk_size, last)
+            src = np.asarray(stream['src'][chunk:stop])
+            dst = np.asarray(stream['dst'][chunk:stop])
+            weight = np.asarray(stream['weight'][chunk:stop]) \
+                     if 'weight' in stream else np.ones(stop - chunk)
+
+            if directed == False:
+                src, dst = np.concatenate([src, dst]), \
+                           np.concatenate([dst, src])
+                weight = np.concatenate([weight, weight])
+
+            #========#
+            # Kernel #
+            #========#
+
+            if kernel == 'WERE':
+                prob = weight * attrs['receptiveness'][dst] \
+                       * attrs['extraversion'][src] \
+                       * attrs['engagement'][dst] * WERE_multiplier
+            else:
+                prob = weight
+
+            # Only contacts from aware senders pass information
+            senders = S[:, src]
+            log_fail += np.bincount(
+                (offsets + dst[None, :])[senders],
+                weights = np.broadcast_to(np.log1p(-np.clip(
+                    prob, 0, 1 - 1e-12)), senders.shape)[senders],
+                minlength = B * N)
+
+        #============================#
+        # Attempt to internalization #
+        #============================#
+
+        prob_of_internalization = 1 - np.exp(log_fail.reshape(B, N))
+        S = S | (np.random.random((B, N)) < prob_of_internalization)
+
+        if trajectory is not None:
+            trajectory.append(S[0])
+
+    avg_aware_inc_per_step = (S.sum(axis = 1) - aware_first) / n_windows
+
+    return S, avg_aware_inc_per_step
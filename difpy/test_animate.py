@@ -0,0 +1,110 @@
+import unittest
+import os
+import tempfile
+import animate
+import networkx as nx
+import numpy as np
+from unittest import mock
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+class TestAnimate(unittest.TestCase):
+    """
+    Class for testing animate module.
+
+    Class include methods for testing:
+        * conversion of recorded trajectories
+        * frames of exported GIF files
+        * unsupported formats and missing ffmpeg
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.G = nx.path_graph(5)
+        nx.set_node_attributes(self.G, 'unaware', 'state')
+        self.pos = {v: np.array([v, 0.0]) for v in self.G}
+        # Information passes one node in each step
+        self.states = np.tril(np.ones((4, 5), dtype = bool), 0)
+        self.tmp = tempfile.TemporaryDirectory()
+
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    #=========================#
+    # Check trajectory states #
+    #=========================#
+
+    def test_trajectory_states(self):
+        print('test_trajectory_states')
+
+        print(" -> Check graph list of simulation")
+        print('')
+        graph_list = [[(v, {'state': 'aware' if a else 'unaware'})
+                       for v, a in enumerate(step)] for step in self.states]
+        states = animate.trajectory_states(graph_list)
+        self.assertEqual(states.dtype, bool)
+        self.assertEqual(states.tolist(), self.states.tolist())
+        self.assertIs(animate.trajectory_states(self.states).dtype,
+                      np.dtype(bool))
+
+    #==================#
+    # Check GIF frames #
+    #==================#
+
+    @unittest.skipIf(Image is None, "Pillow is not installed")
+    def test_animate_diffusion_gif(self):
+        print('test_animate_diffusion_gif')
+
+        for n_jobs in [1, 2]:
+            print(" -> Check frames rendered with " + str(n_jobs) +
+                  " processes")
+            path = os.path.join(self.tmp.name, str(n_jobs) + '.gif')
+            result = animate.animate_diffusion(self.G, self.states, path,
+                                               pos = self.pos, dpi = 20,
+                                               figsize = (4, 3),
+                                               n_jobs = n_jobs)
+            self.assertEqual(result, path)
+            with Image.open(path) as image:
+                self.assertEqual(image.n_frames, 4)
+                self.assertEqual(image.size, (80, 60))
+        print('')
+
+    #=======================#
+    # Check errors of files #
+    #=======================#
+
+    def test_animate_diffusion_errors(self):
+        print('test_animate_diffusion_errors')
+
+        print(" -> Check unsupported format")
+        with self.assertRaises(ValueError):
+            animate.animate_diffusion(self.G, self.states,
+                                      os.path.join(self.tmp.name, 'a.avi'),
+                                      pos = self.pos)
+
+        print(" -> Check missing ffmpeg")
+        print('')
+        with mock.patch.object(animate.shutil, 'which', return_value = None):
+            with self.assertRaises(RuntimeError):
+                animate.animate_diffusion(self.G, self.states,
+                                          os.path.join(self.tmp.name,
+                                                       'a.mp4'),
+                                          pos = self.pos)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+
+# With this line we may run tests in cmd/anaconda prompt
+# as "python test_animate.py"
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+import os
+import tempfile
+import cache
+import difpy as dp
+import networkx as nx
+
+class TestCache(unittest.TestCase):
+    """
+    Class for testing cache module.
+
+    Class include methods for testing:
+        * stability of graph fingerprint
+        * cache keys of changed graphs and parameters
+        * loading of cached scores
+        * skipping scores computed with budget
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.G = nx.path_graph(5)
+        nx.set_edge_attributes(self.G, 1.0, 'weight')
+        nx.set_node_attributes(self.G, 'unaware', 'state')
+        nx.set_node_attributes(self.G, 0.5, 'receptiveness')
+        nx.set_node_attributes(self.G, 0.5, 'extraversion')
+        nx.set_node_attributes(self.G, 0.5, 'engagement')
+        self.params = {'n': 2, 'sequence_len': 3}
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = self.tmp.name
+
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    #=========================#
+    # Check graph fingerprint #
+    #=========================#
+
+    def test_graph_fingerprint(self):
+        print('test_graph_fingerprint')
+
+        print(" -> Check fingerprint of the same graph")
+        fingerprint = cache.graph_fingerprint(self.G)
+        self.assertEqual(fingerprint, cache.graph_fingerprint(self.G.copy()))
+        self.assertEqual(fingerprint,
+                         cache.graph_fingerprint(dp.compile_graph(self.G)))
+
+        print(" -> Check fingerprint without states")
+        print('')
+        unaware = cache.graph_fingerprint(self.G, include_state = True)
+        self.G.nodes[0]['state'] = 'aware'
+        self.assertEqual(fingerprint, cache.graph_fingerprint(self.G))
+        self.assertNotEqual(unaware,
+                            cache.graph_fingerprint(self.G,
+                                                    include_state = True))
+
+    #==================#
+    # Check cache keys #
+    #==================#
+
+    def test_scores_cache_key(self):
+        print('test_scores_cache_key')
+
+        print(" -> Check key of changed graph")
+        key = cache.scores_cache_key(self.G, self.params)
+        G = self.G.copy()
+        G[0][1]['weight'] = 0.5
+        self.assertNotEqual(key, cache.scores_cache_key(G, self.params))
+        G = self.G.copy()
+        G.add_edge(0, 4, weight = 1.0)
+        self.assertNotEqual(key, cache.scores_cache_key(G, self.params))
+        G = self.G.copy()
+        G.nodes[0]['engagement'] = 0.1
+        self.assertNotEqual(key, cache.scores_cache_key(G, self.params))
+
+        print(" -> Check key of changed parameters")
+        print('')
+        self.assertNotEqual(key, cache.scores_cache_key(self.G,
+                                                        {'n': 3,
+                                                         'sequence_len': 3}))
+        self.assertEqual(key, cache.scores_cache_key(self.G,
+                                                     {'sequence_len': 3,
+                                                      'n': 2}))
+
+    #=====================#
+    # Check cached scores #
+    #=====================#
+
+    def test_cached_scores(self):
+        print('test_cached_scores')
+
+        print(" -> Check saved and loaded scores")
+        scores = dp.nodes_score_simulation(self.G, n = 2, sequence_len = 3,
+                                           method = 'batched',
+                                           cache_dir = self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+        print(" -> Check cache hit")
+        params = {'n': 2, 'sequence_len': 3, 'kernel': 'weights',
+                  'WERE_multiplier': 10, 'oblivion': False,
+                  'engagement_enforcement': 1.0, 'method': 'batched'}
+        key = cache.scores_cache_key(self.G, params)
+        self.assertEqual(cache.load_scores(self.cache_dir, key), scores)
+        cache.save_scores(self.cache_dir, key, [7.0] * 5)
+        self.assertEqual(dp.nodes_score_simulation(self.G, n = 2,
+                                                   sequence_len = 3,
+                                                   method = 'batched',
+                                                   cache_dir = \
+                                                   self.cache_dir),
+                         [7.0] * 5)
+
+        print(" -> Check invalidation by changed graph")
+        print('')
+        self.G[0][1]['weight'] = 0.5
+        self.assertNotEqual(dp.nodes_score_simulation(self.G, n = 2,
+                                                      sequence_len = 3,
+                                                      method = 'batched',
+                                                      cache_dir = \
+                                                      self.cache_dir),
+                            [7.0] * 5)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 4)
+
+
+    def test_cached_scores_budget(self):
+        print('test_cached_scores_budget')
+
+        print(" -> Check scores computed with budget are not saved")
+        print('')
+        for method in ['batched', 'sketch']:
+            dp.nodes_score_simulation(self.G, n = 2, sequence_len = 3,
+                                      simulation_budget = 6,
+                                      method = method,
+                                      cache_dir = self.cache_dir)
+            dp.nodes_score_simulation(self.G, n = 2, sequence_len = 3,
+                                      time_budget = 100,
+                                      method = method,
+                                      cache_dir = self.cache_dir)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+
+# With this line we may run tests in cmd/anaconda prompt
+# as "python test_cache.py"
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import contagion
+import networkx as nx
+import numpy as np
+
+class TestContagion(unittest.TestCase):
+    """
+    Class for testing contagion module.
+
+    Class include methods for testing:
+        * independent contagions
+        * exclusive contagions
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.G = nx.path_graph(5)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 1
+        for v in self.G.nodes():
+            self.G.nodes[v]['state'] = 'unaware'
+        # contagion 0 starts at node 0, contagion 1 at node 4
+        self.S = np.zeros((5, 2), dtype = bool)
+        self.S[0, 0] = self.S[4, 1] = True
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_independent(self):
+        print('test_independent')
+        S, inc = contagion.multi_contagion_simulation(self.G, self.S, n = 4)
+        self.assertTrue(S.all())
+        self.assertTrue(np.allclose(inc, 1))
+
+    def test_exclusive(self):
+        print('test_exclusive')
+        S, inc = contagion.multi_contagion_simulation(
+            self.G, np.stack([self.S] * 20), n = 4, exclusive = True)
+        self.assertTrue(np.all(S.sum(axis = 2) == 1))
+        self.assertTrue(np.all(S[:, [0, 1], 0]) and np.all(S[:, [3, 4], 1]))
+        self.assertTrue(np.allclose(inc.sum(axis = 1), 3 / 4))
+
+if __name__ == '__main__':
+    unittest.main()
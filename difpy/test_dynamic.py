@@ -0,0 +1,59 @@
+import unittest
+import dynamic
+import networkx as nx
+import numpy as np
+
+class TestDynamic(unittest.TestCase):
+    """
+    Class for testing dynamic module.
+
+    Class include methods for testing:
+        * edges read with logged changes and after compaction
+        * invalidation of node and edge artifacts
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        # path graph 0-1-2-3-4-5 with weights 0.5
+        G = nx.path_graph(6)
+        nx.set_edge_attributes(G, 0.5, 'weight')
+        self.D = dynamic.DynamicGraph(G, compact_ratio = 10)
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_changes(self):
+        print('test_changes')
+        self.D.add_edges([0], [5], 0.9)
+        self.D.update_weights([1], [2], 0.1)
+        self.D.remove_edges([3], [4])
+        expected = [0.9, 0.1, np.nan]
+        weights = self.D.edge_weights([5, 2, 4], [0, 1, 3])
+        self.assertTrue(np.allclose(weights, expected, equal_nan = True))
+        self.D.compact()
+        weights = self.D.edge_weights([5, 2, 4], [0, 1, 3])
+        self.assertTrue(np.allclose(weights, expected, equal_nan = True))
+        self.assertEqual(len(self.D.indices), 10)
+
+    def test_artifacts(self):
+        print('test_artifacts')
+        self.D.set_node_artifact('score', np.ones(6), hops = 1)
+        self.D.set_edge_artifact('live', np.arange(10))
+        self.D.update_weights([4], [5], 0.1)
+        values, stale = self.D.node_artifact('score')
+        self.assertTrue(np.array_equal(np.flatnonzero(stale), [3, 4, 5]))
+        values, stale = self.D.edge_artifact('live')
+        self.assertEqual(stale.sum(), 2)
+        # values of unchanged edges are kept
+        self.assertTrue(np.array_equal(values[~stale], np.arange(8)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import compiled
+import engine
+import networkx as nx
+import numpy as np
+
+class TestEngine(unittest.TestCase):
+    """
+    Class for testing compiled and engine modules.
+
+    Class include methods for testing:
+        * conversion between NetworkX and compiled graphs
+        * batched simulation on deterministic graph
+        * output of batched nodes' scores
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        # path graph 0-1-2-3-4 with certain information propagation
+        self.G = nx.path_graph(5)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 1.0
+        nx.set_node_attributes(self.G, 'unaware', 'state')
+        nx.set_node_attributes(self.G, 0.5, 'receptiveness')
+        nx.set_node_attributes(self.G, 0.5, 'extraversion')
+        nx.set_node_attributes(self.G, 0.5, 'engagement')
+        self.G.nodes[2]['state'] = 'aware'
+
+    #=========================#
+    # Check graph compilation #
+    #=========================#
+
+    def test_compile_graph_structure(self):
+        print('test_compile_graph_structure')
+
+        print(" -> Check CSR arrays")
+        CG = compiled.compile_graph(self.G)
+        self.assertEqual(CG['indptr'].tolist(), [0, 1, 3, 5, 7, 8])
+        self.assertEqual(CG['indices'].tolist(), [1, 0, 2, 1, 3, 2, 4, 3])
+
+        print(" -> Check nodes' attributes")
+        print('')
+        self.assertEqual(CG['aware'].tolist(),
+                         [False, False, True, False, False])
+        self.assertEqual(sorted(CG['node_attrs'].keys()),
+                         ['engagement', 'extraversion', 'receptiveness'])
+
+
+    def test_compile_graph_round_trip(self):
+        print('test_compile_graph_round_trip')
+
+        print(" -> Check graph after conversion back to NetworkX")
+        print('')
+        G = compiled.to_networkx(compiled.compile_graph(self.G))
+        self.assertEqual(sorted(G.edges()), sorted(self.G.edges()))
+        self.assertEqual(G.nodes[2], self.G.nodes[2])
+
+
+    def test_compile_graph_labels(self):
+        print('test_compile_graph_labels')
+
+        print(" -> Check tuple labels")
+        G_0 = nx.grid_2d_graph(3, 3)
+        CG = compiled.compile_graph(G_0)
+        self.assertEqual(CG['nodes'].shape, (9,))
+        G = compiled.to_networkx(CG)
+        self.assertEqual(list(G.nodes()), list(G_0.nodes()))
+        self.assertEqual(sorted(G.edges()), sorted(G_0.edges()))
+
+        print(" -> Check mixed labels")
+        print('')
+        G_0 = nx.Graph([(1, 'a'), ('a', (2, 3))])
+        G = compiled.to_networkx(compiled.compile_graph(G_0))
+        self.assertEqual(list(G.nodes()), [1, 'a', (2, 3)])
+
+    #==========================#
+    # Check batched simulation #
+    #==========================#
+
+    def test_simulation_batch_deterministic(self):
+        print('test_simulation_batch_deterministic')
+
+        print(" -> Check one synchronous step")
+        S = np.zeros((3, 5), dtype = bool)
+        S[:, 2] = True
+        S, avg_inc = engine.simulation_batch(self.G, S, n = 1)
+        self.assertEqual(S[0].tolist(), [False, True, True, True, False])
+        self.assertEqual(avg_inc.tolist(), [2.0, 2.0, 2.0])
+
+        print(" -> Check two synchronous steps")
+        print('')
+        S = np.zeros((1, 5), dtype = bool)
+        S[0, 0] = True
+        S, avg_inc = engine.simulation_batch(self.G, S, n = 2)
+        self.assertEqual(S[0].tolist(), [True, True, True, False, False])
+        self.assertEqual(avg_inc.tolist(), [1.0])
+
+
+    def test_nodes_score_batched(self):
+        print('test_nodes_score_batched')
+
+        print(" -> Check scores of all nodes")
+        scores = engine.nodes_score_batched(self.G, n = 1, sequence_len = 4)
+        self.assertEqual(scores, [1.0, 2.0, 2.0, 2.0, 1.0])
+
+        print(" -> Check scores with small batches")
+        print('')
+        scores = engine.nodes_score_batched(self.G, n = 1, sequence_len = 4,
+                                            nodes = [4, 2], batch_size = 1)
+        self.assertEqual(scores, [1.0, 2.0])
+
+
+
+# With this line we may run tests in cmd/anaconda prompt
+# as "python test_engine.py"
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import events
+import networkx as nx
+import numpy as np
+
+class TestEvents(unittest.TestCase):
+    """
+    Class for testing events module.
+
+    Class include methods for testing:
+        * awareness times on certain edges
+        * horizon of continuous-time simulation
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.G = nx.path_graph(5)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 1
+        self.G[3][4]['weight'] = 0
+        for v in self.G.nodes():
+            self.G.nodes[v]['state'] = 'aware' if v == 0 else 'unaware'
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_discrete_times(self):
+        print('test_discrete_times')
+        S, inc, times = events.event_simulation(self.G, n = 2)
+        self.assertTrue(np.array_equal(times[0, :3], [0, 1, 2]))
+        self.assertTrue(np.all(np.isinf(times[0, 3:])))
+        self.assertTrue(np.allclose(inc, 1))
+
+    def test_continuous_horizon(self):
+        print('test_continuous_horizon')
+        S, inc, times = events.event_simulation(self.G, n = 3,
+                                                time = 'continuous',
+                                                simulations = 10)
+        self.assertTrue(np.all(times[S] <= 3))
+        self.assertFalse(S[:, 4].any())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+import generators
+import difpy as dp
+import networkx as nx
+import numpy as np
+from unittest import mock
+
+class TestGenerators(unittest.TestCase):
+    """
+    Class for testing generators module.
+
+    Class include methods for testing:
+        * numbers of nodes and edges
+        * simple graphs without self loops and multiple edges
+        * determinism with seed and chunks computed in processes
+        * degrees of Barabasi-Albert graphs
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.graphs = {
+            'watts_strogatz': generators.watts_strogatz_compiled(
+                n = 200, k = 6, rewire_prob = 0.1, seed = 0),
+            'barabasi_albert': generators.barabasi_albert_compiled(
+                n = 200, m = 3, seed = 0),
+            'stochastic_block': generators.stochastic_block_compiled(
+                [100, 100], [[0.1, 0.01], [0.01, 0.1]], seed = 0),
+            'configuration': generators.configuration_compiled(
+                [3] * 200, seed = 0)}
+
+
+    def _check_simple(self, CG):
+        # Rows of CSR are sorted without repeated neighbours and self loops
+        N = len(CG['indptr']) - 1
+        rows = np.repeat(np.arange(N), np.diff(CG['indptr']))
+        key = rows * N + CG['indices']
+        self.assertTrue((np.diff(key) > 0).all())
+        self.assertFalse((rows == CG['indices']).any())
+        # Undirected edges are stored in both directions with equal weights
+        reverse = np.searchsorted(key, CG['indices'] * N + rows)
+        self.assertEqual(key[reverse].tolist(),
+                         (CG['indices'] * N + rows).tolist())
+        self.assertEqual(CG['weight'][reverse].tolist(),
+                         CG['weight'].tolist())
+
+    #================================#
+    # Check nodes, edges and weights #
+    #================================#
+
+    def test_generators_structure(self):
+        print('test_generators_structure')
+
+        print(" -> Check numbers of nodes and edges")
+        for name, CG in self.graphs.items():
+            G = dp.to_networkx(CG)
+            self.assertEqual(G.number_of_nodes(), 200)
+            self.assertEqual(2 * G.number_of_edges(), len(CG['indices']))
+        # Ring lattice has n * k / 2 edges, rewired ones may be merged
+        edges = len(self.graphs['watts_strogatz']['indices']) // 2
+        self.assertLessEqual(edges, 200 * 3)
+        self.assertGreater(edges, 0.95 * 200 * 3)
+        self.assertLessEqual(len(self.graphs['configuration']['indices']),
+                             600)
+
+        print(" -> Check self loops and multiple edges")
+        print('')
+        for name, CG in self.graphs.items():
+            self._check_simple(CG)
+            self.assertTrue((CG['weight'] > 0).all())
+            self.assertTrue((CG['weight'] <= 1).all())
+            self.assertEqual(CG['aware'].sum(), 20)
+
+    #===================#
+    # Check determinism #
+    #===================#
+
+    def test_generators_seed(self):
+        print('test_generators_seed')
+
+        print(" -> Check graphs generated with the same seed")
+        print('')
+        same = {
+            'watts_strogatz': generators.watts_strogatz_compiled(
+                n = 200, k = 6, rewire_prob = 0.1, seed = 0),
+            'barabasi_albert': generators.barabasi_albert_compiled(
+                n = 200, m = 3, seed = 0),
+            'stochastic_block': generators.stochastic_block_compiled(
+                [100, 100], [[0.1, 0.01], [0.01, 0.1]], seed = 0),
+            'configuration': generators.configuration_compiled(
+                [3] * 200, seed = 0)}
+        for name, CG in self.graphs.items():
+            for key in ['indptr', 'indices', 'weight', 'aware']:
+                self.assertEqual(CG[key].tolist(), same[name][key].tolist())
+
+
+    def test_generators_processes(self):
+        print('test_generators_processes')
+
+        print(" -> Check Watts-Strogatz graph generated in processes")
+        with mock.patch.object(generators, '_CHUNK_NODES', 50):
+            serial = generators.watts_strogatz_compiled(
+                n = 200, k = 6, rewire_prob = 0.1, seed = 0, n_jobs = 1)
+            parallel = generators.watts_strogatz_compiled(
+                n = 200, k = 6, rewire_prob = 0.1, seed = 0, n_jobs = 2)
+        for key in ['indptr', 'indices', 'weight', 'aware']:
+            self.assertEqual(serial[key].tolist(), parallel[key].tolist())
+        self._check_simple(parallel)
+
+        print(" -> Check stochastic block graph generated in processes")
+        print('')
+        parallel = generators.stochastic_block_compiled(
+            [100, 100], [[0.1, 0.01], [0.01, 0.1]], seed = 0, n_jobs = 2)
+        for key in ['indptr', 'indices', 'weight', 'aware']:
+            self.assertEqual(parallel[key].tolist(),
+                             self.graphs['stochastic_block'][key].tolist())
+
+    #===============================#
+    # Check Barabasi-Albert degrees #
+    #===============================#
+
+    def test_barabasi_albert_degrees(self):
+        print('test_barabasi_albert_degrees')
+
+        print(" -> Check degrees of nodes")
+        print('')
+        CG = generators.barabasi_albert_compiled(n = 2000, m = 3, seed = 1)
+        degrees = np.diff(CG['indptr'])
+        # Merged multiple edges may give degrees lower than m
+        self.assertGreaterEqual(degrees.min(), 1)
+        self.assertLess(degrees.min(), 3)
+        self.assertLessEqual(degrees.sum(), 2 * 3 * (2000 - 3))
+        self.assertGreater(degrees.mean(), 0.9 * 2 * 3)
+        # Preferential attachment gives hubs
+        self.assertGreater(degrees.max(), 10 * 3)
+
+
+
+# With this line we may run tests in cmd/anaconda prompt
+# as "python test_generators.py"
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import os
+import subprocess
+import sys
+
+class TestImport(unittest.TestCase):
+    """
+    Class for testing import of difpy package.
+
+    Class include methods for testing:
+        * heavy optional packages not imported with difpy
+        * import time of difpy package
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        # package is imported in new interpreter from repository root
+        self.root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def run_python(self, code):
+        return subprocess.run([sys.executable, '-c', code], cwd = self.root,
+                              capture_output = True, text = True,
+                              check = True).stdout
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_import_without_heavy_packages(self):
+        print('test_import_without_heavy_packages')
+        out = self.run_python(
+            "import sys, difpy\n"
+            "print(','.join(m for m in ['matplotlib', 'sklearn', 'xgboost']"
+            " if m in sys.modules))")
+        self.assertEqual(out.strip(), '')
+
+    def test_import_time(self):
+        print('test_import_time')
+        # time of difpy import without time of numpy and networkx import
+        out = self.run_python(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import numpy, networkx\n"
+            "middle = time.perf_counter()\n"
+            "import difpy\n"
+            "print(time.perf_counter() - middle)")
+        self.assertLess(float(out), 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
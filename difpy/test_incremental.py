@@ -0,0 +1,157 @@
+import unittest
+import incremental
+import difpy as dp
+import networkx as nx
+import numpy as np
+
+class TestIncremental(unittest.TestCase):
+    """
+    Class for testing incremental module.
+
+    Class include methods for testing:
+        * nodes affected by changes
+        * incremental scores against scores of all nodes
+          (also on random graphs)
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        np.random.seed(0)
+        # path 0-...-9 and separate path 10-...-14 with certain
+        # information propagation
+        self.G = nx.path_graph(10)
+        nx.add_path(self.G, range(10, 15))
+        nx.set_edge_attributes(self.G, 1.0, 'weight')
+        nx.set_node_attributes(self.G, 'unaware', 'state')
+        nx.set_node_attributes(self.G, 0.5, 'receptiveness')
+        nx.set_node_attributes(self.G, 0.5, 'extraversion')
+        nx.set_node_attributes(self.G, 0.5, 'engagement')
+
+    #======================#
+    # Check affected nodes #
+    #======================#
+
+    def test_affected_nodes(self):
+        print('test_affected_nodes')
+
+        print(" -> Check nodes within n hops")
+        affected = incremental.affected_nodes(self.G, changed_edges = [(0, 1)],
+                                              n = 2)
+        self.assertEqual(affected.tolist(), [0, 1, 2, 3])
+
+        print(" -> Check nodes reaching changes with sweeps in nodes order")
+        # Information passes to higher positions in one step
+        affected = incremental.affected_nodes(self.G, changed_nodes = [4],
+                                              n = 1, in_order = True)
+        self.assertEqual(affected.tolist(), [0, 1, 2, 3, 4, 5])
+        # and to lower positions in the next step
+        affected = incremental.affected_nodes(self.G, changed_nodes = [4],
+                                              n = 2, in_order = True)
+        self.assertEqual(affected.tolist(), [0, 1, 2, 3, 4, 5, 6])
+
+        print(" -> Check removed edge")
+        print('')
+        self.G.remove_edge(8, 9)
+        affected = incremental.affected_nodes(self.G,
+                                              removed_edges = [(8, 9)],
+                                              n = 1, in_order = True)
+        self.assertEqual(affected.tolist(), list(range(10)))
+
+    #==========================#
+    # Check incremental scores #
+    #==========================#
+
+    def _check_scores(self, method, change):
+        np.random.seed(0)
+        if method == 'batched':
+            previous = dp.nodes_score_batched(self.G, n = 1, sequence_len = 2)
+        else:
+            previous = dp.nodes_score_simulation(self.G, n = 1,
+                                                 sequence_len = 2)
+
+        if change == 'removed':
+            self.G.remove_edge(8, 9)
+            changes = {'removed_edges': [(8, 9)]}
+        else:
+            self.G.add_edge(9, 10, weight = 1.0)
+            changes = {'changed_edges': [(9, 10)]}
+
+        np.random.seed(0)
+        scores = incremental.nodes_score_incremental(self.G, previous,
+                                                     n = 1, sequence_len = 2,
+                                                     method = method,
+                                                     **changes)
+        np.random.seed(0)
+        if method == 'batched':
+            full = dp.nodes_score_batched(self.G, n = 1, sequence_len = 2)
+        else:
+            full = dp.nodes_score_simulation(self.G, n = 1, sequence_len = 2)
+        self.assertEqual(scores, full)
+
+
+    def test_nodes_score_incremental_simulation(self):
+        print('test_nodes_score_incremental_simulation')
+
+        print(" -> Check removed edge")
+        self._check_scores('simulation', 'removed')
+        self.setUp()
+
+        print(" -> Check added edge")
+        print('')
+        self._check_scores('simulation', 'added')
+
+
+    def test_nodes_score_incremental_batched(self):
+        print('test_nodes_score_incremental_batched')
+
+        print(" -> Check removed edge")
+        self._check_scores('batched', 'removed')
+        self.setUp()
+
+        print(" -> Check added edge")
+        print('')
+        self._check_scores('batched', 'added')
+
+
+    def test_nodes_score_incremental_random_graphs(self):
+        print('test_nodes_score_incremental_random_graphs')
+
+        print(" -> Check simulation method on graphs with random order")
+        print('')
+        rng = np.random.default_rng(0)
+        for trial in range(20):
+            G = nx.Graph()
+            G.add_nodes_from(range(15))
+            G.add_edges_from(nx.gnm_random_graph(15, 20, seed = trial)
+                             .edges())
+            nx.set_edge_attributes(G, 1.0, 'weight')
+            nx.set_node_attributes(G, 'unaware', 'state')
+            nx.set_node_attributes(G, 0.5, 'engagement')
+            n = int(rng.integers(1, 4))
+            previous = dp.nodes_score_simulation(G, n = n, sequence_len = 1)
+            u, v = rng.choice(15, 2, replace = False).tolist()
+            if G.has_edge(u, v):
+                G.remove_edge(u, v)
+                changes = {'removed_edges': [(u, v)]}
+            else:
+                G.add_edge(u, v, weight = 1.0)
+                changes = {'changed_edges': [(u, v)]}
+            scores = incremental.nodes_score_incremental(
+                G, previous, n = n, sequence_len = 1,
+                method = 'simulation', **changes)
+            self.assertEqual(scores, dp.nodes_score_simulation(
+                G, n = n, sequence_len = 1))
+
+
+
+# With this line we may run tests in cmd/anaconda prompt
+# as "python test_incremental.py"
+if __name__ == '__main__':
+    unittest.main()
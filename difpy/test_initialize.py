@@ -1,6 +1,16 @@
 import unittest
+import copy
 import initialize
 import networkx as nx
+import numpy as np
+import difpy as dp
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 class TestInitialize(unittest.TestCase):
     """
@@ -10,6 +20,11 @@ class TestInitialize(unittest.TestCase):
         * output objects' types
         * range of generated weights
         * range of generated nodes' attributes
+        * scaling and distributions of vectorized attributes
+        * cache of nodes' positions
+        * positions of compiled and large graphs
+        * features added from tables
+        * drawing of graphs
         
     """
     
@@ -155,6 +170,263 @@ class TestInitialize(unittest.TestCase):
         state = len([i for i in state if i in ['unaware', 'aware']]) == len(state)
         self.assertEqual(state, True)
 
+    #=============================#
+    # Check vectorized attributes #
+    #=============================#
+
+    def test_scale_feature(self):
+        print('test_scale_feature')
+
+        print(" -> Check min-max scaling with filled zeros")
+        feature = np.array([[2.0, 5.0], [4.0, 5.0], [3.0, 5.0]])
+        scaled = initialize._scale_feature(feature)
+        self.assertEqual(scaled.dtype, np.float64)
+        self.assertEqual(scaled[:, 0].tolist(), [0.000001, 1.0, 0.5])
+
+        print(" -> Check constant column")
+        self.assertEqual(scaled[:, 1].tolist(), [0.000001] * 3)
+
+        print(" -> Check rounding")
+        print('')
+        scaled = initialize._scale_feature([0.0, 1.0, 3.0])
+        self.assertEqual(scaled.tolist(), [0.000001, 0.333333, 1.0])
+
+
+    def test_set_node_columns(self):
+        print('test_set_node_columns')
+
+        print(" -> Check attributes in nodes order")
+        print('')
+        G = nx.Graph()
+        G.add_nodes_from(['b', 'a', 'c'])
+        initialize._set_node_columns(G, {'x': np.array([1.5, 2.5, 3.5]),
+                                         'state': np.array(['aware',
+                                                            'unaware',
+                                                            'unaware'],
+                                                           dtype = object)})
+        self.assertEqual(G.nodes['a'], {'x': 2.5, 'state': 'unaware'})
+        self.assertEqual(G.nodes['b'], {'x': 1.5, 'state': 'aware'})
+        # Values are python objects, not numpy scalars
+        self.assertEqual(type(G.nodes['c']['x']), float)
+
+
+    def test_graph_init_distributions(self):
+        print('test_graph_init_distributions')
+
+        np.random.seed(0)
+        G, pos = initialize.graph_init(n = 500, k = 6, rewire_prob = 0.1,
+                                       initiation_perc = 0.1,
+                                       show_attr = False,
+                                       draw_graph = False)
+
+        print(" -> Check attributes of all nodes")
+        for attr in ['receptiveness', 'extraversion', 'engagement']:
+            values = np.array([d[attr] for v, d in G.nodes(data = True)])
+            self.assertEqual(len(values), 500)
+            self.assertEqual(type(G.nodes[0][attr]), float)
+            self.assertEqual(values.min(), 0.000001)
+            self.assertEqual(values.max(), 1.0)
+
+        print(" -> Check share of aware nodes")
+        states = [d['state'] for v, d in G.nodes(data = True)]
+        self.assertEqual(states.count('aware'), 50)
+
+        print(" -> Check shapes of scaled distributions")
+        print('')
+        weights = np.array([w for u, v, w in G.edges.data('weight')])
+        self.assertEqual(len(weights), G.number_of_edges())
+        self.assertEqual(weights.max(), 1.0)
+        # Exponential distribution is skewed, normal one is symmetric
+        self.assertLess(np.median(weights), 0.3)
+        receptiveness = np.array([d['receptiveness']
+                                  for v, d in G.nodes(data = True)])
+        self.assertLess(abs(np.median(receptiveness) - 0.5), 0.1)
+        engagement = np.array([d['engagement']
+                               for v, d in G.nodes(data = True)])
+        self.assertLess(np.median(engagement), 0.3)
+
+    #==================================#
+    # Check features added from tables #
+    #==================================#
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_add_features_dataframe(self):
+        print('test_add_features_dataframe')
+
+        print(" -> Check rows matched by index of DataFrame")
+        G = nx.path_graph(4)
+        table = pd.DataFrame({'age': [30.0, 10.0, 20.0, 40.0],
+                              'group': ['c', 'a', 'b', 'd']},
+                             index = [2, 0, 1, 3])
+        initialize.add_features(G, table, scaling = False)
+        self.assertEqual([G.nodes[v]['age'] for v in G],
+                         [10.0, 20.0, 30.0, 40.0])
+        self.assertEqual([G.nodes[v]['group'] for v in G],
+                         ['a', 'b', 'c', 'd'])
+
+        print(" -> Check missing rows")
+        print('')
+        G = nx.path_graph(4)
+        table = pd.DataFrame({'age': [3, 1]}, index = [3, 1])
+        initialize.add_features(G, table, scaling = False)
+        self.assertTrue(np.isnan(G.nodes[0]['age']))
+        self.assertEqual(G.nodes[1]['age'], 1.0)
+        self.assertTrue(np.isnan(G.nodes[2]['age']))
+        self.assertEqual(G.nodes[3]['age'], 3.0)
+
+
+    def test_add_features_compiled(self):
+        print('test_add_features_compiled')
+
+        print(" -> Check typed arrays in compiled graph")
+        G = nx.path_graph(3)
+        nx.set_edge_attributes(G, 0.5, 'weight')
+        nx.set_node_attributes(G, 'unaware', 'state')
+        CG = dp.compile_graph(G)
+        weight, aware = CG['weight'].copy(), CG['aware'].copy()
+        table = {'id': np.array([2, 0, 1]),
+                 'age': np.array([3, 1, 2]),
+                 'weights': np.array([0.1, 0.2, 0.3]),
+                 'state': np.array(['aware', 'aware', 'aware'])}
+        initialize.add_features(CG, table, id_column = 'id',
+                                scaling = False)
+        self.assertEqual(CG['node_attrs']['age'].tolist(), [1, 2, 3])
+        self.assertEqual(CG['node_attrs']['age'].dtype, np.int64)
+
+        print(" -> Check columns named as special features")
+        print('')
+        self.assertEqual(CG['node_attrs']['weights'].tolist(),
+                         [0.2, 0.3, 0.1])
+        self.assertEqual(CG['node_attrs']['state'].tolist(),
+                         ['aware'] * 3)
+        self.assertEqual(CG['weight'].tolist(), weight.tolist())
+        self.assertEqual(CG['aware'].tolist(), aware.tolist())
+
+    #=====================#
+    # Check graph drawing #
+    #=====================#
+
+    def test_drawing_arrays(self):
+        print('test_drawing_arrays')
+
+        print(" -> Check arrays of graph with tuple labels")
+        print('')
+        G = nx.grid_2d_graph(3, 3)
+        nx.set_node_attributes(G, 'unaware', 'state')
+        G.nodes[(1, 1)]['state'] = 'aware'
+        pos = {v: np.array(v, dtype = float) for v in G}
+        nodes, xy, aware, src, dst = initialize._drawing_arrays(G, pos)
+        self.assertEqual(nodes, list(G.nodes()))
+        self.assertEqual(xy[nodes.index((2, 1))].tolist(), [2.0, 1.0])
+        self.assertEqual(aware.sum(), 1)
+        self.assertEqual(len(src), G.number_of_edges())
+
+
+    def test_draw_graph(self):
+        print('test_draw_graph')
+
+        print(" -> Check nodes, edges and labels")
+        fig, ax = plt.subplots()
+        initialize.draw_graph(self.G, ax = ax)
+        self.assertEqual(len(ax.collections), 3)
+        self.assertEqual(len(ax.collections[0].get_segments()),
+                         self.G.number_of_edges())
+        self.assertEqual(len(ax.texts), 20)
+        plt.close(fig)
+
+        print(" -> Check density of aware nodes")
+        fig, ax = plt.subplots()
+        initialize.draw_graph(dp.compile_graph(self.G), pos = self.pos,
+                              density = True, ax = ax)
+        self.assertEqual(len(ax.images), 1)
+        plt.close(fig)
+
+        print(" -> Check graph with tuple labels")
+        print('')
+        G = nx.grid_2d_graph(3, 3)
+        nx.set_node_attributes(G, 'unaware', 'state')
+        for density in [False, True]:
+            fig, ax = plt.subplots()
+            initialize.draw_graph(G, density = density, ax = ax)
+            self.assertIn('(1, 1)', [t.get_text() for t in ax.texts])
+            plt.close(fig)
+
+    #============================#
+    # Check cached nodes layouts #
+    #============================#
+
+    def test_graph_layout_cache(self):
+        print('test_graph_layout_cache')
+
+        print(" -> Check positions computed once")
+        pos = initialize.graph_layout(self.G, 'random', seed = 0)
+        self.assertIs(initialize.graph_layout(self.G, 'random'), pos)
+
+        print(" -> Check positions are not stored in the graph")
+        self.assertNotIn('pos', self.G.graph)
+        self.assertIsNot(initialize.graph_layout(copy.deepcopy(self.G),
+                                                 'random'), pos)
+
+        print(" -> Check positions after adding node")
+        print('')
+        self.G.add_node(100)
+        pos = initialize.graph_layout(self.G, 'random')
+        self.assertIn(100, pos)
+        self.assertEqual(len(pos), 21)
+
+
+    def test_graph_layout_compiled(self):
+        print('test_graph_layout_compiled')
+
+        print(" -> Check positions cached in compiled graph")
+        CG = dp.compile_graph(self.G)
+        fig, ax = plt.subplots()
+        initialize.draw_graph(CG, ax = ax)
+        plt.close(fig)
+        layout, pos = CG['pos']
+        self.assertEqual(layout, 'auto')
+        self.assertEqual(pos.shape, (20, 2))
+
+        print(" -> Check second drawing reuses cached positions")
+        fig, ax = plt.subplots()
+        initialize.draw_graph(CG, ax = ax)
+        plt.close(fig)
+        self.assertIs(CG['pos'][1], pos)
+        self.assertIs(initialize.graph_layout(CG), pos)
+
+        print(" -> Check spectral positions of large graph")
+        print('')
+        CG = dp.watts_strogatz_compiled(n = 2000, k = 4, seed = 0)
+        pos = initialize.graph_layout(CG, seed = 0)
+        self.assertEqual(pos.shape, (2000, 2))
+        self.assertTrue(np.isfinite(pos).all())
+        self.assertLessEqual(np.abs(pos).max(), 1.0)
+        self.assertGreater(np.unique(pos.round(6), axis = 0).shape[0], 1000)
+        self.assertIsInstance(initialize.graph_layout(dp.to_networkx(CG)), 
+                              dict)
+
+    #===============================#
+    # Check approximate graph_stats #
+    #===============================#
+    
+    def test_graph_stats_approximate(self):
+        print('test_graph_stats_approximate')
+
+        print(" -> Check estimates are within error of exact values")
+        print('')
+        exact = initialize.graph_stats(self.G, draw_degree = False, 
+                                       show_attr = False, 
+                                       draw_graph = False)
+        approx = initialize.graph_stats(self.G, draw_degree = False, 
+                                        show_attr = False, 
+                                        draw_graph = False, 
+                                        approximate = True, 
+                                        confidence = 0.999999, seed = 0)
+        self.assertEqual(approx['edges'], exact['edges'])
+        for k in ['average clustering coefficient', 'transitivity']:
+            self.assertLessEqual(abs(approx[k] - exact[k]), 
+                                 approx[k + ' error'] + 0.0001)
+
     #============================#
     # Check -||- something - cdn #
     #============================#
@@ -0,0 +1,78 @@
+import unittest
+import json
+import pickle
+import instrument
+import difpy as dp
+import networkx as nx
+
+class TestInstrument(unittest.TestCase):
+    """
+    Class for testing instrument module.
+
+    Class include methods for testing:
+        * counters of simulation steps
+        * recorded bytes of graph lists
+        * records of replicas and JSON export
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.G = nx.path_graph(4)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 1
+        for v in self.G.nodes():
+            self.G.nodes[v]['state'] = 'aware' if v == 0 else 'unaware'
+            self.G.nodes[v]['engagement'] = 0.5
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_step_counters(self):
+        print('test_step_counters')
+        stats = instrument.Instrumentation()
+        dp.simulation(self.G, n = 2, engagement_enforcement = 1,
+                      trajectory = dp.TrajectoryStore(),
+                      instrumentation = stats)
+        steps = stats.replicas[0]['steps']
+        self.assertEqual(len(steps), 2)
+        # nodes are visited in order, so all of them are informed in
+        # the first step, and in the second step all edges are examined
+        self.assertEqual(steps[0]['counters']['successes'], 3)
+        self.assertEqual(steps[1]['counters']['edges_examined'], 6)
+        self.assertEqual(steps[1]['counters']['transmission_attempts'], 0)
+        self.assertEqual(steps[1]['counters']['bytes_recorded'], 1 + 32)
+        self.assertIn('rng', steps[0]['timers'])
+
+    def test_bytes_recorded_graph_list(self):
+        print('test_bytes_recorded_graph_list')
+        stats = instrument.Instrumentation()
+        graph_list = dp.simulation(self.G, n = 2, engagement_enforcement = 1,
+                                   instrumentation = stats)[0]
+        steps = stats.replicas[0]['steps']
+        # size of pickled records of nodes' attributes
+        self.assertGreater(stats.replicas[0]['counters']['bytes_recorded'],
+                           0)
+        self.assertEqual(steps[1]['counters']['bytes_recorded'],
+                         len(pickle.dumps(graph_list[2],
+                                          protocol = pickle.HIGHEST_PROTOCOL)))
+
+    def test_replicas_json(self):
+        print('test_replicas_json')
+        stats = instrument.Instrumentation()
+        dp.simulation_sequence(self.G, n = 1, sequence_len = 3,
+                               instrumentation = stats)
+        self.assertEqual(len(stats.replicas), 3)
+        self.assertIn('deepcopy', stats.replicas[0]['timers'])
+        totals = json.loads(stats.to_json())['totals']
+        self.assertEqual(totals['counters']['successes'], 9)
+
+if __name__ == '__main__':
+    unittest.main()
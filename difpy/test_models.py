@@ -0,0 +1,56 @@
+import unittest
+import models
+import networkx as nx
+import numpy as np
+
+class TestModels(unittest.TestCase):
+    """
+    Class for testing models module.
+
+    Class include methods for testing:
+        * SIR model with certain recovery
+        * linear threshold model with given thresholds
+        * declaration errors
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.G = nx.path_graph(5)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 1
+        for v in self.G.nodes():
+            self.G.nodes[v]['state'] = 'aware' if v == 0 else 'unaware'
+            self.G.nodes[v]['threshold'] = 1 if v < 3 else 2
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_sir(self):
+        print('test_sir')
+        S, history = models.model_simulation(self.G, models.sir_model(1),
+                                             n = 3, simulations = 2)
+        # infection moves along the path, infected nodes recover
+        self.assertTrue(np.array_equal(S[0], [2, 2, 2, 1, 0]))
+        self.assertTrue(np.array_equal(history[:, 0, 1], [1, 1, 1, 1]))
+
+    def test_linear_threshold(self):
+        print('test_linear_threshold')
+        model = models.linear_threshold_model('threshold')
+        S, history = models.model_simulation(self.G, model, n = 4)
+        self.assertTrue(np.array_equal(S[0], [1, 1, 1, 0, 0]))
+
+    def test_declaration(self):
+        print('test_declaration')
+        with self.assertRaises(ValueError):
+            models.si_model().add_transition('infected', 'removed')
+
+if __name__ == '__main__':
+    unittest.main()
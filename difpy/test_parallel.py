@@ -0,0 +1,95 @@
+import unittest
+import parallel
+import difpy as dp
+import networkx as nx
+import numpy as np
+
+class TestParallel(unittest.TestCase):
+    """
+    Class for testing parallel module.
+
+    Class include methods for testing:
+        * chunks of nodes
+        * scores computed in a pool of processes
+        * stopping at simulation budget
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        # star with leaves in a path, information propagation is certain
+        self.G = nx.star_graph(5)
+        self.G.add_edges_from([(1, 2), (2, 3)])
+        nx.set_edge_attributes(self.G, 1.0, 'weight')
+        nx.set_node_attributes(self.G, 'unaware', 'state')
+        nx.set_node_attributes(self.G, 0.5, 'receptiveness')
+        nx.set_node_attributes(self.G, 0.5, 'extraversion')
+        nx.set_node_attributes(self.G, 0.5, 'engagement')
+
+    #====================#
+    # Check chunks sizes #
+    #====================#
+
+    def test_next_chunk(self):
+        print('test_next_chunk')
+
+        print(" -> Check chunks cover all nodes")
+        cumulative_cost = np.concatenate([[0.0], np.cumsum(np.ones(10))])
+        first, chunks = 0, []
+        while first < 10:
+            last = parallel._next_chunk(first, cumulative_cost, 2, 1.0)
+            chunks.append(last - first)
+            first = last
+        self.assertEqual(sum(chunks), 10)
+        self.assertGreater(chunks[0], 1)
+
+        print(" -> Check chunks limited by number of nodes")
+        print('')
+        self.assertEqual(parallel._next_chunk(0, cumulative_cost, 2, 1.0,
+                                              max_nodes = 1), 1)
+
+    #====================#
+    # Check nodes scores #
+    #====================#
+
+    def test_nodes_score_parallel(self):
+        print('test_nodes_score_parallel')
+
+        print(" -> Check scores against serial computation")
+        print('')
+        serial = dp.nodes_score_simulation(self.G.copy(), n = 2,
+                                           sequence_len = 3)
+        scores = parallel.nodes_score_parallel(self.G, n_jobs = 2, n = 2,
+                                               sequence_len = 3)
+        self.assertEqual(len(scores), len(serial))
+        self.assertEqual(scores, serial)
+        # Graph of the caller is not modified
+        self.assertEqual(set(nx.get_node_attributes(self.G, 'state')
+                             .values()), {'unaware'})
+
+
+    def test_nodes_score_parallel_budget(self):
+        print('test_nodes_score_parallel_budget')
+
+        print(" -> Check number of simulations")
+        print('')
+        infos = []
+        scores = parallel.nodes_score_parallel(self.G, n_jobs = 2, n = 2,
+                                               sequence_len = 4,
+                                               simulation_budget = 10,
+                                               callback = infos.append)
+        self.assertEqual(len(scores), 2)
+        self.assertLessEqual(infos[-1]['evaluations'], 10)
+
+
+
+# With this line we may run tests in cmd/anaconda prompt
+# as "python test_parallel.py"
+if __name__ == '__main__':
+    unittest.main()
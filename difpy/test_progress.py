@@ -0,0 +1,82 @@
+import unittest
+import time
+import progress
+import difpy as dp
+import networkx as nx
+import numpy as np
+
+class TestProgress(unittest.TestCase):
+    """
+    Class for testing progress module.
+
+    Class include methods for testing:
+        * progress information and printing callback
+        * budget checking with cost of iterations
+        * stopping of functions at simulation budget
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.G = nx.path_graph(6)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 0.5
+        nx.set_node_attributes(self.G, 'unaware', 'state')
+        nx.set_node_attributes(self.G, 0.5, 'engagement')
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_progress_info(self):
+        print('test_progress_info')
+        info = progress.progress_info(3, 1.5, 30, time.time() - 2)
+        self.assertEqual(info['iteration'], 3)
+        self.assertEqual(info['evaluations'], 30)
+        self.assertAlmostEqual(info['evaluations_per_second'], 15, places = 0)
+        progress.print_progress(info)
+
+    def test_budget_exhausted(self):
+        print('test_budget_exhausted')
+        start = time.time()
+        self.assertFalse(progress.budget_exhausted(start, 0))
+        self.assertFalse(progress.budget_exhausted(start, 10, None, 20,
+                                                   cost = 10))
+        self.assertTrue(progress.budget_exhausted(start, 11, None, 20,
+                                                  cost = 10))
+        self.assertTrue(progress.budget_exhausted(start - 5, 0, 1))
+
+    def test_simulation_budget(self):
+        print('test_simulation_budget')
+        infos = []
+        dp.optimize_rs(self.G, 1, 10, sequence_len = 4,
+                       simulation_budget = 10, callback = infos.append)
+        self.assertEqual(infos[-1]['evaluations'], 8)
+
+        scores = dp.nodes_score_simulation(self.G, sequence_len = 4,
+                                           simulation_budget = 10)
+        self.assertEqual(len(scores), 2)
+
+        scores = dp.nodes_score_batched(self.G, sequence_len = 4,
+                                        simulation_budget = 10)
+        self.assertEqual(len(scores), 2)
+
+        with self.assertRaises(ValueError):
+            dp.feature_importance(self.G, np.zeros((6, 1)), sequence_len = 4,
+                                  simulation_budget = 5)
+
+        with self.assertRaises(ValueError):
+            dp.optimize_rs(self.G, number_of_nodes = 1, number_of_iter = 5,
+                           sequence_len = 5, simulation_budget = 3)
+        with self.assertRaises(ValueError):
+            dp.optimize_rs(self.G, number_of_nodes = 1, number_of_iter = 5,
+                           sequence_len = 5, time_budget = 0)
+
+if __name__ == '__main__':
+    unittest.main()
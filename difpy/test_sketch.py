@@ -0,0 +1,130 @@
+import unittest
+import sketch
+import engine
+import difpy as dp
+import networkx as nx
+import numpy as np
+
+class TestSketch(unittest.TestCase):
+    """
+    Class for testing sketch module.
+
+    Class include methods for testing:
+        * bottom-k selection of ranks
+        * accuracy of estimated scores
+        * stopping at simulation budget
+        * unsupported simulation parameters
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        np.random.seed(0)
+        self.G = nx.gnp_random_graph(40, 0.1, seed = 1)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 0.3
+        nx.set_node_attributes(self.G, 'unaware', 'state')
+
+    #==========================#
+    # Check bottom-k selection #
+    #==========================#
+
+    def test_bottom_k(self):
+        print('test_bottom_k')
+
+        print(" -> Check k smallest distinct values of groups")
+        groups = np.array([0, 0, 0, 0, 1, 1, 2])
+        values = np.array([0.5, 0.1, 0.5, 0.3, np.inf, 0.7, 0.2])
+        result = sketch._bottom_k(groups, values, 4, 2)
+        self.assertEqual(result[0].tolist(), [0.1, 0.3])
+        self.assertEqual(result[1].tolist(), [0.7, np.inf])
+        self.assertEqual(result[2].tolist(), [0.2, np.inf])
+        self.assertEqual(result[3].tolist(), [np.inf, np.inf])
+
+        print(" -> Check repeated values")
+        print('')
+        result = sketch._bottom_k(np.zeros(3, dtype = int),
+                                  np.array([0.4, 0.4, 0.4]), 1, 2)
+        self.assertEqual(result[0].tolist(), [0.4, np.inf])
+        self.assertEqual(result.dtype, np.float64)
+
+    #========================#
+    # Check estimated scores #
+    #========================#
+
+    def test_nodes_score_sketch_deterministic(self):
+        print('test_nodes_score_sketch_deterministic')
+
+        print(" -> Check scores on graph with certain propagation")
+        print('')
+        G = nx.path_graph(5)
+        nx.set_edge_attributes(G, 1.0, 'weight')
+        nx.set_node_attributes(G, 'unaware', 'state')
+        scores = sketch.nodes_score_sketch(G, n = 1, sequence_len = 4)
+        self.assertEqual(scores, [1.0, 2.0, 2.0, 2.0, 1.0])
+
+
+    def test_nodes_score_sketch_accuracy(self):
+        print('test_nodes_score_sketch_accuracy')
+
+        print(" -> Check estimates against batched scores")
+        print('')
+        estimated = np.array(sketch.nodes_score_sketch(self.G, n = 3,
+                                                       sequence_len = 200,
+                                                       sketch_size = 64))
+        batched = np.array(engine.nodes_score_batched(self.G, n = 3,
+                                                      sequence_len = 400))
+        error = np.abs(estimated - batched).mean() / batched.mean()
+        self.assertLess(error, 0.2)
+        self.assertGreater(np.corrcoef(estimated, batched)[0, 1], 0.9)
+
+    #=======================#
+    # Check budget stopping #
+    #=======================#
+
+    def test_nodes_score_sketch_budget(self):
+        print('test_nodes_score_sketch_budget')
+
+        print(" -> Check number of sampled worlds")
+        infos = []
+        scores = sketch.nodes_score_sketch(self.G, n = 2, sequence_len = 10,
+                                           simulation_budget = 3,
+                                           callback = infos.append)
+        self.assertEqual(len(infos), 3)
+        self.assertEqual(len(scores), 40)
+
+        print(" -> Check budget without any world")
+        print('')
+        scores = sketch.nodes_score_sketch(self.G, n = 2, sequence_len = 10,
+                                           simulation_budget = 0)
+        self.assertEqual(scores, [])
+
+    #==============================#
+    # Check unsupported parameters #
+    #==============================#
+
+    def test_nodes_score_sketch_unsupported(self):
+        print('test_nodes_score_sketch_unsupported')
+
+        print(" -> Check oblivion and engagement enforcement")
+        print('')
+        with self.assertRaises(ValueError):
+            dp.nodes_score_simulation(self.G, n = 2, sequence_len = 2,
+                                      oblivion = True, method = 'sketch')
+        with self.assertRaises(ValueError):
+            dp.nodes_score_simulation(self.G, n = 2, sequence_len = 2,
+                                      engagement_enforcement = 1.01,
+                                      method = 'sketch')
+
+
+
+# With this line we may run tests in cmd/anaconda prompt
+# as "python test_sketch.py"
+if __name__ == '__main__':
+    unittest.main()
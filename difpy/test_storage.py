@@ -0,0 +1,78 @@
+import unittest
+import os
+import tempfile
+import compiled
+import storage
+import ingest
+import networkx as nx
+import numpy as np
+
+class TestStorage(unittest.TestCase):
+    """
+    Class for testing storage module.
+
+    Class include methods for testing:
+        * saved and loaded graph equality
+        * memory mapping of loaded arrays
+        * graph ingested from chunks of edge list
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.G = nx.path_graph(5)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 0.5
+        for v in self.G.nodes():
+            self.G.nodes[v]['state'] = 'aware' if v == 0 else 'unaware'
+            self.G.nodes[v]['engagement'] = v / 10
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'graph')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_round_trip(self):
+        print('test_round_trip')
+        storage.save_graph(self.G, self.path)
+        CG = storage.load_graph(self.path)
+        CG_0 = compiled.compile_graph(self.G)
+        for k in ['nodes', 'indptr', 'indices', 'weight', 'aware']:
+            self.assertTrue(np.array_equal(CG[k], CG_0[k]))
+        self.assertTrue(np.array_equal(CG['node_attrs']['engagement'],
+                                       CG_0['node_attrs']['engagement']))
+
+    def test_arrays_mapped(self):
+        print('test_arrays_mapped')
+        storage.save_graph(self.G, self.path)
+        CG = storage.load_graph(self.path)
+        self.assertIsInstance(CG['indices'], np.memmap)
+        self.assertFalse(CG['indices'].flags.writeable)
+        # existing graph is not replaced without overwrite
+        with self.assertRaises(ValueError):
+            storage.save_graph(self.G, self.path)
+
+    def test_ingest_edges(self):
+        print('test_ingest_edges')
+        # duplicated and reversed edges are merged, self loop is dropped
+        chunks = [{'source': [0, 1, 2], 'target': [1, 2, 3]},
+                  {'source': [3, 2, 4], 'target': [4, 1, 4]}]
+        CG = ingest.ingest_edges(chunks, self.path, bucket_rows = 2)
+        self.assertTrue(np.array_equal(CG['nodes'], np.arange(5)))
+        self.assertTrue(np.array_equal(CG['indices'], 
+                                       [1, 0, 2, 1, 3, 2, 4, 3]))
+        self.assertTrue(np.array_equal(CG['weight'], 
+                                       [1, 1, 2, 2, 1, 1, 1, 1]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import json
+import streaming
+import numpy as np
+
+class TestStreaming(unittest.TestCase):
+    """
+    Class for testing streaming module.
+
+    Class include methods for testing:
+        * merged statistics equal statistics of all values
+        * accuracy of quantiles
+        * export to and restore from dictionary
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        rng = np.random.RandomState(0)
+        self.values = rng.exponential(5, size = 10000) - 1
+        self.edges = np.linspace(0, 20, 11)
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_merge(self):
+        print('test_merge')
+        parts = [streaming.StreamStats(self.edges) for i in range(3)]
+        for part, values in zip(parts, np.array_split(self.values, 3)):
+            for chunk in np.array_split(values, 7):
+                part.update(chunk)
+        merged = parts[0].merge(parts[1]).merge(parts[2])
+        whole = streaming.StreamStats(self.edges)
+        whole.update(self.values)
+        self.assertAlmostEqual(merged.moments.mean, self.values.mean())
+        self.assertAlmostEqual(merged.moments.variance(),
+                               self.values.var(ddof = 1))
+        self.assertTrue(np.array_equal(merged.histogram.counts,
+                                       whole.histogram.counts))
+        self.assertEqual(merged.histogram.underflow,
+                         (self.values < 0).sum())
+        self.assertEqual(merged.sketch.to_dict(), whole.sketch.to_dict())
+
+    def test_quantiles(self):
+        print('test_quantiles')
+        sketch = streaming.QuantileSketch(0.01)
+        sketch.update(self.values)
+        for q in [0.01, 0.5, 0.9, 0.99]:
+            true = np.quantile(self.values, q, method = 'lower')
+            self.assertLessEqual(abs(sketch.quantile(q) - true),
+                                 0.01 * abs(true) + 1e-9)
+
+    def test_dict(self):
+        print('test_dict')
+        stats = streaming.StreamStats(self.edges)
+        stats.update(self.values)
+        d = json.loads(json.dumps(stats.to_dict()))
+        restored = streaming.StreamStats.from_dict(d)
+        self.assertEqual(restored.summary(), stats.summary())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import tempfile
+import temporal
+import networkx as nx
+import numpy as np
+
+class TestTemporal(unittest.TestCase):
+    """
+    Class for testing temporal module.
+
+    Class include methods for testing:
+        * diffusion only over contacts active in windows
+        * increment of aware nodes per window
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        self.G = nx.empty_graph(4)
+        for v in self.G.nodes():
+            self.G.nodes[v]['state'] = 'aware' if v == 0 else 'unaware'
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'stream')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_time_order(self):
+        print('test_time_order')
+        # contact 2-3 happens before 1-2, so information stops at node 2
+        temporal.save_edge_stream(self.path, src = [1, 0, 2],
+                                  dst = [2, 1, 3], time = [2, 0, 1],
+                                  weight = [1, 1, 1])
+        S, inc = temporal.temporal_simulation(self.G, self.path, window = 1)
+        self.assertTrue(np.array_equal(S[0], [True, True, True, False]))
+        self.assertTrue(np.allclose(inc, 2 / 3))
+
+    def test_directed(self):
+        print('test_directed')
+        stream = temporal.save_edge_stream(self.path, src = [1], dst = [0],
+                                           time = [0])
+        S, inc = temporal.temporal_simulation(self.G, stream,
+                                              directed = True,
+                                              S = np.eye(2, 4, dtype = bool))
+        self.assertTrue(np.array_equal(S, [[True, False, False, False],
+                                           [True, True, False, False]]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import tempfile
+import trajectory
+import numpy as np
+
+class TestTrajectory(unittest.TestCase):
+    """
+    Class for testing trajectory module.
+
+    Class include methods for testing:
+        * random access to buffered and spilled steps
+        * reopening of saved trajectory
+
+    """
+
+    #==========================#
+    # Create objects for tests #
+    #==========================#
+
+    # This method prepare objects for all particular tests
+    def setUp(self):
+        print('')
+        print('setUp')
+        # 10 steps, in step i nodes 0..i are aware
+        self.states = np.tri(10, 13, dtype = bool)
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    #=======#
+    # Tests #
+    #=======#
+
+    def test_random_access(self):
+        print('test_random_access')
+        # budget of 3 packed steps causes spills
+        store = trajectory.TrajectoryStore(memory_budget = 6)
+        for i, state in enumerate(self.states):
+            store.append(state, engagement = np.full(13, i / 10))
+        self.assertEqual(len(store), 10)
+        self.assertGreater(len(store.segments), 1)
+        for step in [0, 4, 9, -1]:
+            self.assertTrue(np.array_equal(store[step], self.states[step]))
+        self.assertTrue(np.allclose(store.get(4, 'engagement'), 0.4))
+        self.assertTrue(np.array_equal(store.states(), self.states))
+
+    def test_reopen(self):
+        print('test_reopen')
+        store = trajectory.TrajectoryStore(self.tmp.name)
+        for state in self.states:
+            store.append(state)
+        store.close()
+        store = trajectory.TrajectoryStore(self.tmp.name)
+        self.assertEqual(len(store), 10)
+        self.assertTrue(np.array_equal(store[7], self.states[7]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+"""
+Created on Sun Oct 18 23:34:15 2026
+
+
+    Module enables recording of long simulations in Difpy package.
+
+    Trajectory store keeps nodes' states (and optionally engagement) of
+    each simulation step. Steps are buffered in memory, and when buffer
+    exceeds memory budget they are spilled to disk as a segment, with
+    one .npy file for each recorded array. States are packed to bits
+    (np.packbits), so segment of states takes N / 8 bytes per step.
+    Segments are opened with np.load(mmap_mode = 'r'), so any step is
+    read without loading the whole trajectory.
+
+
+    Objects
+    ----------
+    TrajectoryStore : class
+        A class records steps of simulation with bounded memory.
+
+
+"""
+
+import numpy as np
+import json
+import os
+import shutil
+import tempfile
+import weakref
+
+
+#=============================================================================#
+# TrajectoryStore class #
+#=======================#
+
+class TrajectoryStore:
+
+    """ Record of nodes' states in steps of simulation.
+
+    Store is passed to simulation function as trajectory argument, or
+    filled with append method. Step i is read with store[i] (states)
+    or store.get(i, 'engagement').
+
+
+    Parameters
+    ----------
+
+    path : string, optional
+        Directory of segments. If it contains saved trajectory, new steps
+        are appended to it. If None, segments are written to temporary
+        directory removed with the store.
+
+    memory_budget : integer, optional
+        Maximal size of buffered steps in bytes. Buffer is spilled
+        to disk after it is exceeded.
+
+    """
+
+    def __init__(self, path = None, memory_budget = 256 * 2**20):
+
+        self.memory_budget = memory_budget
+        self.n_nodes = None
+        self.names = None
+        self.segments = [] # numbers of steps in segments
+        self._buffer = {}
+        self._buffer_bytes = 0
+        self._mapped = {}
+
+        if path is None:
+            path = tempfile.mkdtemp(prefix = 'difpy-trajectory-')
+            weakref.finalize(self, shutil.rmtree, path, True)
+        os.makedirs(path, exist_ok = True)
+        self.path = path
+
+        # Continue saved trajectory
+        meta_path = os.path.join(path, 'meta.json')
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            self.n_nodes = meta['nodes']
+            self.names = meta['names']
+            self.segments = meta['segments']
+            self._buffer = {name: [] for name in self.names}
+
+
+    def __len__(self):
+
+        return sum(self.segments) + self._buffered_steps()
+
+
+    def __getitem__(self, step):
+
+        return self.get(step, 'state')
+
+
+    def _buffered_steps(self):
+
+        return len(self._buffer['state']) if self._buffer else 0
+
+
+    def _file(self, segment, name):
+
+        return os.path.join(self.path, 'segment_' + str(segment).zfill(6)
+                            + '_' + name + '.npy')
+
+
+    def append(self, state, engagement = None):
+
+        """ Record one step.
+
+
+        Parameters
+        ----------
+
+        state : ndarray
+            Bool ndarray with True for aware nodes.
+
+        engagement : ndarray, optional
+            Ndarray with engagement of nodes. It has to be given in all
+            steps or in none.
+
+        """
+
+        state = np.asarray(state, dtype = bool)
+        arrays = {'state': np.packbits(state)}
+        if engagement is not None:
+            arrays['engagement'] = np.asarray(engagement)
+
+        if self.names is None:
+            self.n_nodes = len(state)
+            self.names = list(arrays.keys())
+            self._buffer = {name: [] for name in self.names}
+        if len(state) != self.n_nodes or sorted(arrays) != sorted(self.names):
+            raise ValueError("Step has different nodes or arrays than "
+                             "previous steps.")
+
+        for name, array in arrays.items():
+            self._buffer[name].append(array)
+            self._buffer_bytes += array.nbytes
+
+        if self._buffer_bytes > self.memory_budget:
+            self.spill()
+
+
+    def spill(self):
+
+        """ Write buffered steps to disk as a new segment. """
+
+        if self._buffered_steps() == 0:
+            return
+
+        segment = len(self.segments)
+        steps = self._buffered_steps()
+        for name in self.names:
+            np.save(self._file(segment, name), np.stack(self._buffer[name]))
+            self._buffer[name] = []
+        self.segments.append(steps)
+        self._buffer_bytes = 0
+        self.flush()
+
+
+    def flush(self):
+
+        """ Save description of segments, so store may be opened
+        again with the same path. Buffered steps are not written.
+
+        """
+
+        meta = {'format': 'difpy-trajectory',
+                'version': 1,
+                'nodes': self.n_nodes,
+                'names': self.names,
+                'segments': self.segments}
+        with open(os.path.join(self.path, 'meta.json'), 'w') as f:
+            json.dump(meta, f, indent = 2)
+
+
+    def close(self):
+
+        """ Write all buffered steps to disk. """
+
+        self.spill()
+        self.flush()
+
+
+    def get(self, step, name = 'state'):
+
+        """ Return array recorded in step.
+
+
+        Parameters
+        ----------
+
+        step : integer
+            Number of step, negative numbers count from the end.
+
+        name : string, optional
+            Levels: "state", "engagement"
+
+
+        Returns
+        -------
+        array : ndarray
+            Bool ndarray with states or ndarray with engagement.
+
+        """
+
+        if step < 0:
+            step += len(self)
+        if step < 0 or step >= len(self):
+            raise IndexError("Step " + str(step) + " is not recorded.")
+
+        # Find segment with the step
+        ends = np.cumsum(self.segments)
+        segment = int(np.searchsorted(ends, step, side = 'right'))
+        if segment < len(self.segments):
+            key = (segment, name)
+            if key not in self._mapped:
+                self._mapped[key] = np.load(self._file(segment, name),
+                                            mmap_mode = 'r')
+            first = ends[segment] - self.segments[segment]
+            array = self._mapped[key][step - first]
+        else:
+            array = self._buffer[name][step - sum(self.segments)]
+
+        if name == 'state':
+            return np.unpackbits(array, count = self.n_nodes).astype(bool)
+        return np.asarray(array)
+
+
+    def states(self, start = 0, stop = None):
+
+        """ Return bool ndarray in shape (<number of steps>, <number
+        of nodes>) with states of steps from start to stop - 1.
+
+        """
+
+        stop = len(self) if stop is None else stop
+        return np.array([self.get(step) for step in range(start, stop)],
+                        dtype = bool).reshape(-1, self.n_nodes or 0)